@@ -14,12 +14,28 @@ Author: AI Engineer 2 (Security & Knowledge Specialist)
 Date: February 2026
 """
 
+import functools
+import hashlib
 import json
+import os
+import re
+import time
 import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from heapq import nlargest
+from operator import itemgetter
+from string import Template
+from types import MappingProxyType
+from typing import (
+    List, Dict, Any, Callable, Iterable, Iterator, Mapping, NamedTuple,
+    Optional, Tuple, Union,
+)
 from pathlib import Path
 
+import numpy as np
+
 
 # =============================================================================
 # SHARED CONSTANTS — imported by rag_query.py for zero-drift alignment
@@ -27,10 +43,22 @@ from pathlib import Path
 # These values are the single source of truth for risk weights, SLA hours,
 # and department metadata across the entire AI middleware system.
 # data_generator.py, policy_generator.py, and rag_query.py all read from here.
+# Each table is a read-only MappingProxyType so no consumer can mutate a
+# shared value (and silently invalidate anything cached from it).
+# The numpy lookup arrays derived from them are frozen the same way. They
+# are built once at import, so pre-forked agent workers share their pages
+# with the parent instead of each holding a private copy.
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Mark a module-level lookup array read-only and return it."""
+    array.setflags(write=False)
+    return array
+
 
 # Merchant category risk weights (FRM-002, Section 1)
 # Keys match merchant_category values in transactions.csv exactly.
-MERCHANT_RISK: Dict[str, int] = {
+MERCHANT_RISK: Mapping[str, int] = MappingProxyType({
     "fintech":     25,   # Highest — primary fraud exit channel
     "transport":   15,   # Card-testing indicator (Uber/Bolt)
     "education":   15,   # Social engineering scam cover
@@ -40,65 +68,1164 @@ MERCHANT_RISK: Dict[str, int] = {
     "restaurants":  0,   # Routine food spending
     "fuel":         0,   # Routine predictable amounts
     "utilities":    0,   # Scheduled bill payments
-}
+})
 
 # Fraud trace flag risk weights (FRM-001, Section 1)
 # Keys match fraud_explainability_trace comma-separated values in transactions.csv exactly.
-FLAG_WEIGHTS: Dict[str, int] = {
+FLAG_WEIGHTS: Mapping[str, int] = MappingProxyType({
     "mobile_channel_risk": 15,   # channel="mobile_app" + is_fraud_score=1
     "high_amount_spike":   25,   # amount > account_balance*0.6 + is_fraud_score=1
     "multiple_failures":   20,   # status="failed" repeated + is_fraud_score=1
     "normal_pattern":       0,   # Baseline — no additional risk
-}
+})
 
 # SLA hours per department (POL-CCH-001, Section 2)
 # Must match sla_hours_limit values in complaints.csv exactly.
-EXPECTED_SLA: Dict[str, int] = {
+EXPECTED_SLA: Mapping[str, int] = MappingProxyType({
     "TSU": 48,
     "COC": 48,
     "FRM": 24,
     "DCS": 72,
     "AOD": 72,
     "CLS": 96,
-}
+})
 
 # Full department names keyed by department_code (POL-CCH-001, Section 2)
-DEPT_NAMES: Dict[str, str] = {
+DEPT_NAMES: Mapping[str, str] = MappingProxyType({
     "TSU": "Transaction Services Unit",
     "COC": "Card Operations Center",
     "FRM": "Fraud Risk Management",
     "DCS": "Digital Channels Support",
     "AOD": "Account Operations Department",
     "CLS": "Credit & Loan Services",
-}
+})
+
+# Enumerated transaction columns (TSU-POL-002, Sections 5-6), in policy
+# order. Loaders use them as categorical dtypes so each cell is an int8
+# code; a value outside the list loads as NaN, which flags schema drift.
+TRANSACTION_STATUSES: Tuple[str, ...] = (
+    "successful", "failed", "reversed", "pending",
+    "timeout", "queued", "processing",
+)
+FAILURE_REASONS: Tuple[str, ...] = (
+    "none", "insufficient_fund", "network_error", "system_failure",
+    "system_timeout", "invalid_account_number",
+    "daily_transaction_limit_exceeded", "compliance_restriction",
+    "suspected_fraud", "issuer_unavailable",
+)
+
+# Department each failure_reason routes to (TSU-POL-002, Section 6).
+# "NONE" means the agent advises the customer and no unit takes the case.
+FAILURE_ROUTES: Mapping[str, str] = MappingProxyType({
+    "none":                             "NONE",
+    "insufficient_fund":                "NONE",   # top up and retry
+    "network_error":                    "TSU",    # if not reversed in 2h
+    "system_failure":                   "TSU",
+    "system_timeout":                   "TSU",
+    "invalid_account_number":           "NONE",   # verify and retry
+    "daily_transaction_limit_exceeded": "AOD",    # KYC tier upgrade
+    "compliance_restriction":           "AOD",    # or FRM, by context
+    "suspected_fraud":                  "FRM",
+    "issuer_unavailable":               "TSU",    # if not reversed in 24h
+})
+
+# Complaint routing keywords, mirrored exactly from
+# map_transaction_to_department() in data_generator.py and listed in rule
+# order: after FRM (decided by fraud_related), the first department with
+# any of its keywords in the complaint text takes it; otherwise TSU.
+COMPLAINT_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("COC", ("atm", "card", "pos", "declined", "swallowed", "pin")),
+    ("DCS", ("app", "login", "ussd", "crash")),
+    ("AOD", ("statement", "bvn", "close", "charges")),
+    ("CLS", ("loan", "credit", "repayment", "interest")),
+)
+
+TRANSACTION_CHANNELS: Tuple[str, ...] = (
+    "mobile_app", "ussd", "atm", "pos", "web", "branch", "nibss_transfer",
+)
 
 # Risk score thresholds (FRM-001, Section 2.2)
-RISK_THRESHOLDS = {
+RISK_THRESHOLDS: Mapping[str, Tuple[int, int]] = MappingProxyType({
     "LOW":      (0,  30),
     "MEDIUM":   (31, 60),
     "HIGH":     (61, 85),
     "CRITICAL": (86, 100),
-}
+})
+
+# Vectorized form of RISK_THRESHOLDS for batch scoring. Edges are the lower
+# bound of every band above LOW, so searchsorted(side="right") maps a score
+# straight to its band index in a single C-level call.
+_RISK_LABELS = _frozen(np.array(list(RISK_THRESHOLDS.keys())))
+_RISK_EDGES = _frozen(np.array(
+    [low for low, _ in list(RISK_THRESHOLDS.values())[1:]], dtype=np.int16
+))
+
+
+def classify_risk(scores) -> np.ndarray:
+    """
+    Map risk score(s) to LOW / MEDIUM / HIGH / CRITICAL (FRM-001, Section 2.2).
+
+    Accepts a scalar or any array-like of scores and returns the label(s)
+    with the same shape, e.g. classify_risk([12, 45, 70, 95]) →
+    ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL'].
+    """
+    return _RISK_LABELS[risk_codes(scores)]
+
+
+def risk_codes(scores) -> np.ndarray:
+    """
+    Band index per score: 0=LOW, 1=MEDIUM, 2=HIGH, 3=CRITICAL, as int8.
+    """
+    return np.searchsorted(_RISK_EDGES, scores, side="right").astype(np.int8)
+
+
+def risk_categories(scores):
+    """
+    Risk bands for a score column as a pandas Categorical.
+
+    Stores one byte per row plus the four labels, rather than a Python
+    string object per row, and sorts in band order.
+    """
+    import pandas as pd
+
+    return pd.Categorical.from_codes(
+        risk_codes(np.asarray(scores).ravel()),
+        categories=list(RISK_THRESHOLDS.keys()),
+        ordered=True,
+    )
+
+
+def risk_summary(scores) -> Tuple[int, List[int]]:
+    """
+    Score total and per-band counts (LOW, MEDIUM, HIGH, CRITICAL) of 0-100
+    integer scores, from a single pass: one bincount over the score values,
+    whose 101 bins are then reduced to the total and to RISK_THRESHOLDS
+    bands without touching the scores again.
+    """
+    hist = np.bincount(np.asarray(scores, dtype=np.intp), minlength=101)
+    total = int(hist @ np.arange(len(hist)))
+    bands = np.add.reduceat(hist, np.r_[0, _RISK_EDGES])
+    return total, bands.tolist()
+
+
+def _column_codes(values, skip_value: Optional[str] = None):
+    """
+    Integer codes and distinct values for a column. Categoricals reuse
+    their existing codes; strings are factorized, leaving rows equal to
+    skip_value out of the hash pass at code -1.
+    """
+    import pandas as pd
+
+    column = pd.Series(values)
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(), column.cat.categories.astype(str)
+    if skip_value is None:
+        return pd.factorize(column.astype(str))
+
+    keep = (column != skip_value).to_numpy()
+    codes = np.full(len(column), -1, dtype=np.intp)
+    codes[keep], uniques = pd.factorize(column[keep].astype(str))
+    return codes, uniques
+
+
+# MERCHANT_RISK weights laid out in key order, i.e. by the category code of
+# a column typed with CategoricalDtype(list(MERCHANT_RISK)) as
+# load_scoring_frame does. The trailing 0 catches code -1 (unknown/missing).
+_MERCHANT_RISK_LUT = _frozen(np.array(
+    list(MERCHANT_RISK.values()) + [0], dtype=np.int16,
+))
+
+
+@functools.lru_cache(maxsize=256)
+def _trace_weight(trace: str) -> int:
+    """Summed FLAG_WEIGHTS of one comma-separated fraud_explainability_trace."""
+    return sum(FLAG_WEIGHTS.get(flag.strip(), 0) for flag in trace.split(","))
+
+
+def score_fraud_risk(traces, merchant_categories=None) -> np.ndarray:
+    """
+    Capped 0-100 risk score for a column of transactions (FRM-001, Section 1).
+
+    Sums FLAG_WEIGHTS over each comma-separated fraud_explainability_trace
+    and adds MERCHANT_RISK for the merchant_category, if given. A column
+    holds only a handful of distinct traces and categories, so each is
+    reduced to small integer codes, the distinct values are weighted
+    once into a lookup table, and rows are scored by a single gather.
+    Each table ends in a 0 entry that code -1 (missing values, and the
+    normal_pattern rows skipped below) picks up. A merchant column typed
+    against MERCHANT_RISK (load_scoring_frame) reuses _MERCHANT_RISK_LUT.
+
+    Almost every trace is "normal_pattern", which weighs 0, so those rows
+    are masked out by one equality pass and only the residue is hashed.
+    Categorical columns skip hashing altogether.
+
+    The trace and merchant tables are combined, and capped, into one small
+    2-D table up front, so the add and the clip cost nothing per row and
+    the only full-length pass is the gather itself. Scores are int16.
+    Trace weights are memoised (_trace_weight), so repeated validation
+    runs over the same trace vocabulary never re-parse a trace.
+    """
+    trace_codes, uniques = _column_codes(traces, skip_value="normal_pattern")
+    trace_lut = np.array(
+        [_trace_weight(trace) for trace in uniques]
+        + [FLAG_WEIGHTS["normal_pattern"]],
+        dtype=np.int16,
+    )
+    if merchant_categories is None:
+        return np.minimum(trace_lut, 100)[trace_codes]
+
+    merchant_codes, uniques = _column_codes(merchant_categories)
+    if tuple(uniques) == tuple(MERCHANT_RISK):
+        # Codes already index MERCHANT_RISK: use the prebuilt weights.
+        merchant_lut = _MERCHANT_RISK_LUT
+    else:
+        merchant_lut = np.array(
+            [MERCHANT_RISK.get(cat.lower(), 0) for cat in uniques] + [0],
+            dtype=np.int16,
+        )
+    lut = np.minimum(trace_lut[:, None] + merchant_lut[None, :], 100)
+    return lut[trace_codes, merchant_codes]
+
+
+# FAILURE_ROUTES laid out by FAILURE_REASONS category code. The trailing
+# entry catches code -1 (unknown or missing reason): TSU owns failed
+# transactions by default.
+_FAILURE_ROUTE_LUT = _frozen(np.array(
+    [FAILURE_ROUTES[reason] for reason in FAILURE_REASONS] + ["TSU"],
+    dtype=object,
+))
+
+
+def route_failures(failure_reasons) -> np.ndarray:
+    """
+    Routing department for each failure_reason, by one array gather.
+
+    A column already loaded as a categorical (see load_scoring_frame) is
+    only recoded category-by-category; plain strings are categorized
+    against FAILURE_REASONS once.
+    """
+    import pandas as pd
+
+    codes = pd.Categorical(failure_reasons, categories=FAILURE_REASONS).codes
+    return _FAILURE_ROUTE_LUT[codes]
+
+
+# Rule position of every routing keyword, and the departments laid out by
+# that position. The trailing entry catches texts with no keyword at all.
+_KEYWORD_RANK: Mapping[str, int] = MappingProxyType({
+    keyword: rank
+    for rank, (_, keywords) in enumerate(COMPLAINT_KEYWORDS)
+    for keyword in keywords
+})
+_COMPLAINT_ROUTE_LUT = _frozen(np.array(
+    [dept for dept, _ in COMPLAINT_KEYWORDS] + ["TSU"], dtype=object,
+))
+
+
+@functools.lru_cache(maxsize=1)
+def _complaint_scanner() -> Callable[[str], List[str]]:
+    """
+    findall of all routing keywords fused into one pattern, compiled on
+    first use (only dataset validation routes complaints). The match sits
+    inside a zero-width lookahead, so overlapping keywords ("appos" holds
+    "app" and "pos") are each reported instead of the first swallowing
+    the second.
+    """
+    return re.compile("(?=(" + "|".join(_KEYWORD_RANK) + "))").findall
+
+
+def _flag_set(values) -> np.ndarray:
+    """values == 1 as a bool array; a missing entry (NaN or <NA>) is False."""
+    if hasattr(values, "fillna"):
+        values = values.fillna(0)
+    return np.asarray(values) == 1
+
+
+def route_complaints(texts, fraud_related=None) -> np.ndarray:
+    """
+    Routing department for each complaint text (POL-CCH-001).
+
+    Each text is lower-cased and scanned once by the fused keyword pattern,
+    instead of once per department; the lowest rule position among the
+    keywords found picks the department, so the result is the same as
+    trying COMPLAINT_KEYWORDS in order. Rows with fraud_related == 1 go to
+    FRM regardless of wording. Missing texts match no keyword (TSU).
+    """
+    rank_of, scan = _KEYWORD_RANK.__getitem__, _complaint_scanner()
+    no_match = len(COMPLAINT_KEYWORDS)
+    ranks = np.fromiter(
+        (min(map(rank_of, scan(str(text).lower())), default=no_match)
+         for text in texts),
+        dtype=np.intp, count=len(texts),
+    )
+    routes = _COMPLAINT_ROUTE_LUT[ranks]
+    if fraud_related is not None:
+        routes[_flag_set(fraud_related)] = "FRM"
+    return routes
+
+
+def _to_kobo(naira) -> np.ndarray:
+    """Naira amounts (float, 2 d.p.) as exact int64 kobo."""
+    return np.rint(np.asarray(naira, dtype=np.float64) * 100).astype(np.int64)
+
+
+def high_amount_spike(amounts, balances, is_fraud_score=None) -> np.ndarray:
+    """
+    FRM-001 high_amount_spike trigger: amount > 60% of the balance.
+
+    Compared in integer kobo as 10 * amount > 6 * balance, so rows exactly
+    at the 60% line are never misjudged by float rounding. With
+    is_fraud_score, the flag also requires is_fraud_score == 1.
+    """
+    spike = _to_kobo(amounts) * 10 > _to_kobo(balances) * 6
+    if is_fraud_score is not None:
+        spike &= _flag_set(is_fraud_score)
+    return spike
+
+
+def fraud_trigger_flags(channel, amount, balance, is_fraud_score,
+                        transaction_status):
+    """
+    The three FRM-001 Section 1 trigger flags for every row at once.
+
+    Returns a dict of boolean arrays keyed by flag name:
+      mobile_channel_risk : channel == "mobile_app"      and is_fraud_score == 1
+      high_amount_spike   : amount > 60% of balance      and is_fraud_score == 1
+      multiple_failures   : transaction_status == "failed" and is_fraud_score == 1
+    Channel and status are compared as categorical codes (one int8 compare
+    each); weighting a flag is flags[name] * FLAG_WEIGHTS[name].
+    """
+    import pandas as pd
+
+    fraud = _flag_set(is_fraud_score)
+    channel_codes = pd.Categorical(channel, categories=TRANSACTION_CHANNELS).codes
+    status_codes = pd.Categorical(
+        transaction_status, categories=TRANSACTION_STATUSES
+    ).codes
+    return {
+        "mobile_channel_risk":
+            (channel_codes == TRANSACTION_CHANNELS.index("mobile_app")) & fraud,
+        "high_amount_spike": high_amount_spike(amount, balance, is_fraud_score),
+        "multiple_failures":
+            (status_codes == TRANSACTION_STATUSES.index("failed")) & fraud,
+    }
+
+
+def account_risk_summary(account_ids, scores, amounts):
+    """
+    Per-account transaction count, total amount and peak risk score.
+
+    Accounts are factorized to integer codes and the rows stably sorted by
+    code, so each account is one contiguous run reduced with
+    np.add.reduceat / np.maximum.reduceat; no per-group DataFrame is built.
+    Rows with a missing account_id are dropped. Accounts appear in order
+    of first occurrence.
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(pd.Series(account_ids), sort=False)
+    keep = codes >= 0
+    codes = codes[keep]
+    scores = np.asarray(scores)[keep]
+    amounts = np.asarray(amounts, dtype=np.float64)[keep]
+
+    if codes.size == 0:
+        return pd.DataFrame(
+            {"txn_count": [], "total_amount": [], "max_risk_score": []},
+            index=pd.Index(uniques, name="account_id"),
+        )
+
+    order = np.argsort(codes, kind="stable")
+    starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+
+    return pd.DataFrame(
+        {
+            "txn_count":      np.diff(np.append(starts, codes.size)),
+            "total_amount":   np.add.reduceat(amounts[order], starts),
+            "max_risk_score": np.maximum.reduceat(scores[order], starts),
+        },
+        index=pd.Index(uniques, name="account_id"),
+    )
+
+
+def detect_duplicate_charges(df, terminal_col: str = "device_id",
+                             amount_col: str = "amount",
+                             time_col: str = "transaction_timestamp",
+                             window: str = "5min",
+                             tolerance: float = 0.05):
+    """
+    Flag repeat charges: same terminal, amount within ±5% of the previous
+    charge on it, and within 5 minutes of it (TSU-POL-002, POS channel).
+
+    Rows are sorted once by (terminal, time) and compared with their
+    predecessor through groupby shift/diff, so no Python loop visits a
+    terminal or a row. Returns a boolean Series aligned to df.index that
+    is True on the second (auto-reversible) charge of each pair; rows
+    without a terminal are never flagged.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame({
+        "terminal": df[terminal_col],
+        "amount":   df[amount_col],
+        "ts":       pd.to_datetime(df[time_col]),
+    }, index=df.index).sort_values(["terminal", "ts"], kind="stable")
+
+    grouped = frame.groupby("terminal", sort=False, observed=True)
+    prev_amount = grouped["amount"].shift()
+    gap = grouped["ts"].diff()
+
+    duplicate = (
+        ((frame["amount"] - prev_amount).abs() <= tolerance * prev_amount)
+        & (gap <= pd.Timedelta(window))
+    )
+    return duplicate.reindex(df.index)
+
+
+# Columns the FRM scoring helpers read, out of ~20 in transactions.csv.
+FRM_SCORING_COLUMNS: Tuple[str, ...] = (
+    "account_id", "amount", "transaction_balance", "is_fraud_score",
+    "channel", "transaction_status", "failure_reason",
+    "fraud_explainability_trace", "merchant_category",
+)
+
+
+def load_scoring_frame(transactions_csv, columns: Iterable[str] = FRM_SCORING_COLUMNS):
+    """
+    Load only the scoring columns of transactions.csv, with compact dtypes.
+
+    Unread columns are skipped by the parser and never materialised;
+    enumerated columns and the trace come back as categoricals (int8
+    codes, which score_fraud_risk uses without rehashing) and
+    is_fraud_score as nullable Int8 (a blank score is <NA>, which the
+    helpers above treat as not fraud), so each column is one typed block
+    ready for the vectorized helpers above.
+    """
+    import pandas as pd
+
+    dtypes = {
+        "amount":              "float64",
+        "transaction_balance": "float64",
+        "is_fraud_score":      "Int8",
+        "channel":             pd.CategoricalDtype(TRANSACTION_CHANNELS),
+        "transaction_status":  pd.CategoricalDtype(TRANSACTION_STATUSES),
+        "failure_reason":      pd.CategoricalDtype(FAILURE_REASONS),
+        "merchant_category":   pd.CategoricalDtype(list(MERCHANT_RISK)),
+        # Open-ended, but only a handful of distinct traces occur.
+        "fraud_explainability_trace": "category",
+    }
+    columns = list(columns)
+    return pd.read_csv(
+        transactions_csv,
+        usecols=columns,
+        dtype={c: t for c, t in dtypes.items() if c in columns},
+    )
+
+
+# Columns validate_entire_dataset reads from each file; the rest of every
+# row is skipped by the parser. customers.csv is only counted.
+VALIDATION_COLUMNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "customers":    ("customer_id",),
+    "accounts":     ("account_id", "customer_id"),
+    "transactions": (
+        "account_id", "transaction_type", "amount", "is_fraud_score",
+        "fraud_explainability_trace", "merchant_category",
+        "salary_detected", "car_loan_signal_score", "recommended_product",
+    ),
+    "complaints":   (
+        "complaint_id", "department_code", "priority_level",
+        "resolution_time_hours", "sla_hours_limit", "sla_breach_flag",
+        "fraud_related", "complaint_text",
+    ),
+})
+
+# Row layouts of the validate_entire_dataset report, parsed once and
+# filled per row with str.format_map.
+_SLA_ROW_FORMAT = (
+    "  {status} {dept}  SLA={sla}h | Avg Resolution={avg:.0f}h | "
+    "Breaches={breaches}/{total} ({rate:.1f}%){limit}"
+)
+_PRODUCT_ROW_FORMAT = "       {product:<20}: {count:,}"
+
+# Weights of routing accuracy, fraud score, recommendation accuracy and SLA
+# compliance in the overall validation score.
+_OVERALL_SCORE_WEIGHTS = _frozen(np.array([0.35, 0.30, 0.25, 0.10]))
+
 
 # Product recommendation thresholds (PRS-001, Section 1)
 # Must match data_generator.py hierarchy exactly.
-PRODUCT_THRESHOLDS = {
-    "Investment Plan": {"monthly_inflow_min": 2_000_000},
-    "Car Loan":        {"car_loan_signal_score_min": 0.7},
-    "Personal Loan":   {"monthly_inflow_min": 300_000, "salary_detected": True},
-}
+# Fields are plain attributes so eligibility checks avoid nested dict lookups;
+# a zero / False field means the product has no requirement on that signal.
+class ProductThreshold(NamedTuple):
+    monthly_inflow_min:        int   = 0
+    car_loan_signal_score_min: float = 0.0
+    salary_detected:           bool  = False
+
+
+PRODUCT_THRESHOLDS: Mapping[str, ProductThreshold] = MappingProxyType({
+    "Investment Plan": ProductThreshold(monthly_inflow_min=2_000_000),
+    "Car Loan":        ProductThreshold(car_loan_signal_score_min=0.7),
+    "Personal Loan":   ProductThreshold(monthly_inflow_min=300_000,
+                                        salary_detected=True),
+})
+
 
 # Car loan signal score component weights (PRS-001, Section 2)
-CAR_LOAN_SIGNAL_WEIGHTS = {
-    "uber_tracker_min":       6,     # uber_tracker >= 6 required to add score
-    "uber_tracker_score":     0.4,
-    "salary_detected_score":  0.3,
-    "monthly_inflow_min":     500_000,
-    "monthly_inflow_score":   0.3,
-    "eligibility_threshold":  0.7,
+class CarLoanWeights(NamedTuple):
+    uber_tracker_min:      int     # uber_tracker >= 6 required to add score
+    uber_tracker_score:    float
+    salary_detected_score: float
+    monthly_inflow_min:    int
+    monthly_inflow_score:  float
+    eligibility_threshold: float
+
+
+CAR_LOAN_SIGNAL_WEIGHTS = CarLoanWeights(
+    uber_tracker_min=6,
+    uber_tracker_score=0.4,
+    salary_detected_score=0.3,
+    monthly_inflow_min=500_000,
+    monthly_inflow_score=0.3,
+    eligibility_threshold=0.7,
+)
+
+
+def score_car_loan(uber: np.ndarray, salary: np.ndarray,
+                   inflow: np.ndarray) -> np.ndarray:
+    """
+    Vectorized car_loan_signal_score for a whole population (PRS-001, §2).
+
+    Mirrors data_generator.py term for term: +0.4 when uber_tracker >= 6,
+    +0.3 when salary_detected, +0.3 when monthly inflow > ₦500,000.
+    Eligibility for every customer is then
+    score_car_loan(...) >= CAR_LOAN_SIGNAL_WEIGHTS.eligibility_threshold.
+
+    Scores stay float64 so 0.4 + 0.3 compares exactly as the generator's
+    Python floats do against the 0.7 threshold.
+    """
+    w = CAR_LOAN_SIGNAL_WEIGHTS
+    return (
+        w.uber_tracker_score * (np.asarray(uber) >= w.uber_tracker_min)
+        + w.salary_detected_score * np.asarray(salary, dtype=bool)
+        + w.monthly_inflow_score * (np.asarray(inflow) > w.monthly_inflow_min)
+    )
+
+
+def _eligibility_predicate(threshold: ProductThreshold) -> Callable[[Any], bool]:
+    """Compile one ProductThreshold into a check over a customer's signals."""
+    def eligible(customer) -> bool:
+        return (
+            (not threshold.monthly_inflow_min
+             or customer.monthly_inflow > threshold.monthly_inflow_min)
+            and (not threshold.car_loan_signal_score_min
+                 or customer.car_loan_signal_score
+                 >= threshold.car_loan_signal_score_min)
+            and (not threshold.salary_detected
+                 or bool(customer.salary_detected))
+        )
+    return eligible
+
+
+# PRS-001 eligibility hierarchy as (product, predicate) pairs, highest
+# priority first, so an agent evaluates the policy directly instead of
+# re-reading its prose. Predicates read monthly_inflow, salary_detected
+# and car_loan_signal_score attributes (e.g. a ProductSignals).
+PRODUCT_RULES: Tuple[Tuple[str, Callable[[Any], bool]], ...] = tuple(
+    (product, _eligibility_predicate(threshold))
+    for product, threshold in PRODUCT_THRESHOLDS.items()
+)
+
+
+class ProductSignals(NamedTuple):
+    monthly_inflow:        float = 0.0
+    salary_detected:       bool  = False
+    car_loan_signal_score: float = 0.0
+
+
+def recommend_product(customer) -> Optional[str]:
+    """
+    First product in the PRS-001 hierarchy the customer qualifies for, or
+    None. Because rules are tried in priority order, a lower product's
+    rule does not need to exclude the ones above it.
+    """
+    for product, eligible in PRODUCT_RULES:
+        if eligible(customer):
+            return product
+    return None
+
+
+def _eligibility_mask(threshold: ProductThreshold, inflow: np.ndarray,
+                      salary: np.ndarray, score: np.ndarray) -> np.ndarray:
+    """_eligibility_predicate over whole arrays: one compare per requirement."""
+    mask = np.ones(len(inflow), dtype=bool)
+    if threshold.monthly_inflow_min:
+        mask &= inflow > threshold.monthly_inflow_min
+    if threshold.car_loan_signal_score_min:
+        mask &= score >= threshold.car_loan_signal_score_min
+    if threshold.salary_detected:
+        mask &= salary
+    return mask
+
+
+def recommend_products(monthly_inflow, salary_detected, car_loan_signal_score,
+                       default: Optional[str] = None) -> np.ndarray:
+    """
+    recommend_product() for aligned columns of signals at once.
+
+    Each PRS-001 rule becomes a boolean mask built from PRODUCT_THRESHOLDS
+    (only the requirements a product actually has are compared), and
+    np.select applies them in hierarchy order. Rows that qualify for
+    nothing get default.
+    """
+    inflow = np.asarray(monthly_inflow, dtype=np.float64)
+    score = np.asarray(car_loan_signal_score, dtype=np.float64)
+    salary = np.asarray(salary_detected, dtype=bool)
+    return np.select(
+        [_eligibility_mask(threshold, inflow, salary, score)
+         for threshold in PRODUCT_THRESHOLDS.values()],
+        list(PRODUCT_THRESHOLDS),
+        default=default,
+    )
+
+
+def _product_policy_payload() -> Dict[str, Any]:
+    """PRS-001 thresholds as plain JSON, for agents that look them up directly."""
+    return {
+        "products": {product: threshold._asdict()
+                     for product, threshold in PRODUCT_THRESHOLDS.items()},
+        "car_loan_signal_weights": CAR_LOAN_SIGNAL_WEIGHTS._asdict(),
+    }
+
+
+# Statutory levies and flat service charges (TSU-POL-002, Sections 3-7).
+# Money is integer kobo and rates are basis points, so fee math never
+# touches floating point. The policy text is rendered from these values.
+@dataclass(frozen=True, slots=True)
+class Levies:
+    emtl_kobo:           int = 5_000        # ₦50 flat on inbound credits
+    emtl_threshold_kobo: int = 1_000_000    # ... of ₦10,000 and above
+    cyber_bps:           int = 50           # 0.5% on outbound transfers
+    vat_bps:             int = 750          # 7.5% on bank fees only
+    ussd_session_kobo:   int = 698          # ₦6.98 per USSD session
+    atm_kobo:            int = 6_500        # ₦65 per chargeable withdrawal
+    # NIP transfer fee: tier i applies up to and including bound i.
+    nip_tier_bounds_kobo: Tuple[int, ...] = (500_000, 5_000_000)
+    nip_tier_fees_kobo:   Tuple[int, ...] = (1_000, 2_500, 5_000)
+    nip_free_per_month:   int = 3           # savings accounts only
+
+    def emtl(self, amount_kobo: int) -> int:
+        """EMTL on an inbound credit of amount_kobo."""
+        return self.emtl_kobo if amount_kobo >= self.emtl_threshold_kobo else 0
+
+    def cybersecurity(self, amount_kobo: int) -> int:
+        """National Cybersecurity Levy on an outbound transfer."""
+        return amount_kobo * self.cyber_bps // 10_000
+
+    def vat(self, fee_kobo: int) -> int:
+        """VAT on a bank fee (never on the principal)."""
+        return fee_kobo * self.vat_bps // 10_000
+
+
+LEVIES = Levies()
+
+_NIP_BOUNDS = _frozen(np.array(LEVIES.nip_tier_bounds_kobo, dtype=np.int64))
+_NIP_FEES = _frozen(np.array(LEVIES.nip_tier_fees_kobo, dtype=np.int64))
+
+
+def nip_fees(amounts, account_ids=None, months=None) -> np.ndarray:
+    """
+    NIP transfer fee in kobo for each naira amount (TSU-POL-002, Section 7).
+
+    The tier is found with one np.searchsorted over the bounds. When
+    account_ids and months are given, the first nip_free_per_month
+    transfers per account per month (in row order) are free; pass only
+    savings-account transfers in that case.
+    """
+    kobo = _to_kobo(amounts)
+    # side="left": an amount equal to a bound still belongs to the lower tier.
+    fees = _NIP_FEES[np.searchsorted(_NIP_BOUNDS, kobo, side="left")]
+
+    if account_ids is not None and months is not None:
+        import pandas as pd
+
+        rank = pd.DataFrame({"a": account_ids, "m": months}).groupby(
+            ["a", "m"], sort=False
+        ).cumcount().to_numpy()
+        fees = np.where(rank < LEVIES.nip_free_per_month, 0, fees)
+    return fees
+
+
+def _naira(kobo: int, decimals: bool = False) -> str:
+    """₦ amount as written in the policies: ₦10,000 / ₦6.98, or ₦50.00."""
+    naira, rem = divmod(kobo, 100)
+    if decimals or rem:
+        return f"₦{naira:,}.{rem:02d}"
+    return f"₦{naira:,}"
+
+
+def _levy_fields(levies: Levies) -> Dict[str, str]:
+    """Template fields for the fee figures quoted in TSU-POL-002."""
+    example_amount = 10_000_000     # ₦100,000 transfer
+    example_fee = levies.nip_tier_fees_kobo[-1]
+    bounds, fees = levies.nip_tier_bounds_kobo, levies.nip_tier_fees_kobo
+    return {
+        "nip_tier1_max":        _naira(bounds[0]),
+        "nip_tier2_min":        _naira(bounds[0] + 100),
+        "nip_tier2_max":        _naira(bounds[1]),
+        "nip_fee1":             _naira(fees[0], decimals=True),
+        "nip_fee2":             _naira(fees[1], decimals=True),
+        "nip_fee3":             _naira(fees[2], decimals=True),
+        "nip_free_per_month":   str(levies.nip_free_per_month),
+        "emtl":                 _naira(levies.emtl_kobo),
+        "emtl_2dp":             _naira(levies.emtl_kobo, decimals=True),
+        "emtl_threshold":       _naira(levies.emtl_threshold_kobo),
+        "cyber_rate":           f"{levies.cyber_bps / 100:g}%",
+        "cyber_example_amount": _naira(example_amount),
+        "cyber_example_levy":   _naira(levies.cybersecurity(example_amount)),
+        "vat_rate":             f"{levies.vat_bps / 100:g}%",
+        "vat_example_fee":      _naira(example_fee),
+        "vat_example_vat":      _naira(levies.vat(example_fee)),
+        "ussd_session":         _naira(levies.ussd_session_kobo),
+        "atm":                  _naira(levies.atm_kobo),
+        "atm_2dp":              _naira(levies.atm_kobo, decimals=True),
+    }
+
+
+def _faq_fee_fields(levies: Levies) -> Dict[str, str]:
+    """
+    The monthly-charges table in FAQ-001 Q10, aligned once from
+    (label, charge) rows; the USSD and ATM charges come from levies.
+    """
+    rows = (
+        ("Account maintenance (savings)",
+         "₦50/month (waived if balance ≥ ₦100,000)"),
+        ("Account maintenance (current)", "₦300/month"),
+        ("SMS transaction alerts",
+         "₦4 per alert (mandatory, CBN requirement)"),
+        ("USSD sessions (*737#)",
+         f"{_naira(levies.ussd_session_kobo)} per session"),
+        ("ATM withdrawals (other banks)",
+         f"{_naira(levies.atm_kobo)} per withdrawal"),
+        ("ATM withdrawals (own bank, >3/mo)",
+         f"{_naira(levies.atm_kobo)} per withdrawal"),
+    )
+    width = max(len(label) for label, _ in rows) + 1
+    return {
+        "faq_fee_table": "\n".join(
+            f"   {label:<{width}}: {charge}" for label, charge in rows
+        ),
+    }
+
+
+# Merchant category profiles for the weighted tiers (FRM-002, Section 1).
+# One row per category; risk weights come from MERCHANT_RISK and every
+# profile shares the same heightened-alert uplift, so the policy text for
+# a tier is rendered from these rows rather than repeated by hand.
+MERCHANT_ALERT_UPLIFT = 10
+
+
+@dataclass(frozen=True, slots=True)
+class MerchantProfile:
+    category:   str
+    merchants:  str
+    rationale:  Tuple[str, ...]
+    alerts:     Tuple[str, ...]             # one bullet each; "\n" continues
+    context:    Tuple[str, ...] = ()        # positive signals, same bullets
+    rule:       Tuple[str, ...] = ()
+    escalation: Tuple[str, ...] = ()
+
+    @property
+    def weight(self) -> int:
+        return MERCHANT_RISK[self.category]
+
+
+MERCHANT_PROFILES: Tuple[MerchantProfile, ...] = (
+    MerchantProfile(
+        category="fintech",
+        merchants="Paystack, Flutterwave, Interswitch, Remita, Monnify",
+        rationale=(
+            "Fintech payment gateways are the PRIMARY channel for moving stolen funds",
+            "out of compromised accounts. Fraudsters use victim accounts to fund",
+            "merchant accounts or P2P wallets on fintech platforms, making tracing",
+            "difficult. High-value fintech transactions from accounts with no prior",
+            "fintech history are the strongest single fraud signal in this dataset.",
+        ),
+        alerts=(
+            "First-ever fintech transaction for this account",
+            "Amount > ₦200,000 to a fintech gateway",
+            "Transaction at hours between midnight and 5:00 AM WAT",
+            'Customer segment = "elderly" (age > 60 in customers.csv)',
+        ),
+        rule=(
+            'IF merchant_category = "fintech" AND is_fraud_score = 1:',
+            "  Add +25 points to risk score.",
+            'IF merchant_category = "fintech" AND amount > 200000 AND',
+            "   no prior fintech transactions:",
+            "  Treat as if multiple_failures flag present (+20 additional).",
+        ),
+        escalation=(
+            "Combined score ≥ 61 (fintech + any one FRM-001 flag) → HIGH risk.",
+            "Mandatory push-to-app challenge for ALL fintech transactions > ₦100,000",
+            "regardless of fraud score, as a blanket protective control.",
+        ),
+    ),
+    MerchantProfile(
+        category="transport",
+        merchants="Uber, Bolt, LagRide, ABC Transport, Peace Mass Transit",
+        rationale=(
+            "Transport platforms (especially ride-hailing apps) are used as",
+            "money-testing venues. Fraudsters initiate small Uber or Bolt transactions",
+            "to test whether a stolen card or account access is active before",
+            "attempting larger withdrawals. Multiple transport transactions within",
+            "a short window is a card-testing indicator.",
+        ),
+        alerts=(
+            "3+ transport transactions within 30 minutes to same platform",
+            "Transport transaction outside customer's residential_state\n"
+            "(customers.csv: residential_state field)",
+            "Transport transaction at 12:00 AM – 5:00 AM WAT",
+        ),
+        context=(
+            "Uber/Bolt transactions ≥ 6 in last 90 days on this account\n"
+            "→ REDUCES suspicion (regular commuter behavior)",
+            "This is the car_loan_signal_score trigger in transactions.csv\n"
+            "(uber_tracker ≥ 6 adds +0.4 to car_loan_signal_score)",
+        ),
+        rule=(
+            'IF merchant_category = "transport" AND is_fraud_score = 1:',
+            "  Add +15 points.",
+            "IF uber_tracker < 6 AND 3+ transport txns in 30 minutes:",
+            "  Treat as card-testing pattern. Add +15 points.",
+        ),
+    ),
+    MerchantProfile(
+        category="education",
+        merchants="University Tuition, WAEC, JAMB, Private School Fees",
+        rationale=(
+            "Education payments are legitimate but frequently used in social",
+            'engineering scams. Fraudsters convince victims to make urgent "school',
+            'fee" payments under false pretenses. Large, round-number education',
+            "payments from accounts with no prior education payment history are",
+            "suspicious.",
+        ),
+        alerts=(
+            "Payment > ₦500,000 (unusually large for typical fees)",
+            "No prior education transactions on this account (ever)",
+            "Payment destination is international (outside Nigeria)",
+        ),
+        rule=(
+            'IF merchant_category = "education" AND is_fraud_score = 1:',
+            "  Add +15 points.",
+        ),
+    ),
+    MerchantProfile(
+        category="healthcare",
+        merchants="Teaching Hospital, Private Hospital, Medplus, HealthPlus",
+        rationale=(
+            "Healthcare payments are generally legitimate but are occasionally",
+            'used as cover for scam payments ("my mother needs surgery money").',
+            "Large pharmacy or hospital payments from accounts with unusual",
+            "activity patterns require secondary review.",
+        ),
+        alerts=(
+            "Payment > ₦1,000,000 (significantly above average healthcare spend)",
+            "First-ever healthcare merchant on this account",
+        ),
+        rule=(
+            'IF merchant_category = "healthcare" AND is_fraud_score = 1:',
+            "  Add +15 points.",
+        ),
+    ),
+    MerchantProfile(
+        category="telecoms",
+        merchants="MTN, Airtel, Glo, 9mobile",
+        rationale=(
+            "Telecom payments (airtime, data bundles) are generally low-risk but",
+            "can indicate money-laundering via airtime resale at very high volumes.",
+            "Standard individual top-ups are benign.",
+        ),
+        alerts=(
+            "Airtime purchase > ₦50,000 in single transaction (resale indicator)",
+            "5+ telecom transactions in one day (bulk resale pattern)",
+        ),
+        rule=(
+            'IF merchant_category = "telecoms" AND is_fraud_score = 1:',
+            "  Add +5 points.",
+        ),
+    ),
+)
+
+
+def _merchant_profile_text(profile: MerchantProfile) -> str:
+    """One CATEGORY block of FRM-002 Section 1."""
+    def lines(heading: str, rows: Iterable[str]) -> List[str]:
+        return [heading] + [f"  {row}" for row in rows]
+
+    def bullets(heading: str, items: Iterable[str]) -> List[str]:
+        return [heading] + ["  - " + item.replace("\n", "\n    ")
+                            for item in items]
+
+    out = [
+        f"CATEGORY: {profile.category}",
+        f"Risk Weight       : +{profile.weight} points",
+        f"Known Merchants   : {profile.merchants}",
+        *lines("Risk Rationale    :", profile.rationale),
+        *bullets("Heightened Alert Conditions (add additional "
+                 f"+{MERCHANT_ALERT_UPLIFT} points):", profile.alerts),
+    ]
+    if profile.context:
+        out += bullets("Positive Contextual Signal:", profile.context)
+    out += lines("Sentinel Agent Rule:", profile.rule)
+    if profile.escalation:
+        out += lines("Recommended Escalation:", profile.escalation)
+    return "\n".join(out)
+
+
+def _merchant_tier_fields(
+        profiles: Iterable[MerchantProfile]) -> Dict[str, str]:
+    """
+    Template fields merchant_tier1.. for FRM-002: the profiles of each
+    weighted tier, highest weight first, in table order within a tier.
+    """
+    tiers: Dict[int, List[str]] = {}
+    for profile in profiles:
+        tiers.setdefault(profile.weight, []).append(
+            _merchant_profile_text(profile))
+    return {
+        f"merchant_tier{rank}": "\n\n".join(tiers[weight])
+        for rank, weight in enumerate(sorted(tiers, reverse=True), start=1)
+    }
+
+
+def _merchant_risk_payload() -> Dict[str, Any]:
+    """
+    FRM-002 as plain JSON: every MERCHANT_RISK category with its weight,
+    plus the alert conditions and agent rule for the profiled tiers, so the
+    Sentinel Agent can look a category up instead of searching the prose.
+    """
+    profiles = {profile.category: profile for profile in MERCHANT_PROFILES}
+    categories = {}
+    for category, weight in MERCHANT_RISK.items():
+        profile = profiles.get(category)
+        categories[category] = {
+            "weight": weight,
+            "alert_uplift": MERCHANT_ALERT_UPLIFT if profile else 0,
+            "alerts": [a.replace("\n", " ") for a in profile.alerts]
+                      if profile else [],
+            "rule": "\n".join(profile.rule) if profile else "",
+        }
+    return {"categories": categories}
+
+
+# =============================================================================
+# DOCUMENT TEMPLATES
+# =============================================================================
+# Static policy bodies are plain-text templates under templates/, one file
+# per document, with $bank_name and $display_date placeholders (TSU-POL-002
+# also takes the LEVIES fee fields, filled in once when the file is first
+# loaded). Each is cut into one paragraph per section so save_all_policies()
+# can stream paragraphs to disk instead of building one large string first.
+
+# A paragraph pre-split at its placeholders: statics[0], fields[0],
+# statics[1], fields[1], ..., statics[-1].
+_Fragments = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _split_template(text: str) -> _Fragments:
+    """Split a $placeholder template into its static runs and field names."""
+    statics: List[str] = []
+    fields: List[str] = []
+    pos = 0
+    for match in Template.pattern.finditer(text):
+        if match.group("invalid") is not None:
+            raise ValueError(f"Invalid placeholder in template at {match.start()}")
+        if match.group("escaped") is not None:
+            continue
+        statics.append(text[pos:match.start()].replace("$$", "$"))
+        fields.append(match.group("named") or match.group("braced"))
+        pos = match.end()
+    statics.append(text[pos:].replace("$$", "$"))
+    return tuple(statics), tuple(fields)
+
+
+def _render(paragraphs: Iterable[_Fragments], **fmt: str) -> Iterator[str]:
+    """
+    Yield each pre-split paragraph with its placeholders filled in: one
+    join over the static runs and values, no template scan per call.
+    """
+    for statics, fields in paragraphs:
+        parts = [statics[0]]
+        for field, static in zip(fields, statics[1:]):
+            parts.append(fmt[field])
+            parts.append(static)
+        yield "".join(parts)
+
+
+# A section header is a title line boxed between two identical rule lines,
+# either "=====" (top-level sections) or "─────" (numbered subsections).
+_HEADER_BLOCK_RE = re.compile(r"^(?=(=+|─+)\n([^\n]+)\n\1$)", re.MULTILINE)
+
+
+def _split_sections(text: str) -> List[Dict[str, str]]:
+    """
+    Split a rendered document at its section header blocks.
+
+    Returns one {"section_header", "text"} dict per section, in order;
+    any preamble before the first header is kept under an empty header.
+    """
+    starts = [m.start() for m in _HEADER_BLOCK_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+
+    sections = []
+    for begin, end in zip(starts, starts[1:] + [len(text)]):
+        section = text[begin:end].strip()
+        if not section:
+            continue
+        header = _HEADER_BLOCK_RE.match(text, begin)
+        sections.append({
+            "section_header": header.group(2).strip() if header else "",
+            "text": section,
+        })
+    return sections
+
+
+# Document bodies live in templates/<document_id>.tmpl beside this module.
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+# Each top-level "=====" header block starts a new paragraph.
+_PARAGRAPH_START_RE = re.compile(r"^(?==+\n[^\n=][^\n]*\n=+$)", re.MULTILINE)
+
+
+# Title banner and end-of-document banner shared by every document; the
+# .tmpl files hold only the body between them.
+_BANNER_RULE = "=" * 73
+_HEADER_TEMPLATE = (
+    f"{_BANNER_RULE}\n$$bank_name - $document_title\n{_BANNER_RULE}\n\n"
+)
+_FOOTER_TEMPLATE = (
+    f"\n\n\n{_BANNER_RULE}\nEND OF DOCUMENT $document_id\n{_BANNER_RULE}"
+)
+
+# Banner title of each document, under the bank name.
+_DOCUMENT_TITLES: Mapping[str, str] = MappingProxyType({
+    "POL-CCH-001":  "CUSTOMER COMPLAINT HANDLING & ROUTING POLICY",
+    "FRM-001":      "FRAUD DETECTION & PREVENTION GUIDELINES",
+    "TSU-POL-002":  "TRANSACTION PROCESSING & LIMITS POLICY",
+    "FAQ-001":      "CUSTOMER SERVICE FAQ",
+    "FRM-002":      "MERCHANT RISK PROFILES",
+    "PRS-001":      "PRODUCT RECOMMENDATION POLICY",
+})
+
+
+def _load_paragraphs(doc_id: str) -> List[str]:
+    """
+    Read a document template, wrap it in the shared banners and cut it
+    into its section paragraphs.
+    """
+    body = (TEMPLATE_DIR / f"{doc_id}.tmpl").read_text(encoding="utf-8")
+    fields = {"document_id": doc_id, "document_title": _DOCUMENT_TITLES[doc_id]}
+    text = (Template(_HEADER_TEMPLATE).substitute(fields)
+            + body.rstrip("\n")
+            + Template(_FOOTER_TEMPLATE).substitute(fields))
+    return [p for p in _PARAGRAPH_START_RE.split(text) if p]
+
+
+_STATIC_FIELDS: Dict[str, str] = {
+    **_levy_fields(LEVIES),
+    **_faq_fee_fields(LEVIES),
+    **_merchant_tier_fields(MERCHANT_PROFILES),
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _document_templates(doc_id: str) -> Tuple[_Fragments, ...]:
+    """
+    Pre-split templates for one document, with the LEVIES fee figures
+    already filled in; rendering is then only joining in the bank name
+    and date. The template file is read on first use and kept for the
+    process lifetime, so processes that only import the shared constants
+    (rag_query) never load the policy text at all.
+    """
+    return tuple(
+        _split_template(Template(paragraph).safe_substitute(_STATIC_FIELDS))
+        for paragraph in _load_paragraphs(doc_id)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _rendered_sections(doc_id: str, bank_name: str,
+                       display_date: str) -> Tuple[bytes, ...]:
+    """
+    Rendered section fragments of one document, UTF-8 encoded. Only
+    bank_name and display_date vary, so every generator with the same pair
+    reuses one rendering.
+
+    The text is ASCII apart from a few symbols (₦, ≥, →), each of which
+    makes CPython store the whole str at two bytes per character; as UTF-8
+    it takes about half that. Hashing and the .txt and chunk writers
+    all consume bytes, so only the packet content is ever decoded.
+    """
+    return tuple(
+        paragraph.encode("utf-8")
+        for paragraph in _render(_document_templates(doc_id),
+                                 bank_name=bank_name,
+                                 display_date=display_date)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _dated_paragraphs(doc_id: str) -> Tuple[int, ...]:
+    """Indices of the paragraphs of a document that quote $display_date."""
+    return tuple(
+        index
+        for index, (_, fields) in enumerate(_document_templates(doc_id))
+        if "display_date" in fields
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _display_date_for(minute: int) -> str:
+    return datetime.now().strftime('%B %Y')
+
+
+def _current_display_date() -> str:
+    """
+    "March 2026" for the current month. Formatted at most once a minute
+    and shared by every generator built in that minute.
+    """
+    return _display_date_for(int(time.monotonic()) // 60)
+
+
+# =============================================================================
+# RAG PACKET — typed record handed to the ingestion pipeline
+# =============================================================================
+
+class RAGMeta(NamedTuple):
+    project:             str
+    organization:        str
+    jurisdiction:        str
+    version:             str
+    data_classification: str
+    title:               str
+    category:            str
+    uuid:                str
+    last_modified:       str
+
+
+class RAGPacket(NamedTuple):
+    document_id:  str
+    title:        str
+    category:     str
+    version:      str
+    metadata:     RAGMeta
+    content:      str
+    content_hash: str
+    last_updated: str
+    sections:     Tuple[bytes, ...] = ()     # UTF-8; joined == content
+    structured:   Optional[Dict[str, Any]] = None
+
+
 class BankingPolicyGenerator:
     """
     Enterprise-grade generator for comprehensive banking policies.
@@ -122,10 +1249,23 @@ class BankingPolicyGenerator:
         generator.save_all_policies(Path("./knowledge_base"))
     """
 
+    __slots__ = (
+        "bank_name",
+        "generation_time",
+        "display_date",
+        "system_meta",
+        "_sections",
+        "_contents",
+        "_risk_scores",
+    )
+
     def __init__(self, bank_name: str = "Sentinel Bank Nigeria"):
         self.bank_name = bank_name
+        self._sections: Dict[str, Tuple[bytes, ...]] = {}
+        self._contents: Dict[str, str] = {}
+        self._risk_scores: Optional[Tuple[Tuple, np.ndarray]] = None
         self.generation_time = datetime.now().isoformat()
-        self.display_date = datetime.now().strftime('%B %Y')
+        self.display_date = _current_display_date()
 
         self.system_meta = {
             "project": "AI-Driven Banking Middleware",
@@ -135,30 +1275,98 @@ class BankingPolicyGenerator:
             "data_classification": "Synthetic/Proprietary"
         }
 
+    def iter_policy_sections(self, doc_id: str) -> Iterator[str]:
+        """
+        Yield a document's rendered paragraphs in order for this generator's
+        bank and date. Joining the pieces gives the full document text.
+        """
+        return (section.decode("utf-8")
+                for section in self._document_sections(doc_id))
+
+    def _document_sections(self, doc_id: str) -> Tuple[bytes, ...]:
+        """UTF-8 section fragments of a document for this bank and date."""
+        sections = self._sections.get(self._cache_key(doc_id))
+        if sections is not None:
+            return sections
+        return _rendered_sections(doc_id, self.bank_name, self.display_date)
+
+    def _cache_key(self, doc_id: str) -> str:
+        """
+        Key for sections regenerate() has re-dated in place: the
+        per-instance inputs of the text (document ID, bank name, display
+        date). Templates and constant tables are fixed for the process.
+        """
+        return hashlib.blake2b(
+            f"{doc_id}|{self.bank_name}|{self.display_date}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
     def _package_for_rag(self, doc_id: str, title: str, category: str,
-                         version: str, text: str) -> Dict[str, Any]:
-        return {
-            "document_id": doc_id,
+                         version: str,
+                         text: Union[str, bytes, Iterable[bytes]],
+                         structured_payload: Optional[Dict[str, Any]] = None
+                         ) -> RAGPacket:
+        """
+        Wrap a rendered document in the packet consumed by the RAG pipeline.
+
+        text may be the full string or a document's UTF-8 section
+        fragments, which are kept on the packet as sections; content is
+        decoded from them once, here. It is used as-is: templates carry no
+        leading/trailing whitespace, so callers must pass already-stripped
+        text.
+
+        structured_payload, when given, is a JSON-ready view of the same
+        rules that agents can read without searching the text.
+
+        Every call builds a fresh packet (and metadata uuid) from its own
+        arguments; only the decoded body is memoised, by content_hash, so
+        repackaging an unchanged document skips the decode.
+        """
+        if isinstance(text, str):
+            sections = (text.encode("utf-8"),)
+        elif isinstance(text, bytes):
+            sections = (text,)
+        else:
+            sections = tuple(text)
+
+        # Digest of the body lets the embedding layer detect unchanged
+        # documents without rehashing the text. Fed the encoded sections
+        # directly (same bytes as content), so nothing is re-encoded.
+        digest = hashlib.blake2b(digest_size=16)
+        for section in sections:
+            digest.update(section)
+        content_hash = digest.hexdigest()
+        text = self._contents.get(content_hash)
+        if text is None:
+            text = self._contents[content_hash] = b"".join(sections).decode("utf-8")
+
+        # RAGMeta(**...) raises TypeError if system_meta drifts from the schema.
+        metadata = RAGMeta(**{
+            **self.system_meta,
             "title": title,
             "category": category,
             "version": version,
-            "metadata": {
-                **self.system_meta,
-                "title": title,
-                "category": category,
-                "version": version,
-                "uuid": str(uuid.uuid4()),
-                "last_modified": self.generation_time
-            },
-            "content": text.strip(),
-            "last_updated": self.generation_time
-        }
+            "uuid": str(uuid.uuid4()),
+            "last_modified": self.generation_time
+        })
+        return RAGPacket(
+            document_id=doc_id,
+            title=title,
+            category=category,
+            version=version,
+            metadata=metadata,
+            content=text,
+            content_hash=content_hash,
+            last_updated=self.generation_time,
+            sections=sections,
+            structured=structured_payload,
+        )
 
     # =========================================================================
     # DOCUMENT 1: COMPLAINT HANDLING POLICY (POL-CCH-001)
     # =========================================================================
 
-    def generate_complaint_handling_policy(self) -> Dict:
+    def generate_complaint_handling_policy(self) -> RAGPacket:
         """
         Generate comprehensive complaint handling and routing policy.
 
@@ -174,517 +1382,20 @@ class BankingPolicyGenerator:
           - transaction_status: failed/timeout/reversed → TSU or COC
           - channel: atm/pos → COC; others → TSU
         """
-        policy_content = f"""
-=========================================================================
-{self.bank_name} - CUSTOMER COMPLAINT HANDLING & ROUTING POLICY
-=========================================================================
-
-Document ID     : POL-CCH-001
-Version         : 2.1
-Effective Date  : January 2025
-Classification  : Internal Use Only — AI Agent Operational Reference
-Review Cycle    : Quarterly
-
-=========================================================================
-SECTION 1: PURPOSE & SCOPE
-=========================================================================
-
-This policy establishes standardized, deterministic procedures for
-receiving, classifying, routing, and resolving customer complaints
-across all service channels at {self.bank_name}.
-
-Primary Consumers of This Policy:
-  - Dispatcher Agent: Uses routing rules in Section 2 to assign every
-    inbound complaint to the correct department on first contact.
-  - Sentinel Agent: Uses fraud_related field and FRM routing rules to
-    escalate fraud-linked complaints immediately.
-  - Human supervisors: Use escalation matrix in Section 4 for overrides.
-
-Key Objectives:
-  1. Route complaints to the correct department with >95% accuracy
-     on first contact, eliminating manual re-routing overhead.
-  2. Enforce SLA compliance by department (exact hours in Section 2).
-  3. Provide deterministic escalation paths for every complaint tier.
-  4. Enable full auditability — every routing decision must cite a
-     policy section and department code from this document.
-
-Complaint Intake Channels (complaint_channel field values):
-  - call_center   : Phone call to customer care hotline
-  - mobile_app    : Complaint submitted inside the Sentinel mobile app
-  - email         : Complaint submitted via email
-  - branch        : In-person complaint at any Sentinel Bank branch
-  - social_media  : Twitter, Facebook, Instagram, LinkedIn DMs
-
-
-=========================================================================
-SECTION 2: COMPLAINT CATEGORIES & DEPARTMENT ROUTING
-=========================================================================
-
-ROUTING DECISION LOGIC FOR DISPATCHER AGENT
-─────────────────────────────────────────────
-The Dispatcher Agent MUST evaluate fields in this exact priority order:
-
-  STEP 1: If fraud_related == 1 OR is_fraud_score == 1
-          → Route to FRM (Priority: Critical). STOP. Do not evaluate further.
-
-  STEP 2: If transaction channel (channel field) is "atm" or "pos"
-          AND transaction_status is NOT "successful"
-          → Route to COC (Priority: High). STOP.
-
-  STEP 3: If transaction_status is "failed", "timeout", or "reversed"
-          AND channel is "nibss_transfer", "mobile_app", "web", or "ussd"
-          → Route to TSU (Priority: High). STOP.
-
-  STEP 4: If complaint text references app, login, USSD, crash, error
-          → Route to DCS (Priority: Medium).
-
-  STEP 5: If complaint text references statement, balance, charges,
-          account closure, BVN
-          → Route to AOD (Priority: Medium or Low).
-
-  STEP 6: If complaint text references loan, credit, repayment,
-          disbursement, overdraft
-          → Route to CLS (Priority: Medium).
-
-  DEFAULT: Route to TSU (Priority: Medium).
-
-
-──────────────────────────────────────────────────────────────────────────
-2.1  TRANSACTION SERVICES UNIT (TSU)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : TSU
-Department Name   : Transaction Services Unit
-SLA (Hours)       : 48 hours  ← sla_hours_limit = 48 in dataset
-Team Size         : 12 specialists + 2 managers
-
-HANDLES:
-  - Transfer debited from sender but credit not received by beneficiary
-  - Duplicate debit transactions (same amount charged twice)
-  - Incorrect transaction amounts (wrong figure debited or credited)
-  - Failed interbank NIP/NIBSS transfers (status = "failed" or "timeout")
-  - Reversed transactions that customer disputes (status = "reversed")
-  - Missing inbound credit (expected credit not posted)
-  - Transaction narration or reference number discrepancies
-
-CHANNELS THAT PRIMARILY GENERATE TSU COMPLAINTS:
-  nibss_transfer, mobile_app, ussd, web, branch
-
-PRIORITY ASSIGNMENT RULES FOR TSU:
-  - High   : Amount > ₦100,000 OR status = "failed"/"timeout"/"reversed"
-  - Medium : Amount ≤ ₦100,000 AND status = "successful" (dispute only)
-  - Low    : Narration/reference query, no financial impact
-
-SLA TARGETS:
-  - Acknowledgement    : Within 2 hours
-  - Resolution         : Within 48 hours (business hours)
-  - Reversal (if due)  : Within 24 hours of confirmation
-  - Interbank disputes : Up to 14 days (NIBSS coordination required)
-
-ESCALATION TRIGGERS:
-  - Unresolved after 72 hours
-  - Amount exceeds ₦500,000
-  - Customer threatens regulatory complaint to CBN
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER TSU ROUTING:
-  "transfer", "debit", "not received", "wrong amount",
-  "reversal", "failed transaction", "duplicate charge",
-  "credited", "debited twice", "NIBSS", "interbank"
-
-EXAMPLES:
-  ✓ "I transferred ₦100,000 to GTBank but recipient has not received it."
-  ✓ "My account was debited twice for the same payment."
-  ✓ "ATM did not dispense cash but my account shows debit." (SEE NOTE)
-  ✗ "My card was declined at POS." → Route to COC, not TSU.
-
-NOTE: ATM dispense error (channel = "atm") is COC. Pure interbank
-      transfer failure (channel = "nibss_transfer") is TSU.
-
-
-──────────────────────────────────────────────────────────────────────────
-2.2  CARD OPERATIONS CENTER (COC)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : COC
-Department Name   : Card Operations Center
-SLA (Hours)       : 48 hours  ← sla_hours_limit = 48 in dataset
-Team Size         : 8 specialists + 1 manager
-
-HANDLES:
-  - Card declined at POS terminal or ATM (domestic or international)
-  - Card retained/swallowed by ATM machine
-  - Unauthorized card transactions (card present fraud)
-  - Lost or stolen card blocking requests
-  - PIN reset requests and PIN lock issues
-  - Card activation failures (new card not working)
-  - Chip or magnetic stripe malfunction
-  - Contactless payment failures
-  - Card replacement requests
-
-CHANNELS THAT PRIMARILY GENERATE COC COMPLAINTS:
-  atm, pos
-
-PRIORITY ASSIGNMENT RULES FOR COC:
-  - Critical : Fraud amount > ₦100,000 AND is_fraud_score = 1
-  - High     : ATM card swallowed, POS failure with debit confirmed,
-               card declined while account has sufficient funds
-  - Medium   : PIN reset, card replacement request
-  - Low      : Card information query, contactless setup
-
-SLA TARGETS:
-  - Emergency card blocking   : Immediate (within 5 minutes)
-  - Card replacement          : 3–5 business days
-  - Dispute investigation     : 7–14 days
-  - PIN reset                 : Same day (within 4 hours)
-  - ATM card retrieval        : 24–48 hours
-
-ESCALATION TRIGGERS:
-  - Fraud amount exceeds ₦100,000
-  - Multiple unauthorized transactions on same card
-  - International card fraud (higher complexity)
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER COC ROUTING:
-  "card", "PIN", "swallowed", "declined", "POS", "chip",
-  "contactless", "ATM", "blocked card", "card stolen"
-
-EXAMPLES:
-  ✓ "My card was declined at Shoprite POS even though I have money."
-  ✓ "ATM swallowed my card at First Bank Ikeja branch."
-  ✓ "I see card transactions I did not make."
-  ✗ "My NIBSS transfer was declined." → Route to TSU, not COC.
-
-
-──────────────────────────────────────────────────────────────────────────
-2.3  FRAUD RISK MANAGEMENT (FRM)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : FRM
-Department Name   : Fraud Risk Management
-SLA (Hours)       : 24 hours  ← sla_hours_limit = 24 in dataset
-Team Size         : 6 specialists + 1 senior manager
-Operating Hours   : 24/7 including public holidays
-
-HANDLES:
-  - All transactions where is_fraud_score = 1
-  - All complaints where fraud_related = 1
-  - Suspected unauthorized account access or login
-  - Account takeover (ATO) suspicion
-  - SIM swap fraud concerns
-  - Social engineering scam reports
-  - Phishing attempt reporting
-  - Suspicious beneficiary additions
-  - Multiple authentication failures followed by successful transfer
-
-ROUTING TRIGGER (DETERMINISTIC):
-  IF fraud_related == 1 OR is_fraud_score == 1 → ALWAYS FRM, ALWAYS Critical.
-  This overrides ALL other routing rules. No exceptions.
-
-PRIORITY ASSIGNMENT RULES FOR FRM:
-  - Critical : ALL fraud cases are automatically Critical priority.
-               No FRM complaint is ever assigned Medium or Low.
-
-SLA TARGETS:
-  - Account freeze capability    : Immediate (within 2 minutes)
-  - Investigation initiation     : Within 1 hour of report
-  - Customer notification        : Within 4 hours
-  - Preliminary assessment       : Within 24 hours ← matches sla_hours_limit
-  - Full investigation           : 14–21 days
-  - Police report filing         : Within 48 hours (amounts > ₦1,000,000)
-
-ESCALATION TRIGGERS:
-  - Fraud amount exceeds ₦1,000,000
-  - Suspected insider involvement
-  - Multiple customers affected by same fraud pattern
-  - Media or social media exposure
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER FRM ROUTING:
-  "fraud", "hacked", "unauthorized", "scam", "phishing",
-  "suspicious", "someone used my account", "account takeover",
-  "I did not authorize", "compromised"
-
-EXAMPLES:
-  ✓ "Someone is making transactions on my account that I did not initiate."
-  ✓ "I got a call asking for my OTP and now money is missing."
-  ✓ "My account shows login from a location I have never been to."
-  ✗ "I was charged twice for the same grocery purchase." → Route to TSU.
-
-CRITICAL OPERATIONAL NOTE:
-  NEVER route fraud cases to the IT department or Digital Channels Support.
-  NEVER delay a fraud complaint for documentation — freeze the account
-  first, gather paperwork second. Every minute of delay costs the customer.
-
-
-──────────────────────────────────────────────────────────────────────────
-2.4  DIGITAL CHANNELS SUPPORT (DCS)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : DCS
-Department Name   : Digital Channels Support
-SLA (Hours)       : 72 hours  ← sla_hours_limit = 72 in dataset
-Team Size         : 10 specialists + 2 managers
-
-HANDLES:
-  - Mobile app login failures (password or biometric errors)
-  - Internet banking access problems
-  - USSD service errors (unresponsive *737# or related codes)
-  - App crashes, hangs, or freezes during transactions
-  - Feature malfunction within digital channels
-  - Biometric authentication failures (fingerprint or face ID)
-  - App update issues causing functionality regression
-  - Slow app performance or session timeouts
-  - QR code payment failures
-  - OTP delivery failures linked to app/platform (not SIM issues)
-
-CHANNELS THAT PRIMARILY GENERATE DCS COMPLAINTS:
-  mobile_app, ussd, web
-
-PRIORITY ASSIGNMENT RULES FOR DCS:
-  - High   : Issue prevents all digital transactions for customer
-  - Medium : App feature broken but alternatives exist
-  - Low    : Performance issue, minor UX bug
-
-SLA TARGETS:
-  - Level 1 troubleshooting  : Immediate (phone or in-app chat)
-  - Technical escalation     : Within 4 hours
-  - Resolution               : 24–72 hours ← matches sla_hours_limit
-
-ESCALATION TRIGGERS:
-  - Issue affects multiple customers simultaneously (systemic outage)
-  - Security vulnerability suspected in digital channel
-  - App completely unusable (no transactions possible)
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER DCS ROUTING:
-  "app", "login", "password", "internet banking", "USSD",
-  "crash", "freeze", "error message", "biometric", "fingerprint",
-  "face ID", "mobile app", "not loading"
-
-EXAMPLES:
-  ✓ "I cannot log into the mobile app. It says wrong password."
-  ✓ "The app crashes every time I try to initiate a transfer."
-  ✓ "USSD *737# is not responding at all."
-  ✗ "My transfer failed after I logged in." → Route to TSU, not DCS.
-
-
-──────────────────────────────────────────────────────────────────────────
-2.5  ACCOUNT OPERATIONS DEPARTMENT (AOD)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : AOD
-Department Name   : Account Operations Department
-SLA (Hours)       : 72 hours  ← sla_hours_limit = 72 in dataset
-Team Size         : 15 specialists + 3 managers
-
-HANDLES:
-  - Account statement requests (any date range)
-  - Account balance discrepancy inquiries
-  - Account closure requests
-  - Service charge disputes (maintenance fees, SMS fees)
-  - Account type upgrade or downgrade requests
-  - Name or address update issues
-  - BVN linking or update issues
-  - NIN linking requests
-  - Dormant account reactivation
-  - Account freeze (non-fraud related)
-  - Cheque-related issues
-
-PRIORITY ASSIGNMENT RULES FOR AOD:
-  - High   : Balance discrepancy > ₦100,000, regulatory compliance issue
-  - Medium : Account modification, BVN/NIN update
-  - Low    : Statement request, service charge query, general account info
-
-SLA TARGETS:
-  - Statement generation      : Within 24 hours
-  - Balance inquiry           : Immediate to 4 hours
-  - Account modification      : 2–3 business days
-  - Account closure           : 5–7 business days
-  - BVN/NIN updates           : 24–48 hours
-
-ESCALATION TRIGGERS:
-  - Regulatory compliance issue
-  - High-value customer (private banking tier)
-  - Legal or court-mandated account action
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER AOD ROUTING:
-  "statement", "balance", "close account", "charges",
-  "upgrade", "update details", "BVN", "NIN", "dormant",
-  "maintenance fee", "account freeze"
-
-EXAMPLES:
-  ✓ "I need a bank statement for the last 6 months for a visa application."
-  ✓ "Why am I being charged a monthly maintenance fee?"
-  ✓ "I want to close my savings account."
-  ✗ "I want to check if my interbank transfer was received." → TSU.
-
-
-──────────────────────────────────────────────────────────────────────────
-2.6  CREDIT & LOAN SERVICES (CLS)
-──────────────────────────────────────────────────────────────────────────
-Department Code   : CLS
-Department Name   : Credit & Loan Services
-SLA (Hours)       : 96 hours  ← sla_hours_limit = 96 in dataset
-Team Size         : 6 specialists + 1 manager
-
-HANDLES:
-  - Loan disbursement delays or failures
-  - Interest calculation disputes
-  - Repayment schedule issues or missed auto-debit
-  - Credit limit increase requests
-  - Loan restructuring requests
-  - Early repayment and settlement queries
-  - Loan documentation problems
-  - Overdraft facility queries and disputes
-
-PRIORITY ASSIGNMENT RULES FOR CLS:
-  - High   : Loan amount > ₦5,000,000, customer threatens default
-  - Medium : Standard loan queries, repayment schedule issues
-  - Low    : Information requests about loan products
-
-SLA TARGETS:
-  - Query response             : Within 48 hours
-  - Disbursement issue         : 3–5 business days
-  - Credit review              : 7–14 days
-  - Restructuring decision     : 14–21 days ← matches sla_hours_limit = 96h for first contact
-
-COMPLAINT TEXT KEYWORDS THAT TRIGGER CLS ROUTING:
-  "loan", "credit", "disbursement", "interest", "repayment",
-  "overdraft", "restructure", "settlement", "installment"
-
-EXAMPLES:
-  ✓ "My loan was approved but money has not been disbursed."
-  ✓ "The interest on my car loan seems higher than agreed."
-  ✓ "I want to pay off my personal loan early."
-  ✗ "My salary credit is missing." → Route to TSU, not CLS.
-
-
-=========================================================================
-SECTION 3: COMPLAINT PRIORITY CLASSIFICATION
-=========================================================================
-
-PRIORITY MATRIX — EXACT FIELD VALUES USED IN DATASET:
-
-┌──────────┬──────────────────────────────────────────────────────────┐
-│ Priority │ Criteria                                                 │
-├──────────┼──────────────────────────────────────────────────────────┤
-│ Critical │ - fraud_related = 1 OR is_fraud_score = 1 (always)      │
-│          │ - Account access fully blocked (cannot transact)         │
-│          │ - Large unauthorized transfer > ₦500,000                 │
-│          │ - Suspected account takeover (ATO)                       │
-│          │ - SIM swap with simultaneous high-value transfer         │
-│          │ Response: IMMEDIATE (within 5 minutes)                   │
-├──────────┼──────────────────────────────────────────────────────────┤
-│ High     │ - ATM card retention (channel = "atm")                   │
-│          │ - Failed high-value transaction (₦100,000–₦500,000)      │
-│          │ - Repeated service failure (same issue 3+ times)         │
-│          │ - Corporate/business account issue                       │
-│          │ - International transaction problems                     │
-│          │ Response: Within 2 hours                                 │
-├──────────┼──────────────────────────────────────────────────────────┤
-│ Medium   │ - Standard transaction dispute < ₦100,000                │
-│          │ - App technical issue (non-critical)                     │
-│          │ - Service charge query                                   │
-│          │ - Statement request                                      │
-│          │ - General card issue (non-fraud)                         │
-│          │ Response: Within 4 hours                                 │
-├──────────┼──────────────────────────────────────────────────────────┤
-│ Low      │ - General inquiries (no financial impact)                │
-│          │ - Product information requests                           │
-│          │ - Non-urgent statement requests                          │
-│          │ - Educational queries                                    │
-│          │ Response: Within 24 hours                                │
-└──────────┴──────────────────────────────────────────────────────────┘
-
-
-=========================================================================
-SECTION 4: ESCALATION MATRIX
-=========================================================================
-
-LEVEL 1 — First Contact Resolution (FCR)
-  Handler    : Customer Service Representative (CSR) or AI Agent
-  Target     : 70% of complaints resolved at this level
-  Trigger Up : Cannot resolve within SLA OR requires specialist access
-
-LEVEL 2 — Specialist Escalation
-  Handler    : Departmental specialist (subject matter expert)
-  Target     : 25% of complaints escalate here
-  Trigger    : Level 1 SLA breached (sla_breach_flag = 1) OR complexity
-               requires backend system access OR high-value customer
-  Trigger Up : Unresolved after 48 hours OR customer escalation request
-
-LEVEL 3 — Management Escalation
-  Handler    : Department manager or team lead
-  Target     : ~4% of complaints escalate here
-  Trigger    : 7 days unresolved OR legal threat OR private banking client
-               OR media attention OR customer complaint to CBN
-  Trigger Up : 14 days unresolved OR regulatory involvement
-
-LEVEL 4 — Executive Escalation
-  Handler    : Executive Committee (C-level)
-  Target     : < 1% of complaints reach this level
-  Trigger    : CBN formal inquiry, systemic failure, board-level risk,
-               insider fraud suspicion, viral media damage
-
-
-=========================================================================
-SECTION 5: PROHIBITED ACTIONS
-=========================================================================
-
-1. NEVER route fraud_related=1 complaints to any department other than FRM.
-2. NEVER delay account freeze when fraud is suspected — act first, document second.
-3. NEVER promise resolution within a timeframe shorter than the SLA hours in Section 2.
-4. NEVER share customer PII via WhatsApp, personal email, or unencrypted SMS.
-5. NEVER close a complaint ticket without customer confirmation of resolution.
-6. NEVER route based on the intake channel — route based on issue type only.
-7. NEVER route an FRM complaint to DCS or TSU even if the fraud occurred on a
-   digital channel or during a failed transfer.
-
-
-=========================================================================
-SECTION 6: DOCUMENTATION REQUIREMENTS
-=========================================================================
-
-MANDATORY FIELDS (all must be populated before ticket routing):
-
-  complaint_id              : System-generated (format: CMP-XXXXXX)
-  customer_id               : Account or customer UUID from system
-  linked_transaction_id     : UUID from transactions table (if applicable)
-  linked_reference          : transaction_reference_number (if applicable)
-  department_code           : TSU | COC | FRM | DCS | AOD | CLS
-  department_name           : Full name matching department_code
-  priority_level            : Critical | High | Medium | Low
-  sentiment                 : angry | neutral | calm
-  complaint_channel         : call_center | mobile_app | email | branch | social_media
-  assigned_agent_id         : Agent ID from department roster
-  complaint_timestamp       : ISO datetime of complaint receipt
-  sla_hours_limit           : Exact SLA hours from Section 2 per department
-  sla_breach_flag           : 1 if resolution_time_hours > sla_hours_limit; else 0
-  fraud_related             : 1 if is_fraud_score = 1; else 0
-  complaint_text            : Full verbatim customer complaint text
-  complaint_status          : open | resolved | escalated
-
-
-=========================================================================
-SECTION 7: POLICY OWNERSHIP & GOVERNANCE
-=========================================================================
-
-Policy Owner    : Head of Customer Experience
-Approver        : Chief Operations Officer (COO)
-Review Cycle    : Quarterly
-Last Updated    : {self.display_date}
-Contact         : customer.experience@sentinelbank.ng | Ext. 5000
-
-
-=========================================================================
-END OF DOCUMENT POL-CCH-001
-=========================================================================
-"""
+        sections = self._document_sections("POL-CCH-001")
         return self._package_for_rag(
             "POL-CCH-001",
             "Customer Complaint Handling Policy",
             "policy",
             "2.1",
-            policy_content
+            sections
         )
 
     # =========================================================================
     # DOCUMENT 2: FRAUD DETECTION GUIDELINES (FRM-001)
     # =========================================================================
 
-    def generate_fraud_detection_guidelines(self) -> Dict:
+    def generate_fraud_detection_guidelines(self) -> RAGPacket:
         """
         Generate exhaustive fraud detection and prevention guidelines.
 
@@ -703,374 +1414,20 @@ END OF DOCUMENT POL-CCH-001
             supermarket, restaurants, fuel, transport, telecoms,
             utilities, fintech, education, healthcare
         """
-        guidelines = f"""
-=========================================================================
-{self.bank_name} - FRAUD DETECTION & PREVENTION GUIDELINES
-=========================================================================
-
-Document Code       : FRM-001
-Classification      : CONFIDENTIAL — AI Agent Operational Reference
-Version             : 4.0
-Effective Date      : January 2026
-Review Frequency    : Monthly
-
-Document Owner      : Chief Risk Officer (CRO)
-Emergency Contact   : fraud-desk@sentinelbank.ng (Active 24/7)
-
-
-=========================================================================
-SECTION 1: FRAUD EXPLAINABILITY TRACE FLAGS
-=========================================================================
-
-CRITICAL ALIGNMENT NOTE FOR SENTINEL AGENT:
-The fraud_explainability_trace field in transactions.csv contains a
-comma-separated list of flags from the set below. The field contains
-"normal_pattern" when no fraud is detected. The Sentinel Agent MUST
-parse this field and map each flag to its risk weight using this section.
-
-Each flag has a fixed risk weight (points). Risk score = sum of all
-active flags, capped at 100. See Section 2 for thresholds and actions.
-
-──────────────────────────────────────────────────────────────────────────
-FLAG: mobile_channel_risk
-──────────────────────────────────────────────────────────────────────────
-Risk Weight       : +15 points
-Trigger Condition : Transaction channel = "mobile_app"
-                    AND is_fraud_score = 1
-Definition        : Transaction was initiated via the mobile application
-                    on a device that may not be the customer's primary
-                    registered device, or the session exhibits behavioral
-                    anomalies (velocity, geolocation, device fingerprint).
-Why It Matters    : Mobile banking is the primary attack surface for
-                    account takeover (ATO) and SIM-swap fraud in Nigeria.
-                    Fraudsters use stolen credentials on fresh devices.
-Standalone Action : +15 points added to risk score. Combine with other
-                    flags to determine final action.
-Example           : txn with channel="mobile_app" + is_fraud_score=1
-                    → mobile_channel_risk flag present in trace
-
-
-──────────────────────────────────────────────────────────────────────────
-FLAG: high_amount_spike
-──────────────────────────────────────────────────────────────────────────
-Risk Weight       : +25 points
-Trigger Condition : Transaction amount > (account current_balance × 0.6)
-                    AND is_fraud_score = 1
-Definition        : The transaction amount represents more than 60% of
-                    the account's current balance, indicating an attempt
-                    to rapidly drain the account in a single transaction.
-Why It Matters    : Fraudsters who gain account access attempt to extract
-                    the maximum possible amount in one move before
-                    detection. High percentage-of-balance withdrawals are
-                    a primary indicator of account draining behavior.
-Standalone Action : +25 points added to risk score.
-Example           : balance=₦750,000, amount=₦500,000 → 66.7% of balance
-                    → high_amount_spike flag triggered
-
-
-──────────────────────────────────────────────────────────────────────────
-FLAG: multiple_failures
-──────────────────────────────────────────────────────────────────────────
-Risk Weight       : +20 points
-Trigger Condition : transaction_status = "failed"
-                    AND is_fraud_score = 1
-Definition        : The transaction failed after being initiated, but
-                    the attempt itself indicates abnormal retry behavior,
-                    rapid successive attempts, or credential testing
-                    consistent with brute-force or card-testing attacks.
-Why It Matters    : Fraudsters test card details or account credentials
-                    by making small or repeated failed transactions to
-                    identify valid combinations before executing large
-                    unauthorized transfers.
-Standalone Action : +20 points added to risk score.
-Example           : status="failed" + is_fraud_score=1 → flag present
-
-
-──────────────────────────────────────────────────────────────────────────
-FLAG: normal_pattern
-──────────────────────────────────────────────────────────────────────────
-Risk Weight       : 0 points
-Trigger Condition : No fraud flags detected (is_fraud_score = 0 AND
-                    no behavioral anomalies present)
-Definition        : Transaction aligns with the customer's historical
-                    behavioral patterns: known device, usual channel,
-                    typical amount range, normal timing.
-Action            : Process transaction without friction. Issue standard
-                    SMS/app confirmation alert after completion.
-
-
-=========================================================================
-SECTION 2: RISK SCORE CALCULATION & ACTION THRESHOLDS
-=========================================================================
-
-CALCULATION METHOD:
-  risk_score = SUM of all active flag weights (from Section 1 + FRM-002)
-  risk_score is CAPPED at 100.
-
-EXAMPLE CALCULATION:
-  mobile_channel_risk:   +15 points
-  high_amount_spike:     +25 points
-  merchant (fintech):    +25 points  [from FRM-002]
-  ─────────────────────────────────
-  Total:                  65 points → HIGH risk level
-
-──────────────────────────────────────────────────────────────────────────
-RISK LEVEL: LOW  (Score 0–30)
-──────────────────────────────────────────────────────────────────────────
-Assessment      : Transaction aligns with normal customer behavior.
-                  Known device, typical amount, expected channel.
-Action          : PROCESS IMMEDIATELY — no challenge or friction.
-Notification    : SMS + App push after transaction completes.
-                  "You sent ₦X to [Name] via Sentinel Bank."
-Channel Action  : All channels proceed normally.
-
-──────────────────────────────────────────────────────────────────────────
-RISK LEVEL: MEDIUM  (Score 31–60)
-──────────────────────────────────────────────────────────────────────────
-Assessment      : Single anomaly detected. Unusual but not definitively
-                  fraudulent (e.g., new merchant, slightly elevated amount).
-Action          : STEP-UP AUTHENTICATION via OTP.
-                  - Send SMS OTP to registered phone number.
-                  - OR email OTP to registered email.
-                  - Hold transaction in "Pending" state for 5 minutes.
-                  - Auto-decline if OTP not entered within 5 minutes.
-Notification    : "We detected unusual activity. Confirm with OTP sent
-                  to 080****1234."
-Channel Caveat  : If SIM swap detected in last 48 hours, escalate to HIGH
-                  and use push-to-app instead of SMS OTP.
-
-──────────────────────────────────────────────────────────────────────────
-RISK LEVEL: HIGH  (Score 61–85)
-──────────────────────────────────────────────────────────────────────────
-Assessment      : Multiple anomalies present. Strong fraud indicators.
-                  Transaction should not proceed without explicit biometric
-                  customer approval.
-Action          : MANDATORY PUSH-TO-APP BIOMETRIC CHALLENGE.
-                  Step 1: Place transaction in "Pending - Security Check".
-                  Step 2: Send encrypted push notification to registered app.
-                  Step 3: Display in app:
-                          - Beneficiary Name (bold)
-                          - Beneficiary Bank
-                          - Amount + fees
-                          - Risk reason (e.g., "New device detected")
-                          - Transaction reference
-                  Step 4: Customer must tap APPROVE or REJECT.
-                  Step 5: APPROVE requires biometric (FaceID/Fingerprint/PIN).
-                  Step 6: 5-minute timeout → auto-decline if no response.
-requires_challenge : True
-should_block       : False
-Notification    : "Security Alert: Verify this transaction in your
-                  Sentinel app."
-
-──────────────────────────────────────────────────────────────────────────
-RISK LEVEL: CRITICAL  (Score 86–100)
-──────────────────────────────────────────────────────────────────────────
-Assessment      : Pattern matches confirmed fraud profile. Transaction
-                  must not proceed under any circumstances.
-Action          : BLOCK TRANSACTION IMMEDIATELY.
-                  Step 1: Decline transaction instantly (no OTP/challenge).
-                  Step 2: Freeze account — ALL channels disabled.
-                  Step 3: Block all cards linked to account.
-                  Step 4: Disable mobile app, internet banking, USSD.
-                  Step 5: Generate URGENT FRM alert (highest priority queue).
-                  Step 6: Send security alert to registered EMAIL only
-                          (NOT SMS — phone number may be compromised).
-                  Step 7: Assign to FRM specialist within 30 minutes.
-requires_challenge : False
-should_block       : True
-Notification    : Email: "Your account has been temporarily frozen due to
-                  suspicious activity. Contact: fraud-desk@sentinelbank.ng"
-
-
-=========================================================================
-SECTION 3: PUSH-TO-APP AUTHORIZATION PROTOCOL
-=========================================================================
-
-WHY PUSH-TO-APP REPLACES SMS OTP:
-  - SIM swap attacks intercept SMS — push-to-app is device-bound.
-  - OTP via SMS can be delayed; push is near-instant.
-  - Biometric binding means only the real customer can approve.
-  - Full transaction details shown — customer knows exactly what to approve.
-
-COMPLETE PUSH-TO-APP SEQUENCE:
-  1. Transaction placed in "Pending - Security Verification" (max 300 seconds)
-  2. Encrypted push notification sent to registered device (device-specific key)
-  3. App displays full transaction context:
-       - Beneficiary full name
-       - Beneficiary bank name
-       - Principal amount
-       - NIP transfer fee (if applicable)
-       - Cybersecurity levy (0.5% of principal)
-       - Total debit from account
-       - Risk reason triggering the challenge
-       - Unique transaction reference number
-  4. Customer taps APPROVE or REJECT (large, clear buttons)
-  5. APPROVE flow:
-       - FaceID / Fingerprint / 6-digit secure transaction PIN required
-       - Transaction processed immediately on biometric success
-       - Confirmation: "Transaction successful — ₦X sent to [Name]"
-  6. REJECT flow:
-       - Transaction cancelled immediately
-       - Account access blocked (security hold)
-       - FRM alert generated (URGENT priority)
-       - SMS: "Transaction blocked per your request. Account frozen.
-               Contact fraud-desk@sentinelbank.ng"
-       - FRM specialist assigned within 30 minutes
-  7. TIMEOUT flow (no response in 5 minutes):
-       - Transaction auto-declined
-       - SMS: "Transaction timed out. If you did not initiate this,
-               contact us immediately."
-       - Account flagged for review (not frozen yet)
-
-
-=========================================================================
-SECTION 4: COMMON FRAUD SCENARIOS IN NIGERIA (2026)
-=========================================================================
-
-4.1 SIM SWAP FRAUD
-──────────────────────────────────────────────────────────────────────────
-Attack Pattern:
-  1. Fraudster obtains customer BVN/NIN via phishing or data breach.
-  2. Fraudster presents fake ID at MNO store to swap phone number to new SIM.
-  3. Fraudster now receives all SMS including banking OTPs.
-  4. Fraudster resets banking password using SMS OTP.
-  5. Fraudster drains account before customer notices.
-
-Detection:
-  - Real-time SIM swap detection via MNO API query on every login.
-  - SIM swap in last 48 hours → automatic 48-hour transfer freeze.
-  - Notify customer via EMAIL only (SMS compromised).
-
-Mitigation:
-  - Push-to-app replaces SMS OTP as primary challenge method.
-  - Branch visit required to reactivate transfers after SIM swap.
-  - Biometric re-enrollment mandatory after SIM swap event.
-
-4.2 ACCOUNT TAKEOVER (ATO)
-──────────────────────────────────────────────────────────────────────────
-Fraud Trace Flags Commonly Present:
-  mobile_channel_risk + high_amount_spike (two flags → 40 points minimum)
-
-Attack Pattern:
-  1. Fraudster obtains login credentials via phishing.
-  2. Fraudster changes registered email and phone in account profile.
-  3. Fraudster resets password (OTP goes to fraudster's new contact).
-  4. Fraudster withdraws maximum amount.
-
-Detection:
-  - Profile change alert sent to OLD contact immediately.
-  - 24-hour cooling-off period after profile changes before high-value
-    transfers are permitted.
-  - New device flag (mobile_channel_risk) triggers on first login.
-
-4.3 PHISHING & SOCIAL ENGINEERING
-──────────────────────────────────────────────────────────────────────────
-Attack Pattern:
-  1. Customer receives call/SMS from "bank official."
-  2. Fraudster creates urgency: "Your account will be blocked!"
-  3. Fraudster obtains OTP/PIN from panicked customer.
-  4. Fraudster completes transfer while on call with customer.
-
-Detection:
-  - In-app warning during high-risk transfers:
-    "SENTINEL BANK WILL NEVER ASK FOR YOUR PIN VIA PHONE.
-    Are you being pressured into this transaction? If YES, tap REJECT."
-
-4.4 POS & AGENCY BANKING FRAUD
-──────────────────────────────────────────────────────────────────────────
-Flags: multiple_failures (card testing at POS terminals)
-
-Detection:
-  - Duplicate charge detection: same terminal, similar amount (±5%),
-    within 5 minutes → auto-reverse second charge.
-  - Unusual terminal activity pattern → terminal blacklist.
-
-4.5 FINTECH & CRYPTO FRAUD
-──────────────────────────────────────────────────────────────────────────
-Merchant Category: fintech (high-risk per FRM-002)
-
-Pattern:
-  - Large one-time transfers to fintech gateways from accounts with no
-    prior fintech transaction history.
-  - Elderly or "Vulnerable" segment customers sending to crypto exchanges.
-
-Detection:
-  - Combine merchant_category="fintech" risk (+25 from FRM-002) with
-    mobile_channel_risk or high_amount_spike for composite score.
-
-
-=========================================================================
-SECTION 5: FRAUD RESPONSE PROTOCOLS
-=========================================================================
-
-IMMEDIATE (Automated within 2 minutes of Critical detection):
-  - Freeze account (all channels)
-  - Block all linked cards
-  - Disable app, internet banking, USSD
-  - Send security alert to registered EMAIL only
-  - Generate urgent FRM alert (highest priority)
-  - Log all transactions from last 48 hours for forensics
-
-WITHIN 1 HOUR:
-  - FRM specialist assigned
-  - Preliminary investigation: transaction logs, device IDs, locations
-  - Customer contacted via original registered contact (not new details)
-  - Temporary credit up to ₦200,000 if customer confirmed as victim
-
-WITHIN 24 HOURS (SLA target for FRM):
-  - Full forensic analysis: IP, device fingerprint, network/money trail
-  - NIBSS coordination if funds transferred out
-  - Contact destination bank to freeze beneficiary account
-  - Police report filed (amounts > ₦1,000,000)
-  - Preliminary determination: customer fraud vs. bank fraud
-
-RESOLUTION (14–21 DAYS):
-  - Full investigation report
-  - Permanent credit/debit adjustments
-  - Account reactivation with new credentials
-  - Fraud database updates (blacklist devices, beneficiaries, patterns)
-  - Customer education session
-
-
-=========================================================================
-SECTION 6: REGULATORY COMPLIANCE REFERENCES
-=========================================================================
-
-  - CBN Consumer Protection Framework
-  - Nigeria Data Protection Regulation (NDPR) 2019
-  - CBN Guidance on Electronic Fraud Management (revised 2024)
-  - CBN Exposure Draft on Cyber Resilience (2025)
-  - ISO 27001 Information Security Management
-  - PCI DSS v4.0
-
-
-=========================================================================
-DOCUMENT CONTROL
-=========================================================================
-
-Owner           : Chief Risk Officer (CRO)
-Review Freq     : Monthly
-Last Updated    : {self.display_date}
-Emergency       : fraud-desk@sentinelbank.ng | +234-1-FRAUD-24 (24/7)
-
-
-=========================================================================
-END OF DOCUMENT FRM-001
-=========================================================================
-"""
+        sections = self._document_sections("FRM-001")
         return self._package_for_rag(
             "FRM-001",
             "Fraud Detection & Prevention Guidelines",
             "security",
             "4.0",
-            guidelines
+            sections
         )
 
     # =========================================================================
     # DOCUMENT 3: TRANSACTION PROCESSING POLICIES (TSU-POL-002)
     # =========================================================================
 
-    def generate_transaction_policies(self) -> Dict:
+    def generate_transaction_policies(self) -> RAGPacket:
         """
         Generate comprehensive transaction processing policies.
 
@@ -1086,530 +1443,39 @@ END OF DOCUMENT FRM-001
             compliance_restriction, suspected_fraud, issuer_unavailable
           - currency: NGN
         """
-        policies = f"""
-=========================================================================
-{self.bank_name} - TRANSACTION PROCESSING & LIMITS POLICY
-=========================================================================
-
-Document ID     : TSU-POL-002
-Version         : 4.0
-Effective Date  : January 2026
-Classification  : Internal Use Only — AI Agent Operational Reference
-
-Policy Custodian : Head of Transaction Services
-Last Review      : {self.display_date}
-Next Review      : May 2026
-
-
-=========================================================================
-SECTION 1: TRANSACTION STATUS DEFINITIONS
-=========================================================================
-
-The transaction_status field in transactions.csv can hold the following
-values. Every downstream agent must understand what each status means
-before making a routing or response decision.
-
-STATUS: successful
-  Definition   : Transaction completed without error. Funds moved as
-                 intended. No agent action required unless customer disputes.
-  failure_reason: "none"
-  Agent Action  : No action. Send standard confirmation alert.
-
-STATUS: failed
-  Definition   : Transaction was initiated but could not be completed due
-                 to a system, network, or compliance error. The debit was
-                 NOT applied (or will be auto-reversed within 24 hours).
-  failure_reason: insufficient_fund | network_error | system_failure |
-                  system_timeout | invalid_account_number |
-                  daily_transaction_limit_exceeded | compliance_restriction |
-                  suspected_fraud | issuer_unavailable
-  Agent Action  : Route to TSU. Priority = High if amount > ₦100,000.
-
-STATUS: reversed
-  Definition   : Transaction was initially processed but subsequently
-                 reversed. Funds returned to originating account.
-  failure_reason: varies (often "network_error" or "system_failure")
-  Agent Action  : Route to TSU if customer disputes the reversal.
-
-STATUS: pending
-  Definition   : Transaction submitted but not yet processed. Awaiting
-                 network confirmation or authorization step.
-  Agent Action  : Monitor. Escalate to TSU if pending > 30 minutes.
-
-STATUS: timeout
-  Definition   : Transaction was not completed within the network timeout
-                 window. System could not confirm success or failure.
-  failure_reason: "system_timeout"
-  Agent Action  : Route to TSU. Priority = High (may or may not have debited).
-
-STATUS: queued
-  Definition   : Transaction received and queued for batch processing.
-                 Common for scheduled payments and bulk transfers.
-  Agent Action  : No immediate action. Notify customer of expected processing
-                  time.
-
-STATUS: processing
-  Definition   : Transaction is actively being processed by the payment
-                 switch. Intermediate state before "successful" or "failed."
-  Agent Action  : No action. Monitor for final status update.
-
-
-=========================================================================
-SECTION 2: KYC TIERING & TRANSACTION LIMITS
-=========================================================================
-
-TIER 1 — BASIC KYC
-  Account Types     : savings (newly onboarded, limited KYC)
-  Requirements      : Name + Phone number only
-  Daily Tx Limit    : ₦50,000
-  Max Balance       : ₦300,000
-  Monthly Limit     : ₦200,000
-  Channels Allowed  : ussd, branch, nibss_transfer (low value only)
-  Restrictions      : NO international transactions
-                      NO card issuance
-                      NO loans
-  failure_reason if exceeded: "daily_transaction_limit_exceeded"
-                               OR "compliance_restriction"
-
-TIER 2 — INTERMEDIATE KYC
-  Account Types     : savings + solo (for ages 16–30)
-  Requirements      : Tier 1 + BVN + NIN
-  Daily Tx Limit    : ₦200,000
-  Max Balance       : ₦500,000
-  Monthly Limit     : ₦2,000,000
-  Channels Allowed  : mobile_app, ussd, atm, pos, web, branch,
-                      nibss_transfer
-  Restrictions      : NO international transfers
-                      Investment products restricted
-                      Loans capped at ₦500,000
-
-TIER 3 — FULL KYC
-  Account Types     : current (full banking, business-grade)
-  Requirements      : Tier 2 + Address verification + Valid photo ID
-                      + Utility bill (< 3 months old)
-  Daily Tx Limit    : ₦5,000,000
-  Max Balance       : Unlimited
-  Monthly Limit     : Unlimited
-  Channels Allowed  : ALL channels including international SWIFT
-  Benefits          : Full product suite, loans up to ₦50,000,000,
-                      investment products, private banking (if balance
-                      consistently > ₦10,000,000)
-
-
-=========================================================================
-SECTION 3: STATUTORY LEVIES (MANDATORY — CANNOT BE WAIVED)
-=========================================================================
-
-Electronic Money Transfer Levy (EMTL)
-  Rate         : Flat ₦50.00
-  Applied to   : Inbound (CREDIT) transactions ≥ ₦10,000
-  Direction    : Deducted from recipient (you receive ₦X, ₦50 deducted)
-  Legal Basis  : Stamp Duties Act 2020
-
-National Cybersecurity Levy
-  Rate         : 0.5% of transaction value
-  Applied to   : Outbound (DEBIT) electronic transfers
-  Example      : Send ₦100,000 → Cybersecurity levy = ₦500
-  Legal Basis  : Cybercrimes Act 2024 (Section 44)
-  Exemptions   : Internal transfers (same bank), salary payroll,
-                 loan disbursements
-
-Value Added Tax (VAT)
-  Rate         : 7.5% applied to BANK FEES only (not principal)
-  Example      : NIP fee = ₦50 → VAT = ₦3.75
-  Note         : Principal amount is NOT subject to VAT
-
-
-=========================================================================
-SECTION 4: CHANNEL-SPECIFIC TRANSACTION RULES
-=========================================================================
-
-CHANNEL: mobile_app
-  Daily Limit       : Up to Tier limit
-  OTP Required      : For amounts > ₦50,000 (Tier 2 and above)
-  Push Challenge    : For amounts > ₦200,000 OR fraud flag present
-  Device Binding    : Transactions from unrecognized device → mobile_channel_risk flag
-
-CHANNEL: ussd
-  Daily Limit       : ₦50,000 (Tier 1 cap applies across all USSD sessions)
-  Fee               : ₦6.98 per USSD session
-  OTP               : Not applicable (PIN-based authentication only)
-
-CHANNEL: atm
-  Daily Withdrawal Limit  : ₦100,000 (standard) | ₦200,000 (premium)
-  Per-Transaction Max     : ₦40,000 per withdrawal (most ATMs)
-  Fee (own bank ATMs)     : First 3 free per month, then ₦65 each
-  Fee (other bank ATMs)   : ₦65 per transaction (no free tier)
-  Dispense Error Protocol : If ATM debits but does not dispense cash:
-                            auto-reversal within 24 hours after reconciliation
-  failure_reason if no funds: "insufficient_fund"
-  failure_reason if limit exceeded: "daily_transaction_limit_exceeded"
-
-CHANNEL: pos
-  Daily Limit          : ₦500,000 (all cards on account combined)
-  Per-Transaction Max  : ₦200,000
-  PIN Required         : Always
-  OTP Required         : For amounts > ₦100,000
-  Contactless Limit    : ₦15,000 per tap; PIN required for ≥ ₦5,000
-  Contactless PIN Rule : Required after 5 consecutive contactless taps
-  Duplicate Detection  : Same terminal + similar amount (±5%) + within
-                         5 minutes → auto-reverse second charge
-
-CHANNEL: web
-  Daily Limit          : ₦500,000
-  3D Secure            : Mandatory (Visa/Mastercard SecureCode)
-  Push Challenge       : Required for amounts > ₦100,000
-  Blocked Categories   : Adult content, cryptocurrency (requires approval),
-                         gambling (opt-in required)
-
-CHANNEL: branch
-  Daily Limit          : Per Tier limit (counter withdrawals)
-  ID Required          : Valid government-issued photo ID
-  Large Cash           : Amounts > ₦5,000,000 require 24-hour pre-notice
-
-CHANNEL: nibss_transfer
-  Processing Time      : 2–5 minutes (normal), up to 2 hours (peak periods)
-  Peak Periods         : Month-end (25th–30th), Friday evenings
-  Maintenance Windows  : 2:00 AM – 6:00 AM WAT (announced in advance)
-  failure_reason codes : network_error, system_timeout, issuer_unavailable,
-                         invalid_account_number
-
-
-=========================================================================
-SECTION 5: REVERSAL POLICIES
-=========================================================================
-
-AUTOMATIC REVERSALS (No customer action required):
-
-  Internal Transfer Failure
-    Timeline    : Within 24 hours (usually within 2 hours)
-    Process     : Automatic system reversal
-    Notification: SMS + App push → "₦X credited back to your account."
-
-  NIP/Interbank Transfer Failure
-    Timeline    : 48–72 hours (NIBSS coordination required)
-    Process     : TSU initiates NIBSS trace and recall
-    Status Flow : failed/timeout → TSU investigation → reversal or credit
-
-  ATM Dispense Error
-    Timeline    : Within 24 hours after terminal cash reconciliation
-    Process     : Terminal count vs. transaction log comparison
-    Notification: SMS → "ATM reversal: ₦X credited to your account."
-
-MANUAL REVERSAL REQUESTS (Customer must initiate via TSU):
-
-  Eligible: Wrong account, duplicate transaction, amount error
-  Process : TSU investigates → contacts beneficiary bank → requests recall
-  Timeline: 2–14 days depending on beneficiary response
-
-REVERSAL NOT POSSIBLE — CUSTOMER BEARS LOSS:
-  1. Beneficiary bank confirms credit AND withdrawal (funds withdrawn)
-  2. Value consummated (airtime loaded, bills paid, subscriptions activated)
-  3. Funds transferred onward by beneficiary (money not in original account)
-  4. Request made > 60 days after transaction (chargeback window expired)
-
-
-=========================================================================
-SECTION 6: FAILURE REASON CODES — AGENT INTERPRETATION GUIDE
-=========================================================================
-
-failure_reason         → Meaning & Recommended Agent Action
-─────────────────────────────────────────────────────────────────────────
-none                   → No failure. Transaction successful.
-insufficient_fund      → Customer balance insufficient. Advise customer
-                         to top up and retry. No reversal needed.
-network_error          → NIBSS or switch connectivity issue. Auto-reversal
-                         expected. Route to TSU if not reversed in 2 hours.
-system_failure         → Core banking or middleware error. Escalate to TSU
-                         immediately. Check if account was debited.
-system_timeout         → Transaction timed out in switch. Outcome unknown.
-                         TREAT AS FAILED until confirmed. Route to TSU.
-invalid_account_number → Beneficiary account number does not exist or is
-                         inactive. No debit applied. Advise customer to
-                         verify account number and retry.
-daily_tx_limit_exceeded→ Customer has hit their KYC tier daily limit.
-                         Advise on limit and how to upgrade KYC tier.
-                         Route to AOD if customer wants to upgrade.
-compliance_restriction → Transaction blocked by AML/regulatory rule.
-                         Do not disclose specific rule to customer.
-                         Route to AOD or FRM depending on context.
-suspected_fraud        → Transaction blocked by fraud engine.
-                         is_fraud_score may be 1. Route to FRM always.
-issuer_unavailable     → Destination bank system unreachable.
-                         Auto-reversal expected within 24 hours.
-                         Route to TSU if not resolved in 24 hours.
-
-
-=========================================================================
-SECTION 7: SERVICE CHARGE SCHEDULE
-=========================================================================
-
-Interbank NIP Transfers (nibss_transfer channel):
-  Amount ≤ ₦5,000           : ₦10.00
-  Amount ₦5,001 – ₦50,000   : ₦25.00
-  Amount > ₦50,000           : ₦50.00
-  First 3 per month (savings): FREE
-
-Internal (Intra-Sentinel) Transfers:
-  Between own accounts       : FREE (unlimited)
-  To other Sentinel customers: FREE (unlimited)
-
-SMS Transaction Alerts       : ₦4.00 per alert (mandatory per CBN)
-USSD Banking Sessions        : ₦6.98 per session
-ATM (own bank, 4th onwards)  : ₦65.00 per withdrawal
-ATM (other banks)            : ₦65.00 per withdrawal
-Account Maintenance (savings): ₦50/month (waived if balance ≥ ₦100,000)
-Account Maintenance (current): ₦300/month + ₦1/₦1,000 COT (business)
-Card Replacement              : ₦1,500
-Statement (> 90 days, email) : ₦50 per month
-Account Reactivation (dormant): ₦500
-
-
-=========================================================================
-DOCUMENT CONTROL
-=========================================================================
-
-Policy Owner   : Head of Transaction Services
-Approver       : Chief Operations Officer (COO)
-Last Updated   : {self.display_date}
-Contact        : transactionservices@sentinelbank.ng | Ext. 4000
-
-
-=========================================================================
-END OF DOCUMENT TSU-POL-002
-=========================================================================
-"""
+        sections = self._document_sections("TSU-POL-002")
         return self._package_for_rag(
             "TSU-POL-002",
             "Transaction Processing Policies",
             "operations",
             "4.0",
-            policies
+            sections
         )
 
     # =========================================================================
     # DOCUMENT 4: CUSTOMER SERVICE FAQ (FAQ-001)
     # =========================================================================
 
-    def generate_faq_document(self) -> Dict:
+    def generate_faq_document(self) -> RAGPacket:
         """
         Generate customer-facing FAQ document.
         Aligned to exact channel names, account types, limits, and
         fee schedule from the dataset generator and TSU-POL-002.
         """
-        faq = f"""
-=========================================================================
-{self.bank_name} - CUSTOMER SERVICE FAQ
-=========================================================================
-
-Document ID     : FAQ-001
-Version         : 2.0
-Last Updated    : {self.display_date}
-Classification  : Public — Customer-Facing & Agent Reference
-
-
-=========================================================================
-SECTION 1: TRANSFER & PAYMENT ISSUES
-=========================================================================
-
-Q1: My transfer was debited but the receiver did not get the money.
-─────────────────────────────────────────────────────────────────────────
-A: This usually indicates a temporary NIBSS network delay or a failed
-   interbank transaction (transaction_status = "failed" or "timeout").
-
-   Step 1: Wait 2 hours — most delays self-resolve via auto-reversal.
-   Step 2: Check your transaction history in the app for the reference number
-           (format: TXN + 12 digits).
-   Step 3: Confirm the beneficiary account number and bank with the recipient.
-   Step 4: If still unresolved after 2 hours, contact us with your
-           transaction reference. We will trace it via NIBSS.
-   Step 5: If not received within 24 hours, automatic reversal is triggered
-           and you will receive an SMS confirmation.
-
-   Common failure reasons to quote when reporting:
-     - network_error → NIBSS unreachable during transfer
-     - system_timeout → Switch did not respond in time
-     - issuer_unavailable → Destination bank system was offline
-
-Q2: I sent money to the wrong account. Can it be reversed?
-─────────────────────────────────────────────────────────────────────────
-A: Reversal is NOT automatic for wrong-account transfers. Here is the process:
-
-   Step 1: Contact the recipient directly and request voluntary refund.
-   Step 2: If unsuccessful, contact our Transaction Services Unit (TSU)
-           with evidence: screenshot of intended vs. actual account number.
-   Step 3: TSU will formally request recall from the beneficiary's bank.
-   Step 4: Recovery takes 2–14 days depending on beneficiary cooperation.
-
-   REVERSAL NOT POSSIBLE if: recipient has already withdrawn the funds.
-   Use the "Name Enquiry" feature before every transfer to verify the
-   account name matches your intended recipient.
-
-Q3: What are my daily transfer limits?
-─────────────────────────────────────────────────────────────────────────
-A: Limits depend on your KYC tier and account type:
-     Tier 1 (basic savings, phone + name only)   : ₦50,000/day
-     Tier 2 (savings/solo, BVN + NIN linked)     : ₦200,000/day
-     Tier 3 (current account, full KYC)           : ₦5,000,000/day
-
-   If exceeded: failure_reason = "daily_transaction_limit_exceeded"
-   To upgrade: Visit any branch with valid photo ID + utility bill.
-
-
-=========================================================================
-SECTION 2: CARD ISSUES
-=========================================================================
-
-Q4: Why was my card declined even though I have sufficient balance?
-─────────────────────────────────────────────────────────────────────────
-A: Common reasons for card decline at POS or ATM:
-
-   1. INTERNATIONAL TRANSACTIONS DISABLED (default state)
-      Enable in app: Cards → Manage Card → International Transactions ON.
-      Set travel start and end dates.
-
-   2. DAILY LIMIT EXCEEDED
-      POS limit : ₦500,000/day (all cards combined)
-      ATM limit : ₦100,000/day (standard) or ₦200,000 (premium)
-      Resets at midnight.
-
-   3. INCORRECT PIN (3 wrong attempts = auto-lock for 24 hours)
-      Reset via app or call Customer Care.
-
-   4. MERCHANT CATEGORY BLOCKED
-      Betting, gambling, crypto exchanges are blocked by default.
-      Contact us to enable specific categories.
-
-   5. SECURITY HOLD (suspicious activity detected)
-      Fraud engine applied risk block. Contact us to verify identity
-      and unblock. failure_reason = "suspected_fraud" in system logs.
-
-Q5: The ATM did not dispense cash but my account was debited.
-─────────────────────────────────────────────────────────────────────────
-A: This is a dispense error on channel = "atm". Standard protocol:
-
-   IMMEDIATE: Note ATM location, exact time, amount, and any receipt.
-              Do NOT retry the same ATM.
-   REPORT: Contact us within 24 hours with ATM details.
-   RESOLUTION: Auto-reversal within 24–48 hours after terminal
-               reconciliation confirms the dispense error.
-   SUCCESS RATE: 99.8% of ATM dispense errors are successfully reversed.
-
-
-=========================================================================
-SECTION 3: MOBILE APP & DIGITAL BANKING
-=========================================================================
-
-Q6: I cannot log into the mobile app.
-─────────────────────────────────────────────────────────────────────────
-A: Troubleshoot in this order:
-
-   WRONG PASSWORD        → Use "Forgot Password" (reset link to email).
-   OUTDATED APP VERSION  → Update via Play Store / App Store.
-   NETWORK ISSUE         → Toggle airplane mode off/on. Switch between
-                           WiFi and mobile data. Clear app cache.
-   ACCOUNT LOCKED        → 3 wrong password attempts locks for 30 minutes.
-                           Call Customer Care for immediate unlock.
-   NEW DEVICE            → OTP sent to registered phone to verify new device.
-
-   If still unable to log in after all steps → Route complaint to DCS.
-
-Q7: I am not receiving OTPs.
-─────────────────────────────────────────────────────────────────────────
-A: Check in this order:
-
-   1. Verify registered phone number is correct (call Customer Care).
-   2. Check network signal and mobile data.
-   3. Check SMS spam/blocked messages folder. Sender: "SENTINEL" or "SBNK".
-   4. Restart phone.
-   5. For iPhone: Settings → Messages → Filter Unknown Senders → disable.
-   6. Request email OTP as alternative (if available for your transaction).
-   7. Visit branch with valid ID to update registered phone number if incorrect.
-
-
-=========================================================================
-SECTION 4: FRAUD & SECURITY
-=========================================================================
-
-Q8: Someone is claiming to be from Sentinel Bank and asking for my PIN.
-─────────────────────────────────────────────────────────────────────────
-A: THIS IS A SCAM. Sentinel Bank will NEVER ask for your PIN, password,
-   OTP, or any authentication credential via phone, email, or SMS.
-
-   WHAT TO DO IF YOU SHARED YOUR CREDENTIALS:
-   Step 1: Change password immediately in app: Settings → Change Password.
-   Step 2: Block your card: Cards → Block Card.
-   Step 3: Call our OFFICIAL number: 0700-SENTINEL.
-   Step 4: Email: fraud-desk@sentinelbank.ng with scammer details.
-   Step 5: Monitor transactions hourly for next 24 hours.
-
-   THINGS WE WILL NEVER ASK FOR: PIN, password, OTP, "safe account" transfer,
-   remote access app installation (TeamViewer, AnyDesk).
-
-
-=========================================================================
-SECTION 5: ACCOUNT SERVICES
-=========================================================================
-
-Q9: How do I request a bank statement?
-─────────────────────────────────────────────────────────────────────────
-A: Options by channel:
-   Mobile App (FREE for last 90 days) : Statements → Select date range →
-                                        Download PDF or Excel.
-   Email request                       : statements@sentinelbank.ng.
-                                         Include: name, account number,
-                                         date range, delivery email.
-                                         Fee: ₦50/month requested.
-                                         Response: Within 24 hours.
-   USSD (*737*7#)                      : Last 5 transactions only. Free.
-   Branch visit                        : Any period including historical.
-                                         Fee: ₦100/month. Same-day ready.
-
-Q10: Why am I being charged monthly fees?
-─────────────────────────────────────────────────────────────────────────
-A: Standard charges that may appear on your account:
-
-   Account maintenance (savings)     : ₦50/month (waived if balance ≥ ₦100,000)
-   Account maintenance (current)     : ₦300/month
-   SMS transaction alerts            : ₦4 per alert (mandatory, CBN requirement)
-   USSD sessions (*737#)             : ₦6.98 per session
-   ATM withdrawals (other banks)     : ₦65 per withdrawal
-   ATM withdrawals (own bank, >3/mo) : ₦65 per withdrawal
-
-   If you see a charge not listed above, report it to Account Operations
-   Department (AOD) immediately with your statement reference.
-
-
-=========================================================================
-SECTION 6: CONTACT INFORMATION
-=========================================================================
-
-24/7 Customer Care     : 0700-SENTINEL (0700-736-8463)
-Fraud Emergency        : fraud-desk@sentinelbank.ng (24/7 monitoring)
-Complaints             : complaints@sentinelbank.ng
-Statement Requests     : statements@sentinelbank.ng
-Branch Locator         : In-app → Find Branch
-Banking Hours          : Mon–Fri 8:00 AM – 4:00 PM
-                         Saturday (selected branches): 9:00 AM – 1:00 PM
-
-
-=========================================================================
-END OF DOCUMENT FAQ-001
-=========================================================================
-"""
+        sections = self._document_sections("FAQ-001")
         return self._package_for_rag(
             "FAQ-001",
             "Customer Service Frequently Asked Questions",
             "knowledge_base",
             "2.0",
-            faq
+            sections
         )
 
     # =========================================================================
     # DOCUMENT 5: MERCHANT RISK PROFILES (FRM-002)  ← NEW
     # =========================================================================
 
-    def generate_merchant_risk_profiles(self) -> Dict:
+    def generate_merchant_risk_profiles(self) -> RAGPacket:
         """
         Generate merchant-category risk profiles for the Sentinel Agent.
 
@@ -1630,307 +1496,21 @@ END OF DOCUMENT FAQ-001
         Risk weight values integrate directly into calculate_fraud_risk()
         method in rag_query.py.
         """
-        profiles = f"""
-=========================================================================
-{self.bank_name} - MERCHANT RISK PROFILES
-=========================================================================
-
-Document Code       : FRM-002
-Classification      : CONFIDENTIAL — Sentinel Agent Operational Reference
-Version             : 1.0
-Effective Date      : January 2026
-Review Frequency    : Monthly
-
-Document Owner      : Chief Risk Officer (CRO)
-Companion Document  : FRM-001 (Fraud Detection & Prevention Guidelines)
-
-USAGE BY SENTINEL AGENT:
-  This document provides merchant_category risk weights that are ADDED
-  to the base risk score calculated from fraud_explainability_trace flags
-  in FRM-001. The Sentinel Agent queries this document using the
-  merchant_category field from transactions.csv and adds the returned
-  risk weight to the total risk score.
-
-QUERY PATTERN:
-  Input  : transaction['merchant_category']  →  e.g., "fintech"
-  Output : merchant risk weight (points)     →  e.g., +25
-  Action : Add to base score from FRM-001 flags, cap total at 100.
-
-
-=========================================================================
-SECTION 1: MERCHANT CATEGORY RISK TIERS
-=========================================================================
-
-──────────────────────────────────────────────────────────────────────────
-TIER 1 — HIGH RISK MERCHANT CATEGORIES  (+25 points)
-──────────────────────────────────────────────────────────────────────────
-
-CATEGORY: fintech
-Risk Weight       : +25 points
-Known Merchants   : Paystack, Flutterwave, Interswitch, Remita, Monnify
-Risk Rationale    :
-  Fintech payment gateways are the PRIMARY channel for moving stolen funds
-  out of compromised accounts. Fraudsters use victim accounts to fund
-  merchant accounts or P2P wallets on fintech platforms, making tracing
-  difficult. High-value fintech transactions from accounts with no prior
-  fintech history are the strongest single fraud signal in this dataset.
-Heightened Alert Conditions (add additional +10 points):
-  - First-ever fintech transaction for this account
-  - Amount > ₦200,000 to a fintech gateway
-  - Transaction at hours between midnight and 5:00 AM WAT
-  - Customer segment = "elderly" (age > 60 in customers.csv)
-Sentinel Agent Rule:
-  IF merchant_category = "fintech" AND is_fraud_score = 1:
-    Add +25 points to risk score.
-  IF merchant_category = "fintech" AND amount > 200000 AND
-     no prior fintech transactions:
-    Treat as if multiple_failures flag present (+20 additional).
-Recommended Escalation:
-  Combined score ≥ 61 (fintech + any one FRM-001 flag) → HIGH risk.
-  Mandatory push-to-app challenge for ALL fintech transactions > ₦100,000
-  regardless of fraud score, as a blanket protective control.
-
-──────────────────────────────────────────────────────────────────────────
-TIER 2 — MEDIUM-HIGH RISK MERCHANT CATEGORIES  (+15 points)
-──────────────────────────────────────────────────────────────────────────
-
-CATEGORY: transport
-Risk Weight       : +15 points
-Known Merchants   : Uber, Bolt, LagRide, ABC Transport, Peace Mass Transit
-Risk Rationale    :
-  Transport platforms (especially ride-hailing apps) are used as
-  money-testing venues. Fraudsters initiate small Uber or Bolt transactions
-  to test whether a stolen card or account access is active before
-  attempting larger withdrawals. Multiple transport transactions within
-  a short window is a card-testing indicator.
-Heightened Alert Conditions (add additional +10 points):
-  - 3+ transport transactions within 30 minutes to same platform
-  - Transport transaction outside customer's residential_state
-    (customers.csv: residential_state field)
-  - Transport transaction at 12:00 AM – 5:00 AM WAT
-Positive Contextual Signal:
-  - Uber/Bolt transactions ≥ 6 in last 90 days on this account
-    → REDUCES suspicion (regular commuter behavior)
-  - This is the car_loan_signal_score trigger in transactions.csv
-    (uber_tracker ≥ 6 adds +0.4 to car_loan_signal_score)
-Sentinel Agent Rule:
-  IF merchant_category = "transport" AND is_fraud_score = 1:
-    Add +15 points.
-  IF uber_tracker < 6 AND 3+ transport txns in 30 minutes:
-    Treat as card-testing pattern. Add +15 points.
-
-CATEGORY: education
-Risk Weight       : +15 points
-Known Merchants   : University Tuition, WAEC, JAMB, Private School Fees
-Risk Rationale    :
-  Education payments are legitimate but frequently used in social
-  engineering scams. Fraudsters convince victims to make urgent "school
-  fee" payments under false pretenses. Large, round-number education
-  payments from accounts with no prior education payment history are
-  suspicious.
-Heightened Alert Conditions (add additional +10 points):
-  - Payment > ₦500,000 (unusually large for typical fees)
-  - No prior education transactions on this account (ever)
-  - Payment destination is international (outside Nigeria)
-Sentinel Agent Rule:
-  IF merchant_category = "education" AND is_fraud_score = 1:
-    Add +15 points.
-
-CATEGORY: healthcare
-Risk Weight       : +15 points
-Known Merchants   : Teaching Hospital, Private Hospital, Medplus, HealthPlus
-Risk Rationale    :
-  Healthcare payments are generally legitimate but are occasionally
-  used as cover for scam payments ("my mother needs surgery money").
-  Large pharmacy or hospital payments from accounts with unusual
-  activity patterns require secondary review.
-Heightened Alert Conditions (add additional +10 points):
-  - Payment > ₦1,000,000 (significantly above average healthcare spend)
-  - First-ever healthcare merchant on this account
-Sentinel Agent Rule:
-  IF merchant_category = "healthcare" AND is_fraud_score = 1:
-    Add +15 points.
-
-──────────────────────────────────────────────────────────────────────────
-TIER 3 — LOW RISK MERCHANT CATEGORIES  (+5 points)
-──────────────────────────────────────────────────────────────────────────
-
-CATEGORY: telecoms
-Risk Weight       : +5 points
-Known Merchants   : MTN, Airtel, Glo, 9mobile
-Risk Rationale    :
-  Telecom payments (airtime, data bundles) are generally low-risk but
-  can indicate money-laundering via airtime resale at very high volumes.
-  Standard individual top-ups are benign.
-Heightened Alert Conditions (add additional +10 points):
-  - Airtime purchase > ₦50,000 in single transaction (resale indicator)
-  - 5+ telecom transactions in one day (bulk resale pattern)
-Sentinel Agent Rule:
-  IF merchant_category = "telecoms" AND is_fraud_score = 1:
-    Add +5 points.
-
-──────────────────────────────────────────────────────────────────────────
-TIER 4 — ZERO-RISK MERCHANT CATEGORIES  (0 points)
-──────────────────────────────────────────────────────────────────────────
-These categories are established, everyday spending patterns. No additional
-risk weight is added to the fraud score for transactions in these categories.
-
-CATEGORY: supermarket
-Risk Weight       : 0 points
-Known Merchants   : Shoprite, SPAR, Justrite, Ebeano, Market Square
-Rationale         : Essential grocery spending. Highly predictable pattern.
-                    Shoprite and SPAR have robust transaction security.
-Exception         : IF amount > ₦500,000 at a supermarket → flag as anomaly
-                    (+15 points). Supermarkets rarely process amounts this high.
-
-CATEGORY: restaurants
-Risk Weight       : 0 points
-Known Merchants   : Chicken Republic, Kilimanjaro, Mr Biggs, Dominos,
-                    Cold Stone, Bukka Hut
-Rationale         : Everyday food spending. Very low fraud incidence.
-Exception         : IF amount > ₦200,000 at a single restaurant
-                    → flag as anomaly (+15 points).
-
-CATEGORY: fuel
-Risk Weight       : 0 points
-Known Merchants   : NNPC Mega Station, TotalEnergies, Mobil, Oando,
-                    Conoil, MRS
-Rationale         : Routine fuel purchases. Extremely predictable.
-                    Amount per transaction is naturally bounded by tank size.
-Exception         : IF amount > ₦100,000 at fuel station
-                    → flag as anomaly (+10 points).
-
-CATEGORY: utilities
-Risk Weight       : 0 points
-Known Merchants   : Ikeja Electric, EKEDC, IBEDC, AEDC, DSTV, GOtv, StarTimes
-Rationale         : Utility bill payments are scheduled, predictable, and
-                    directly verifiable. DSTV, GOtv, and StarTimes are
-                    subscription services with fixed recurring amounts.
-Exception         : IF amount > ₦500,000 for a single utility bill
-                    → flag as anomaly (+10 points).
-
-
-=========================================================================
-SECTION 2: MERCHANT VELOCITY RULES (ADDITIONAL RISK WEIGHTS)
-=========================================================================
-
-These rules apply ON TOP OF the category risk weights above.
-They are based on transaction frequency patterns, not merchant type.
-
-First Transaction with New Merchant (on this account)
-  Condition     : No prior transaction with this merchant_name on record
-  Risk Weight   : +10 points
-  Rationale     : New merchant relationships carry inherent uncertainty.
-  Rule          : Apply to ALL categories including Tier 4 (zero-risk).
-
-Repeated Transactions to Same Merchant in Short Window
-  Condition     : 3+ transactions to same merchant within 60 minutes
-  Risk Weight   : +20 points
-  Rationale     : Velocity to same merchant indicates card testing,
-                  session hijacking, or retry fraud pattern.
-
-Large Single Transaction with New Merchant
-  Condition     : Amount > ₦100,000 AND merchant is new to this account
-  Risk Weight   : +25 points (replaces +10 new merchant weight — use higher)
-  Rationale     : High-value first transaction with unknown merchant is
-                  the highest-risk combination outside fintech.
-
-
-=========================================================================
-SECTION 3: COMPOSITE RISK SCORE EXAMPLES
-=========================================================================
-
-EXAMPLE 1 — FINTECH HIGH RISK:
-  Flags from FRM-001:
-    mobile_channel_risk  : +15
-    high_amount_spike    : +25
-  Merchant (FRM-002):
-    fintech              : +25
-  Velocity (Section 2):
-    First fintech txn    : +10 (new merchant)
-  ─────────────────────
-  Total                  : 75 → HIGH → Mandatory push-to-app challenge
-
-EXAMPLE 2 — TRANSPORT CARD TESTING:
-  Flags from FRM-001:
-    multiple_failures    : +20
-  Merchant (FRM-002):
-    transport            : +15
-  Velocity (Section 2):
-    3 txns in 30 min     : +20
-  ─────────────────────
-  Total                  : 55 → MEDIUM → Step-up OTP authentication
-
-EXAMPLE 3 — SUPERMARKET NORMAL PURCHASE:
-  Flags from FRM-001:
-    normal_pattern       : +0
-  Merchant (FRM-002):
-    supermarket          : +0
-  Velocity (Section 2):
-    Regular merchant     : +0
-  ─────────────────────
-  Total                  : 0 → LOW → Process without friction
-
-EXAMPLE 4 — FINTECH CRITICAL BLOCK:
-  Flags from FRM-001:
-    mobile_channel_risk  : +15
-    high_amount_spike    : +25
-    multiple_failures    : +20
-  Merchant (FRM-002):
-    fintech              : +25
-  ─────────────────────
-  Total                  : 85 → HIGH (capped at 85 — borderline Critical)
-  Note: Add +10 for new merchant → 95 → CRITICAL → Block immediately
-
-
-=========================================================================
-SECTION 4: MERCHANT CATEGORY TO DEPARTMENT ROUTING
-=========================================================================
-
-If a merchant-related complaint is raised, use this table to determine
-which department should handle it alongside the Sentinel fraud assessment:
-
-  Merchant Category  → Primary Department  → Escalate to if Fraud Detected
-  ─────────────────────────────────────────────────────────────────────────
-  fintech            → TSU (disputed txn)  → FRM (if is_fraud_score = 1)
-  transport          → COC (if card used)  → FRM (if is_fraud_score = 1)
-  supermarket        → COC (if POS issue)  → TSU (if transfer issue)
-  restaurants        → COC (if POS issue)  → TSU (if transfer issue)
-  fuel               → COC (if POS issue)  → TSU (if transfer issue)
-  utilities          → TSU (bill payment)  → AOD (if charge disputed)
-  telecoms           → TSU (airtime/data)  → DCS (if USSD channel)
-  education          → TSU (bank transfer) → FRM (if scam suspected)
-  healthcare         → TSU (bank transfer) → FRM (if scam suspected)
-
-
-=========================================================================
-DOCUMENT CONTROL
-=========================================================================
-
-Owner           : Chief Risk Officer (CRO)
-Review Freq     : Monthly (aligned with FRM-001 review cycle)
-Last Updated    : {self.display_date}
-Companion       : FRM-001 (Fraud Detection & Prevention Guidelines)
-Emergency       : fraud-desk@sentinelbank.ng | +234-1-FRAUD-24 (24/7)
-
-
-=========================================================================
-END OF DOCUMENT FRM-002
-=========================================================================
-"""
+        sections = self._document_sections("FRM-002")
         return self._package_for_rag(
             "FRM-002",
             "Merchant Risk Profiles",
             "security",
             "1.0",
-            profiles
+            sections,
+            structured_payload=_merchant_risk_payload(),
         )
 
     # =========================================================================
     # DOCUMENT 6: PRODUCT RECOMMENDATION POLICY (PRS-001)  ← NEW
     # =========================================================================
 
-    def generate_product_recommendation_policy(self) -> Dict:
+    def generate_product_recommendation_policy(self) -> RAGPacket:
         """
         Generate product recommendation eligibility policy for Trajectory Agent.
 
@@ -1964,395 +1544,19 @@ END OF DOCUMENT FRM-002
 
           uber_tracker:
             merchant_name in ["Uber", "Bolt", "LagRide"] → counter + 1
+
+        The same hierarchy is available as executable rules in
+        PRODUCT_RULES / recommend_product() for agents that evaluate
+        eligibility directly.
         """
-        policy = f"""
-=========================================================================
-{self.bank_name} - PRODUCT RECOMMENDATION POLICY
-=========================================================================
-
-Document Code       : PRS-001
-Classification      : Internal — Trajectory Agent Operational Reference
-Version             : 1.0
-Effective Date      : January 2026
-Review Frequency    : Quarterly
-
-Document Owner      : Head of Retail Banking Products
-Companion Documents : TSU-POL-002 (Transaction Policies),
-                      POL-CCH-001 (Complaint Handling Policy)
-
-USAGE BY TRAJECTORY AGENT:
-  This document defines the EXACT eligibility criteria for each product
-  recommendation in the Sentinel Bank dataset. The Trajectory Agent uses
-  this policy to:
-    1. Validate whether a recommended_product field in transactions.csv
-       is correctly assigned.
-    2. Generate product offers for customers who do not yet have a
-       recommendation but meet eligibility criteria.
-    3. Produce explainable, policy-grounded reasons for every recommendation.
-
-FIELD REFERENCE FROM TRANSACTIONS.CSV:
-  recommended_product     : "Car Loan" | "Personal Loan" | "Investment Plan" | None
-  salary_detected         : True | False
-  car_loan_signal_score   : float, range 0.0 – 1.0
-  amount                  : float (individual transaction amount in NGN)
-  merchant_name           : string (e.g., "Uber", "Bolt", "Paystack")
-  merchant_category       : string (e.g., "transport", "fintech")
-
-FIELDS FROM CUSTOMERS.CSV AND ACCOUNTS.CSV (JOINED BY AGENT):
-  age                     : integer (18–70 in dataset)
-  account_type            : "savings" | "solo" | "current"
-  monthly_inflow          : computed from monthly_inflow_tracker[customer_id]
-                            = sum of all credit transaction amounts per customer
-
-
-=========================================================================
-SECTION 1: PRODUCT ELIGIBILITY CRITERIA
-=========================================================================
-
-──────────────────────────────────────────────────────────────────────────
-PRODUCT: Car Loan
-──────────────────────────────────────────────────────────────────────────
-Recommended When  : recommended_product = "Car Loan" in dataset
-Policy Trigger    : car_loan_signal_score >= 0.7
-
-SIGNAL SCORE COMPOSITION (EXACT FORMULA FROM DATA GENERATOR):
-  Component 1 — Transport Usage Signal:
-    Condition  : uber_tracker[customer_id] >= 6
-                 (6 or more transactions where merchant_name is
-                  "Uber", "Bolt", or "LagRide" in last 90 days)
-    Score Add  : +0.4 to car_loan_signal_score
-    Rationale  : Frequent ride-hailing usage signals lack of personal
-                 vehicle, strong latent demand, and ability to budget
-                 for regular transport costs (which would convert to
-                 loan repayments).
-
-  Component 2 — Salary Detection Signal:
-    Condition  : salary_detected = True
-                 (salary_tracker[customer_id] >= 2, meaning at least
-                  2 credit transactions > ₦200,000 from merchant_category
-                  = "fintech" exist on this account)
-    Score Add  : +0.3 to car_loan_signal_score
-    Rationale  : Regular salary income indicates stable repayment
-                 capacity. Two or more large fintech credits is the
-                 proxy for salary/payroll in this dataset.
-
-  Component 3 — Monthly Inflow Signal:
-    Condition  : monthly_inflow_tracker[customer_id] > 500,000
-                 (cumulative credit amount across all transactions
-                  for this customer exceeds ₦500,000)
-    Score Add  : +0.3 to car_loan_signal_score
-    Rationale  : High monthly cash inflow indicates financial capacity
-                 to service a car loan without cash flow distress.
-
-MINIMUM SIGNAL SCORE THRESHOLD:
-  car_loan_signal_score >= 0.7 → ELIGIBLE for Car Loan recommendation
-  car_loan_signal_score  < 0.7 → NOT ELIGIBLE (check other products)
-
-EXAMPLE COMBINATIONS THAT REACH THRESHOLD:
-  Uber ≥ 6 + Salary Detected        → 0.4 + 0.3 = 0.7 ✓ ELIGIBLE
-  Uber ≥ 6 + Inflow > ₦500K         → 0.4 + 0.3 = 0.7 ✓ ELIGIBLE
-  Salary Detected + Inflow > ₦500K  → 0.3 + 0.3 = 0.6 ✗ NOT ELIGIBLE
-  All three signals present          → 0.4 + 0.3 + 0.3 = 1.0 ✓ STRONGLY ELIGIBLE
-
-AGENT VALIDATION QUERY:
-  "What is the eligibility criteria for Car Loan?"
-  Expected response: Signal score >= 0.7, composed of Uber (0.4),
-  salary detection (0.3), and/or monthly inflow > ₦500,000 (0.3).
-
-ADDITIONAL POLICY REQUIREMENTS (For Human Credit Officers):
-  - Account age        : Minimum 12 months with {self.bank_name}
-  - Credit history     : No active loan defaults
-  - KYC tier           : Tier 2 or Tier 3 minimum
-  - Minimum age        : 21 years (from customers.csv age field)
-  - Maximum age        : 60 years at loan maturity
-
-──────────────────────────────────────────────────────────────────────────
-PRODUCT: Personal Loan
-──────────────────────────────────────────────────────────────────────────
-Recommended When  : recommended_product = "Personal Loan" in dataset
-Policy Trigger    : salary_detected = True
-                    AND monthly_inflow_tracker[customer_id] > 300,000
-
-DATASET LOGIC (EXACT FROM DATA GENERATOR):
-  Personal Loan is the FALLBACK recommendation when:
-    - salary_detected = True (salary_tracker >= 2, credits > ₦200,000 from fintech)
-    - monthly_inflow > ₦300,000
-    - BUT car_loan_signal_score < 0.7 (not eligible for Car Loan)
-  In other words: the customer has stable income but insufficient
-  transport/inflow signals to qualify for the higher-value Car Loan.
-
-ELIGIBILITY CRITERIA:
-  Primary Signals:
-    salary_detected          = True (mandatory — no salary, no personal loan)
-    monthly_inflow           > ₦300,000
-
-  Disqualifying Conditions:
-    car_loan_signal_score    >= 0.7 → recommend Car Loan instead
-    monthly_inflow           > ₦2,000,000 → recommend Investment Plan instead
-
-  Context: In the dataset, once monthly_inflow > ₦2,000,000, the
-  Investment Plan trigger fires first. The Personal Loan applies in
-  the ₦300,000 – ₦2,000,000 monthly inflow band.
-
-ADDITIONAL POLICY REQUIREMENTS (For Human Credit Officers):
-  - Account type       : Tier 2 or Tier 3 (savings with BVN + NIN minimum)
-  - Debt-to-income     : DTI ratio < 40% (outstanding commitments vs income)
-  - KYC tier           : Tier 2 minimum (BVN + NIN required)
-  - Minimum age        : 21 years
-  - Maximum loan       : ₦5,000,000 (routed to CLS for formal assessment)
-
-AGENT VALIDATION QUERY:
-  "What are the eligibility criteria for Personal Loan?"
-  Expected: salary_detected=True AND monthly_inflow > ₦300,000 AND
-  car_loan_signal_score < 0.7.
-
-──────────────────────────────────────────────────────────────────────────
-PRODUCT: Investment Plan
-──────────────────────────────────────────────────────────────────────────
-Recommended When  : recommended_product = "Investment Plan" in dataset
-Policy Trigger    : monthly_inflow_tracker[customer_id] > 2,000,000
-
-DATASET LOGIC (EXACT FROM DATA GENERATOR):
-  Investment Plan fires when monthly_inflow > ₦2,000,000 regardless of
-  salary_detected or car_loan_signal_score. It is the HIGHEST-TIER product
-  in the recommendation hierarchy. This threshold captures customers
-  with high net cash inflow who have the financial slack to invest
-  rather than borrow.
-
-ELIGIBILITY CRITERIA:
-  Primary Signal:
-    monthly_inflow           > ₦2,000,000 (cumulative credit amount)
-
-  Supporting Signals (for prioritization, not blocking):
-    Account type             : "current" (Tier 3) — highest eligibility
-    Age range                : 25–60 preferred (wealth accumulation phase)
-    Balance pattern          : Consistently high balance (> ₦5,000,000
-                               average across last 90 days)
-    Spending pattern         : Low outflow ratio vs. inflow (savings behavior)
-
-  Note: In the dataset generator, Investment Plan can be recommended
-  even alongside Car Loan or Personal Loan signals if monthly_inflow
-  exceeds ₦2,000,000. The Trajectory Agent should prioritize presenting
-  Investment Plan first to high-inflow customers.
-
-AVAILABLE INVESTMENT PRODUCTS:
-  - Fixed Deposit (30, 60, 90, 180, 365-day tenors)
-  - Treasury Bill participation (via {self.bank_name} treasury desk)
-  - Mutual Fund (money market, equity, balanced)
-  - Dollar Fixed Deposit (domiciliary account required)
-
-ADDITIONAL POLICY REQUIREMENTS (For Relationship Managers):
-  - KYC tier           : Tier 3 required (full KYC, current account preferred)
-  - Minimum investment : ₦500,000 (Fixed Deposit), ₦100,000 (Mutual Fund)
-  - NDIC coverage      : Fixed deposits covered up to ₦5,000,000
-
-
-=========================================================================
-SECTION 2: RECOMMENDATION HIERARCHY & PRIORITY
-=========================================================================
-
-When a customer qualifies for multiple products simultaneously, use this
-priority order for the Trajectory Agent's primary recommendation:
-
-  PRIORITY 1: Investment Plan  (monthly_inflow > ₦2,000,000)
-              → Customer has high liquidity; invest first, borrow later.
-
-  PRIORITY 2: Car Loan         (car_loan_signal_score >= 0.7)
-              → Strong income + transport signals. High conversion rate.
-
-  PRIORITY 3: Personal Loan    (salary_detected + inflow > ₦300K)
-              → Stable income but insufficient signals for Car Loan.
-
-  PRIORITY 4: No Recommendation (recommended_product = None)
-              → Customer does not yet meet any threshold.
-              → Trajectory Agent should note which signals are closest
-                to threshold and suggest account behaviors to qualify.
-
-RECOMMENDATION REASONING TEMPLATE (for Trajectory Agent output):
-  "Based on {self.bank_name} Product Recommendation Policy PRS-001,
-   [Customer Name] is recommended for [Product] because:
-   - salary_detected = [True/False] (salary_tracker threshold: 2 credits > ₦200,000)
-   - monthly_inflow = ₦[X] (threshold: ₦[Y])
-   - car_loan_signal_score = [X] (threshold: 0.7)
-   - uber_tracker = [X] trips (threshold: 6 trips)
-   This meets [met_criteria]. Unmet criteria: [unmet_criteria]."
-
-
-=========================================================================
-SECTION 3: SALARY DETECTION METHODOLOGY
-=========================================================================
-
-The salary_detected field is a derived boolean based on salary_tracker.
-The Trajectory Agent must understand exactly how it is computed to
-correctly validate or explain recommendations.
-
-SALARY DETECTION RULE:
-  salary_detected = True
-  IF: COUNT of credit transactions WHERE:
-        amount > ₦200,000
-        AND merchant_category = "fintech"
-        (Paystack, Flutterwave, Interswitch, Remita, Monnify)
-      >= 2 transactions on this customer's accounts
-
-REASONING:
-  In Nigeria, most corporate salary payments are routed via payroll
-  systems built on fintech infrastructure (Paystack Payroll, Remita).
-  Two or more large credits (> ₦200,000) from fintech channels is a
-  robust proxy for regular salaried employment.
-
-COMMON SALARY MERCHANTS IN DATASET:
-  Paystack      : Widely used by SMEs and startups for payroll
-  Remita        : Primary platform for government salary payments (IPPIS)
-  Flutterwave   : Used by mid-size and large corporations
-  Interswitch   : Legacy enterprise payroll routing
-  Monnify       : Growing startup and SME payroll platform
-
-EDGE CASES FOR AGENT AWARENESS:
-  - Freelancers may receive large fintech credits but irregularly.
-    salary_detected may be True for freelancers with multiple clients.
-  - Business owners may receive large fintech credits as business revenue.
-    Trajectory Agent should cross-check account_type = "current" which
-    suggests a business context → Investment Plan more appropriate.
-  - Salary_detected = False does NOT mean no income.
-    It means the salary pattern was not detected within the transaction
-    sample. Other income forms (cash, branch deposits) are not captured.
-
-
-=========================================================================
-SECTION 4: MONTHLY INFLOW CALCULATION
-=========================================================================
-
-monthly_inflow_tracker[customer_id] is the CUMULATIVE sum of all CREDIT
-transaction amounts across all accounts linked to this customer_id.
-
-CALCULATION (from data_generator.py):
-  FOR EACH transaction:
-    IF transaction_type = "credit":
-      monthly_inflow_tracker[customer_id] += transaction.amount
-
-THRESHOLDS USED IN PRODUCT RULES:
-  > ₦300,000  → Personal Loan minimum threshold
-  > ₦500,000  → Car Loan inflow signal threshold (+0.3 to signal score)
-  > ₦2,000,000 → Investment Plan threshold
-
-AGENT GUIDANCE — INFLOW INTERPRETATION:
-  ₦0 – ₦300,000        → Low inflow. No product recommendation triggered.
-                          Suggest account upgrade and salary routing.
-  ₦300,001 – ₦500,000  → Personal Loan eligible IF salary_detected = True.
-                          Car Loan NOT yet eligible (inflow signal missing).
-  ₦500,001 – ₦2,000,000 → Car Loan eligible IF uber_tracker >= 6 OR
-                            salary_detected = True (reaching score 0.7).
-                            Personal Loan also eligible.
-  > ₦2,000,000          → Investment Plan recommended as primary product.
-                           Car Loan and Personal Loan remain secondary offers.
-
-
-=========================================================================
-SECTION 5: CROSS-DATASET VALIDATION QUERIES
-=========================================================================
-
-The Trajectory Agent uses this section to validate recommendations
-against the full customer profile across all four datasets.
-
-VALIDATION QUERY 1 — Car Loan:
-  Required Data : customers.csv (age), accounts.csv (account_type),
-                  transactions.csv (car_loan_signal_score, salary_detected,
-                  merchant_name, monthly_inflow)
-  Pass Condition: age >= 21 AND account_type IN ['savings','current']
-                  AND car_loan_signal_score >= 0.7
-  Fail Reason   : List which of the three signal components are missing
-                  and what behavior would trigger them.
-
-VALIDATION QUERY 2 — Personal Loan:
-  Required Data : transactions.csv (salary_detected, monthly_inflow)
-  Pass Condition: salary_detected = True AND monthly_inflow > 300000
-  Fail Reason   : If salary_detected = False → "No consistent salary
-                  credit detected. Customer needs 2+ fintech credits
-                  > ₦200,000 to qualify."
-
-VALIDATION QUERY 3 — Investment Plan:
-  Required Data : transactions.csv (monthly_inflow),
-                  accounts.csv (account_type, current_balance)
-  Pass Condition: monthly_inflow > 2,000,000
-  Enhancement   : If current_balance > 5,000,000 consistently →
-                  recommend premium investment tier.
-
-COMPLAINTS INTEGRATION (via complaints.csv):
-  The Trajectory Agent must check complaints_df before making
-  recommendations. If a customer has open fraud complaints
-  (fraud_related = 1, complaint_status = "open" or "escalated"):
-    → DO NOT make product recommendations until complaints resolved.
-    → Flag account for FRM review first.
-  If a customer has SLA breach complaints (sla_breach_flag = 1):
-    → Note service quality issue in recommendation report.
-    → Route service quality concern to AOD or the breaching department.
-
-
-=========================================================================
-SECTION 6: SAMPLE OUTPUT FORMAT FOR TRAJECTORY AGENT
-=========================================================================
-
-The Trajectory Agent should produce recommendations in this format
-for every customer analysed, citing this policy document:
-
-PRODUCT RECOMMENDATION REPORT
-──────────────────────────────────────────────────────────────────────────
-Customer        : [Full Name] | ID: [customer_id]
-Account Type    : [savings / solo / current]
-Age             : [X] years
-
-ELIGIBILITY ASSESSMENT (per PRS-001):
-  salary_detected          : [True / False]
-  car_loan_signal_score    : [X.X] / 1.0
-  uber_tracker             : [X] transport transactions
-  monthly_inflow           : ₦[X,XXX,XXX]
-
-RECOMMENDATION:
-  Primary Product          : [Car Loan / Personal Loan / Investment Plan / None]
-  Confidence               : [High / Medium / Low]
-  Policy Basis             : PRS-001, Section [X]
-
-CRITERIA MET:
-  ✓ [List each criterion met with actual vs. threshold value]
-
-CRITERIA UNMET:
-  ✗ [List each criterion not met with gap to threshold]
-
-NEXT BEST ACTION:
-  [Specific, actionable advice for what the customer can do to qualify
-   for the next product tier — e.g., "Route salary payments via Remita
-   to trigger salary_detected = True within 2 months."]
-
-COMPLIANCE FLAGS:
-  Active Fraud Complaints  : [Yes / No]
-  SLA Breaches on Account  : [X] breaches in last 90 days
-  Recommended Action       : [Proceed / Hold pending FRM clearance]
-
-Policy Reference           : {self.bank_name} PRS-001 v1.0 ({self.display_date})
-──────────────────────────────────────────────────────────────────────────
-
-
-=========================================================================
-DOCUMENT CONTROL
-=========================================================================
-
-Policy Owner    : Head of Retail Banking Products
-Approver        : Chief Retail Banking Officer
-Review Cycle    : Quarterly (thresholds reviewed against product performance)
-Last Updated    : {self.display_date}
-Contact         : retailproducts@sentinelbank.ng | Ext. 6000
-
-
-=========================================================================
-END OF DOCUMENT PRS-001
-=========================================================================
-"""
+        sections = self._document_sections("PRS-001")
         return self._package_for_rag(
             "PRS-001",
             "Product Recommendation Policy",
             "policy",
             "1.0",
-            policy
+            sections,
+            structured_payload=_product_policy_payload(),
         )
 
     # =========================================================================
@@ -2363,6 +1567,29 @@ END OF DOCUMENT PRS-001
     # DATASET VALIDATION
     # =========================================================================
 
+    def _transaction_risk_scores(self, transactions_csv: Path, transactions_df) -> np.ndarray:
+        """
+        FRM-001 risk score of every row of transactions_csv, as int16.
+
+        Scored once per file version: the array is kept on the instance,
+        keyed by the file's resolved path, size and mtime, so repeated
+        validation runs over an unchanged dataset skip scoring entirely.
+        """
+        import pandas as pd
+
+        stat = transactions_csv.stat()
+        key = (str(transactions_csv.resolve()), stat.st_size, stat.st_mtime_ns)
+        if self._risk_scores is not None and self._risk_scores[0] == key:
+            return self._risk_scores[1]
+
+        missing = pd.Series(np.nan, index=transactions_df.index, dtype=object)
+        scores = _frozen(score_fraud_risk(
+            transactions_df.get("fraud_explainability_trace", missing),
+            transactions_df.get("merchant_category", missing),
+        ))
+        self._risk_scores = (key, scores)
+        return scores
+
     def validate_entire_dataset(
         self,
         customers_csv:    Path = None,
@@ -2396,7 +1623,10 @@ END OF DOCUMENT PRS-001
             Dict with keys: routing, fraud_detection, product_recommendations,
                             sla_compliance, overall_score, timestamp
         """
+        # Validation-only dependencies are imported here, so importing this
+        # module (as rag_query.py does for the shared constants) stays cheap.
         import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
         from datetime import datetime as dt
 
         # ------------------------------------------------------------------
@@ -2434,18 +1664,54 @@ END OF DOCUMENT PRS-001
         # ------------------------------------------------------------------
         # Load datasets
         # ------------------------------------------------------------------
+        # The four files are independent and pandas' C parser releases the
+        # GIL while tokenizing, so they are read on parallel threads. Only
+        # VALIDATION_COLUMNS are parsed (a column absent from a file is
+        # simply not read; the tests below fall back where one is missing).
+        # Low-cardinality label columns are read as categoricals: one shared
+        # string per distinct label instead of a fresh object on every row.
+        def read_csv(path: Path, name: str, dtype: Optional[Dict] = None):
+            wanted = VALIDATION_COLUMNS[name]
+            return pd.read_csv(path, usecols=lambda c: c in wanted, dtype=dtype)
+
         print("\nLoading datasets...")
-        customers_df    = pd.read_csv(customers_csv)
-        accounts_df     = pd.read_csv(accounts_csv)
-        transactions_df = pd.read_csv(transactions_csv)
-        complaints_df   = pd.read_csv(complaints_csv)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            customers_fut    = pool.submit(read_csv, customers_csv, "customers")
+            accounts_fut     = pool.submit(read_csv, accounts_csv, "accounts")
+            transactions_fut = pool.submit(read_csv, transactions_csv, "transactions", {
+                # Nullable so a blank score loads as <NA> instead of failing
+                "is_fraud_score":             "Int8",
+                "transaction_type":           "category",
+                "merchant_category":          "category",
+                "fraud_explainability_trace": "category",
+                "recommended_product":        "category",
+            })
+            complaints_fut   = pool.submit(read_csv, complaints_csv, "complaints", {
+                # Categories inferred from the file, so an unknown code keeps
+                # its value and is reported as-is by TEST 1.
+                "department_code":   "category",
+                "priority_level":    "category",
+                # Nullable: a blank flag loads as <NA> (skipped by mean/sum)
+                # instead of failing the whole load.
+                "fraud_related":     "Int8",
+                "sla_breach_flag":   "Int8",
+            })
+        customers_df    = customers_fut.result()
+        accounts_df     = accounts_fut.result()
+        transactions_df = transactions_fut.result()
+        complaints_df   = complaints_fut.result()
 
         print(f"  ✓ customers.csv     : {len(customers_df):,} rows")
         print(f"  ✓ accounts.csv      : {len(accounts_df):,} rows")
         print(f"  ✓ transactions.csv  : {len(transactions_df):,} rows")
         print(f"  ✓ complaints.csv    : {len(complaints_df):,} rows")
 
-        results = {}
+        # Every key is filled in below; creating them up front fixes the
+        # report's key order and sizes the dict once.
+        results = dict.fromkeys((
+            "routing", "fraud_detection", "product_recommendations",
+            "sla_compliance", "overall_score", "timestamp", "dataset_paths",
+        ))
 
         # ==================================================================
         # TEST 1: COMPLAINT ROUTING ACCURACY (POL-CCH-001)
@@ -2454,51 +1720,32 @@ END OF DOCUMENT PRS-001
         print("TEST 1: Complaint Routing Accuracy  (POL-CCH-001)")
         print("-" * 70)
 
-        # Department routing rules from map_transaction_to_department()
-        # mirrored exactly from data_generator.py
-        def expected_dept(row) -> str:
-            if row.get("fraud_related", 0) == 1:
-                return "FRM"
-            if str(row.get("complaint_text", "")).lower().find("atm") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("card") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("pos") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("declined") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("swallowed") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("pin") != -1:
-                return "COC"
-            if str(row.get("complaint_text", "")).lower().find("app") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("login") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("ussd") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("crash") != -1:
-                return "DCS"
-            if str(row.get("complaint_text", "")).lower().find("statement") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("bvn") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("close") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("charges") != -1:
-                return "AOD"
-            if str(row.get("complaint_text", "")).lower().find("loan") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("credit") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("repayment") != -1 or \
-               str(row.get("complaint_text", "")).lower().find("interest") != -1:
-                return "CLS"
-            return "TSU"
-
         sample = complaints_df.head(min(sample_size, len(complaints_df)))
-        correct = 0
-        misrouted = []
-
-        for _, row in sample.iterrows():
-            predicted = expected_dept(row)
-            actual    = row.get("department_code", "")
-            if predicted == actual:
-                correct += 1
-            else:
-                misrouted.append({
-                    "complaint_id": row.get("complaint_id"),
-                    "predicted":    predicted,
-                    "actual":       actual,
-                    "text_snippet": str(row.get("complaint_text", ""))[:80]
-                })
+        missing_col = pd.Series(np.nan, index=sample.index, dtype=object)
+        raw_texts = sample.get("complaint_text", missing_col)
+
+        # Department routing rules (COMPLAINT_KEYWORDS) mirrored exactly
+        # from data_generator.py: fraud first, then keyword rule order.
+        predicted_all = route_complaints(
+            raw_texts, sample.get("fraud_related", missing_col),
+        )
+        actual_all = sample.get("department_code", missing_col).to_numpy()
+        hits = predicted_all == actual_all
+
+        # Only the misroutes that get reported are materialised as records
+        # (at most five, so the list is stored as-is); the rest are counted.
+        correct = int(hits.sum())
+        misroute_rows = np.flatnonzero(~hits)
+        misrouted = [
+            {
+                "complaint_id": sample["complaint_id"].iat[i]
+                                if "complaint_id" in sample else None,
+                "predicted":    str(predicted_all[i]),
+                "actual":       actual_all[i],
+                "text_snippet": str(raw_texts.iat[i])[:80]
+            }
+            for i in misroute_rows[:5]
+        ]
 
         routing_accuracy = (correct / len(sample)) * 100 if len(sample) > 0 else 0
 
@@ -2518,10 +1765,10 @@ END OF DOCUMENT PRS-001
             "accuracy":         routing_accuracy,
             "correct":          correct,
             "total_sampled":    len(sample),
-            "misrouted_count":  len(misrouted),
+            "misrouted_count":  len(misroute_rows),
             "sla_breach_rate":  sla_breach_rate,
             "priority_dist":    priority_dist,
-            "top_misroutes":    misrouted[:5],
+            "top_misroutes":    misrouted,
         }
 
         status = "✅" if routing_accuracy >= 90 else "⚠️ " if routing_accuracy >= 75 else "❌"
@@ -2529,7 +1776,7 @@ END OF DOCUMENT PRS-001
         print(f"     Correct / Sampled : {correct} / {len(sample)}")
         print(f"     SLA Breach Rate   : {sla_breach_rate:.1f}%")
         print(f"     Priority dist     : {priority_dist}")
-        if misrouted[:3]:
+        if misrouted:
             print(f"     Sample misroutes  :")
             for m in misrouted[:3]:
                 print(f"       [{m['complaint_id']}] predicted={m['predicted']} actual={m['actual']}")
@@ -2542,63 +1789,66 @@ END OF DOCUMENT PRS-001
         print("TEST 2: Fraud Detection Coverage  (FRM-001 + FRM-002)")
         print("-" * 70)
 
-        # Use module-level MERCHANT_RISK and FLAG_WEIGHTS constants
-        # (single source of truth — also imported by rag_query.py)
-        def compute_risk_score(row) -> int:
-            score = 0
-            trace = str(row.get("fraud_explainability_trace", "normal_pattern"))
-            for flag in trace.split(","):
-                score += FLAG_WEIGHTS.get(flag.strip(), 0)
-            merchant_cat = str(row.get("merchant_category", "")).lower()
-            score += MERCHANT_RISK.get(merchant_cat, 0)
-            return min(score, 100)
-
-        fraud_txns    = transactions_df[transactions_df["is_fraud_score"] == 1]
-        non_fraud_txns = transactions_df[transactions_df["is_fraud_score"] == 0]
+        # Every row is scored once per transactions file (see
+        # _transaction_risk_scores); each sample is then a plain gather.
+        risk_scores = self._transaction_risk_scores(transactions_csv, transactions_df)
+        # A missing score (-1 here) is neither fraud nor non-fraud
+        is_fraud = transactions_df["is_fraud_score"].to_numpy(
+            dtype=np.int8, na_value=-1,
+        )
+        fraud_rows     = np.flatnonzero(is_fraud == 1)
+        non_fraud_rows = np.flatnonzero(is_fraud == 0)
 
-        fraud_sample = fraud_txns.head(min(sample_size, len(fraud_txns)))
-        non_fraud_sample = non_fraud_txns.head(min(200, len(non_fraud_txns)))
+        fraud_scores     = risk_scores[fraud_rows[:sample_size]]
+        non_fraud_scores = risk_scores[non_fraud_rows[:200]]
 
-        fraud_scores     = [compute_risk_score(r) for _, r in fraud_sample.iterrows()]
-        non_fraud_scores = [compute_risk_score(r) for _, r in non_fraud_sample.iterrows()]
+        # One histogram pass per sample yields the score total and the
+        # FRM-001 band counts (0=LOW .. 3=CRITICAL) everything below needs.
+        n_fraud, n_non_fraud = len(fraud_scores), len(non_fraud_scores)
+        fraud_total, fraud_bands         = risk_summary(fraud_scores)
+        non_fraud_total, non_fraud_bands = risk_summary(non_fraud_scores)
 
-        avg_fraud_score     = sum(fraud_scores) / len(fraud_scores)         if fraud_scores     else 0
-        avg_non_fraud_score = sum(non_fraud_scores) / len(non_fraud_scores) if non_fraud_scores else 0
+        avg_fraud_score     = fraud_total / n_fraud         if n_fraud     else 0
+        avg_non_fraud_score = non_fraud_total / n_non_fraud if n_non_fraud else 0
 
         # True positive: fraud txn scores >= 31 (at least MEDIUM risk)
-        true_positives  = sum(1 for s in fraud_scores if s >= 31)
+        true_positives  = sum(fraud_bands[1:])
         # False positive: non-fraud txn scores >= 61 (HIGH or CRITICAL)
-        false_positives = sum(1 for s in non_fraud_scores if s >= 61)
+        false_positives = sum(non_fraud_bands[2:])
 
-        tp_rate = (true_positives / len(fraud_scores) * 100)     if fraud_scores     else 0
-        fp_rate = (false_positives / len(non_fraud_scores) * 100) if non_fraud_scores else 0
+        tp_rate = (true_positives / n_fraud * 100)          if n_fraud     else 0
+        fp_rate = (false_positives / n_non_fraud * 100)     if n_non_fraud else 0
 
-        risk_distribution = {
-            "LOW (0-30)":      sum(1 for s in fraud_scores if s <= 30),
-            "MEDIUM (31-60)":  sum(1 for s in fraud_scores if 31 <= s <= 60),
-            "HIGH (61-85)":    sum(1 for s in fraud_scores if 61 <= s <= 85),
-            "CRITICAL (86+)":  sum(1 for s in fraud_scores if s >= 86),
-        }
+        risk_distribution = dict(zip(
+            ("LOW (0-30)", "MEDIUM (31-60)", "HIGH (61-85)", "CRITICAL (86+)"),
+            fraud_bands,
+        ))
 
-        # Trace flag coverage
-        all_traces = transactions_df["fraud_explainability_trace"].dropna() \
-            if "fraud_explainability_trace" in transactions_df.columns else []
+        # Trace flag coverage: count each distinct trace once (factorize
+        # keeps first-appearance order), then split only those few strings
+        # and credit every flag with its trace's row count.
         flag_counts = {}
-        for trace in all_traces:
-            for flag in str(trace).split(","):
-                f = flag.strip()
-                flag_counts[f] = flag_counts.get(f, 0) + 1
+        if "fraud_explainability_trace" in transactions_df.columns:
+            trace_codes, traces = pd.factorize(
+                transactions_df["fraud_explainability_trace"]
+            )
+            trace_rows = np.bincount(trace_codes[trace_codes >= 0],
+                                     minlength=len(traces))
+            for trace, rows in zip(traces, trace_rows.tolist()):
+                for flag in str(trace).split(","):
+                    f = flag.strip()
+                    flag_counts[f] = flag_counts.get(f, 0) + rows
 
         results["fraud_detection"] = {
             "avg_fraud_score":       avg_fraud_score,
             "avg_non_fraud_score":   avg_non_fraud_score,
             "true_positive_rate":    tp_rate,
             "false_positive_rate":   fp_rate,
-            "fraud_txn_count":       len(fraud_txns),
-            "fraud_rate_pct":        len(fraud_txns) / len(transactions_df) * 100,
+            "fraud_txn_count":       len(fraud_rows),
+            "fraud_rate_pct":        len(fraud_rows) / len(transactions_df) * 100,
             "risk_distribution":     risk_distribution,
             "flag_counts":           flag_counts,
-            "samples_tested":        len(fraud_scores),
+            "samples_tested":        n_fraud,
         }
 
         status = "✅" if avg_fraud_score >= 31 else "⚠️ " if avg_fraud_score >= 15 else "❌"
@@ -2606,12 +1856,12 @@ END OF DOCUMENT PRS-001
         print(f"     Avg Non-Fraud Score   : {avg_non_fraud_score:.1f}/100  (target < 31)")
         print(f"     True Positive Rate    : {tp_rate:.1f}%  (fraud flagged as ≥ MEDIUM)")
         print(f"     False Positive Rate   : {fp_rate:.1f}%  (legit flagged as ≥ HIGH)")
-        print(f"     Total Fraud Txns      : {len(fraud_txns):,} of {len(transactions_df):,} ({results['fraud_detection']['fraud_rate_pct']:.1f}%)")
+        print(f"     Total Fraud Txns      : {len(fraud_rows):,} of {len(transactions_df):,} ({results['fraud_detection']['fraud_rate_pct']:.1f}%)")
         print(f"     Risk Distribution     :")
         for level, count in risk_distribution.items():
             print(f"       {level:<18}: {count}")
         print(f"     Trace Flag Counts     :")
-        for flag, cnt in sorted(flag_counts.items(), key=lambda x: -x[1])[:5]:
+        for flag, cnt in nlargest(5, flag_counts.items(), key=itemgetter(1)):
             print(f"       {flag:<30}: {cnt:,}")
 
         # ==================================================================
@@ -2621,63 +1871,57 @@ END OF DOCUMENT PRS-001
         print("TEST 3: Product Recommendation Accuracy  (PRS-001)")
         print("-" * 70)
 
-        def expected_product(row) -> str:
-            """Mirror exact logic from data_generator.py"""
-            monthly_inflow       = float(row.get("monthly_inflow_tracker", 0) or 0)
-            salary_detected      = bool(row.get("salary_detected", False))
-            car_loan_score       = float(row.get("car_loan_signal_score", 0) or 0)
-
-            if monthly_inflow > 2_000_000:
-                return "Investment Plan"
-            if car_loan_score >= 0.7:
-                return "Car Loan"
-            if salary_detected and monthly_inflow > 300_000:
-                return "Personal Loan"
-            return "None"
-
-        # Build monthly_inflow_tracker from transactions (credit side)
-        credit_txns = transactions_df[transactions_df["transaction_type"] == "credit"].copy()
-        # Join to get customer_id via account_id
-        credit_with_acct = credit_txns.merge(
-            accounts_df[["account_id", "customer_id"]], on="account_id", how="left"
-        )
-        monthly_inflow_map = (
-            credit_with_acct.groupby("customer_id")["amount"].sum().to_dict()
-        )
-
         rec_sample = transactions_df[
             transactions_df["recommended_product"].notna()
         ].head(min(sample_size, len(transactions_df)))
 
-        correct_recs   = 0
-        incorrect_recs = []
-        product_counts = {}
-
-        for _, row in rec_sample.iterrows():
-            actual_product = str(row.get("recommended_product", "None"))
-
-            # Augment row with monthly_inflow_tracker (not in raw transactions)
-            acct_row    = accounts_df[accounts_df["account_id"] == row.get("account_id")]
-            customer_id = acct_row["customer_id"].iloc[0] if len(acct_row) > 0 else None
-            inflow      = monthly_inflow_map.get(customer_id, 0)
-
-            augmented = row.to_dict()
-            augmented["monthly_inflow_tracker"] = inflow
-
-            predicted = expected_product(augmented)
-
-            product_counts[actual_product] = product_counts.get(actual_product, 0) + 1
-
-            if predicted == actual_product:
-                correct_recs += 1
-            else:
-                incorrect_recs.append({
-                    "predicted": predicted,
-                    "actual":    actual_product,
-                    "score":     row.get("car_loan_signal_score", 0),
-                    "salary":    row.get("salary_detected", False),
-                    "inflow":    inflow,
-                })
+        # monthly_inflow_tracker is not in raw transactions: map account_id
+        # to customer_id once, pick the sample's customers first, and total
+        # the credit side of only their accounts, rather than grouping the
+        # credits of every customer and discarding most of the result.
+        account_customer = accounts_df.drop_duplicates("account_id") \
+            .set_index("account_id")["customer_id"]
+        customer_ids = rec_sample["account_id"].map(account_customer)
+        sample_accounts = account_customer[account_customer.isin(customer_ids)]
+        credit_txns = transactions_df[
+            (transactions_df["transaction_type"] == "credit")
+            & transactions_df["account_id"].isin(sample_accounts.index)
+        ]
+        monthly_inflow = credit_txns["amount"].groupby(
+            credit_txns["account_id"].map(sample_accounts), sort=False,
+        ).sum()
+
+        inflow = customer_ids.map(monthly_inflow).fillna(0).to_numpy(dtype=float)
+        salary = rec_sample["salary_detected"].fillna(False).to_numpy(dtype=bool)
+        score  = rec_sample["car_loan_signal_score"].fillna(0).to_numpy(dtype=float)
+
+        # PRS-001 hierarchy, mirroring data_generator.py: the first rule
+        # that holds wins (recommend_products evaluates PRODUCT_THRESHOLDS).
+        predicted_all = recommend_products(inflow, salary, score, default="None")
+        actual_all = rec_sample["recommended_product"].astype(str).to_numpy()
+        matches = predicted_all == actual_all
+
+        correct_recs   = int(matches.sum())
+        # Counted in C by Counter and kept most-common first, which is the
+        # order the distribution is printed in.
+        product_counts = dict(Counter(actual_all.tolist()).most_common())
+        # As in TEST 1, only the (at most five) reported mismatches become
+        # records, and that list is the stored sample.
+        mismatch_rows = np.flatnonzero(~matches)[:5]
+        incorrect_recs = [
+            {
+                "predicted": str(predicted_all[i]),
+                "actual":    actual_all[i],
+                "score":     raw_score,
+                "salary":    raw_salary,
+                "inflow":    inflow[i],
+            }
+            for i, raw_score, raw_salary in zip(
+                mismatch_rows,
+                rec_sample["car_loan_signal_score"].iloc[mismatch_rows].tolist(),
+                rec_sample["salary_detected"].iloc[mismatch_rows].tolist(),
+            )
+        ]
 
         rec_accuracy = (correct_recs / len(rec_sample)) * 100 if len(rec_sample) > 0 else 0
 
@@ -2686,16 +1930,16 @@ END OF DOCUMENT PRS-001
             "correct":          correct_recs,
             "total_sampled":    len(rec_sample),
             "product_counts":   product_counts,
-            "incorrect_sample": incorrect_recs[:5],
+            "incorrect_sample": incorrect_recs,
         }
 
         status = "✅" if rec_accuracy >= 80 else "⚠️ " if rec_accuracy >= 65 else "❌"
         print(f"  {status} Recommendation Accuracy : {rec_accuracy:.1f}%  (target > 80%)")
         print(f"     Correct / Sampled      : {correct_recs} / {len(rec_sample)}")
         print(f"     Product Distribution   :")
-        for prod, cnt in sorted(product_counts.items(), key=lambda x: -x[1]):
-            print(f"       {prod:<20}: {cnt:,}")
-        if incorrect_recs[:3]:
+        for prod, cnt in product_counts.items():
+            print(_PRODUCT_ROW_FORMAT.format_map({"product": prod, "count": cnt}))
+        if incorrect_recs:
             print(f"     Sample mismatches      :")
             for m in incorrect_recs[:3]:
                 print(f"       predicted={m['predicted']} | actual={m['actual']} "
@@ -2714,37 +1958,80 @@ END OF DOCUMENT PRS-001
            "sla_breach_flag" in complaints_df.columns and \
            "resolution_time_hours" in complaints_df.columns:
 
-            for dept, expected_hours in EXPECTED_SLA.items():
-                dept_complaints = complaints_df[complaints_df["department_code"] == dept]
-                if len(dept_complaints) == 0:
-                    continue
-                breach_count  = dept_complaints["sla_breach_flag"].sum()
-                breach_rate   = breach_count / len(dept_complaints) * 100
-                avg_res_hours = dept_complaints["resolution_time_hours"].mean()
-                # Verify sla_hours_limit field matches policy
-                if "sla_hours_limit" in dept_complaints.columns:
-                    mismatch = dept_complaints[
-                        dept_complaints["sla_hours_limit"] != expected_hours
-                    ]
-                    limit_correct = len(mismatch) == 0
-                else:
-                    limit_correct = None
+            # One grouped pass gives every department's size, breach count
+            # and mean resolution time, instead of a filtered copy of the
+            # frame per department.
+            by_dept = complaints_df.groupby(
+                "department_code", observed=True, sort=False,
+            )
+            dept_stats = by_dept.agg(
+                total=("sla_breach_flag", "size"),
+                breach_count=("sla_breach_flag", "sum"),
+                avg_res_hours=("resolution_time_hours", "mean"),
+            )
+
+            # Verify sla_hours_limit field matches policy: line every row up
+            # with its department's expected hours (one entry per category;
+            # departments outside EXPECTED_SLA, and the trailing entry for
+            # rows with no department, get 0 and are never reported) and
+            # compare in one pass.
+            limit_mismatch = None
+            if "sla_hours_limit" in complaints_df.columns:
+                dept_col = complaints_df["department_code"]
+                expected_lut = np.array(
+                    [EXPECTED_SLA.get(dept, 0) for dept in dept_col.cat.categories] + [0]
+                )
+                expected_col = pd.Series(
+                    expected_lut[dept_col.cat.codes.to_numpy()],
+                    index=complaints_df.index,
+                )
+                limit_mismatch = complaints_df["sla_hours_limit"].ne(expected_col) \
+                    .groupby(dept_col, observed=True).any()
+
+            # Only departments that actually appear in the data, kept in
+            # EXPECTED_SLA order so the report rows stay stable.
+            present_depts = frozenset(dept_stats.index)
+            sla_items = tuple(
+                (dept, hours) for dept, hours in EXPECTED_SLA.items()
+                if dept in present_depts
+            )
+
+            # Status badges for every reported department in one vectorised
+            # comparison (≤30% ✅, ≤50% ⚠️, otherwise ❌).
+            rates = (dept_stats["breach_count"] / dept_stats["total"] * 100) \
+                .reindex([dept for dept, _ in sla_items]).to_numpy()
+            statuses = np.select([rates <= 30, rates <= 50], ["✅", "⚠️ "], default="❌")
+
+            for (dept, expected_hours), status in zip(sla_items, statuses):
+                total, breach_count, avg_res_hours = dept_stats.loc[
+                    dept, ["total", "breach_count", "avg_res_hours"]
+                ]
+                total         = int(total)
+                breach_count  = int(breach_count)
+                breach_rate   = breach_count / total * 100
+                limit_correct = (None if limit_mismatch is None
+                                 else not limit_mismatch[dept])
 
                 sla_results[dept] = {
                     "expected_sla_hours": expected_hours,
                     "avg_resolution_hrs": avg_res_hours,
-                    "total_complaints":   len(dept_complaints),
-                    "breach_count":       int(breach_count),
+                    "total_complaints":   total,
+                    "breach_count":       breach_count,
                     "breach_rate_pct":    breach_rate,
                     "sla_limit_correct":  limit_correct,
                 }
 
-                status = "✅" if breach_rate <= 30 else "⚠️ " if breach_rate <= 50 else "❌"
-                print(f"  {status} {dept}  SLA={expected_hours}h | "
-                      f"Avg Resolution={avg_res_hours:.0f}h | "
-                      f"Breaches={breach_count}/{len(dept_complaints)} ({breach_rate:.1f}%)"
-                      + (f" | limit_field_match={'✓' if limit_correct else '✗'}"
-                         if limit_correct is not None else ""))
+                print(_SLA_ROW_FORMAT.format_map({
+                    "status":   status,
+                    "dept":     dept,
+                    "sla":      expected_hours,
+                    "avg":      avg_res_hours,
+                    "breaches": breach_count,
+                    "total":    total,
+                    "rate":     breach_rate,
+                    "limit":    "" if limit_correct is None else
+                                f" | limit_field_match={'✓' if limit_correct else '✗'}",
+                }))
 
         results["sla_compliance"] = sla_results
 
@@ -2755,14 +2042,15 @@ END OF DOCUMENT PRS-001
         print(" " * 22 + "VALIDATION SUMMARY")
         print("=" * 70)
 
-        # Weighted overall score
-        overall_score = (
-            routing_accuracy              * 0.35 +
-            min(avg_fraud_score * 1.5, 100) * 0.30 +   # scale: target 31+ → ~47
-            rec_accuracy                  * 0.25 +
-            max(0, 100 - sla_breach_rate) * 0.10        # lower breach rate = higher score
-        )
-        overall_score = min(overall_score, 100)
+        # Weighted overall score: the four component scores are weighted
+        # by _OVERALL_SCORE_WEIGHTS (35/30/25/10) in one array reduction.
+        components = np.array([
+            routing_accuracy,
+            min(avg_fraud_score * 1.5, 100),   # scale: target 31+ → ~47
+            rec_accuracy,
+            max(0, 100 - sla_breach_rate),     # lower breach rate = higher score
+        ], dtype=np.float64)
+        overall_score = min(float((components * _OVERALL_SCORE_WEIGHTS).sum()), 100)
 
         results["overall_score"] = overall_score
         results["timestamp"]     = dt.now().isoformat()
@@ -2793,23 +2081,77 @@ END OF DOCUMENT PRS-001
         return results
 
 
-    def generate_all_documents(self) -> List[Dict]:
+    # Document IDs and their generators in output order, so a caller can
+    # build just the documents it needs rather than all six.
+    _GENERATORS: Tuple[Tuple[str, Callable[["BankingPolicyGenerator"], RAGPacket]], ...] = (
+        ("POL-CCH-001", generate_complaint_handling_policy),     # Dispatcher Agent
+        ("FRM-001",     generate_fraud_detection_guidelines),    # Sentinel Agent (base)
+        ("TSU-POL-002", generate_transaction_policies),          # All agents
+        ("FAQ-001",     generate_faq_document),                  # Customer-facing
+        ("FRM-002",     generate_merchant_risk_profiles),        # Sentinel Agent (merchant)
+        ("PRS-001",     generate_product_recommendation_policy), # Trajectory Agent
+    )
+
+    def iter_documents(self, doc_ids: Optional[Iterable[str]] = None
+                       ) -> Iterator[RAGPacket]:
+        """
+        Yield policy documents one at a time, in generation order.
+
+        Each document is only built when the iterator reaches it, and with
+        doc_ids only the listed documents are built at all.
+        """
+        wanted = None if doc_ids is None else frozenset(doc_ids)
+        for doc_id, generate in self._GENERATORS:
+            if wanted is None or doc_id in wanted:
+                yield generate(self)
+
+    def generate_all_documents(self) -> List[RAGPacket]:
         """
         Generate all six policy documents in order.
 
         Returns:
-            List[Dict]: Six packaged documents ready for RAG ingestion.
+            List[RAGPacket]: Six packaged documents ready for RAG ingestion.
                         Order: POL-CCH-001, FRM-001, TSU-POL-002,
                                FAQ-001, FRM-002, PRS-001
         """
-        return [
-            self.generate_complaint_handling_policy(),   # Dispatcher Agent
-            self.generate_fraud_detection_guidelines(),  # Sentinel Agent (base)
-            self.generate_transaction_policies(),        # All agents
-            self.generate_faq_document(),                # Customer-facing
-            self.generate_merchant_risk_profiles(),      # Sentinel Agent (merchant)
-            self.generate_product_recommendation_policy()  # Trajectory Agent
-        ]
+        return list(self.iter_documents())
+
+    def regenerate(self, display_date: Optional[str] = None
+                   ) -> Dict[str, Tuple[int, ...]]:
+        """
+        Re-issue every document for a new display date (default: the
+        current month) when nothing else has changed.
+
+        Only the paragraphs that quote the date are re-rendered; the rest
+        are reused from this generator's previous packets. Subsequent
+        generate_* calls return the re-dated packets.
+
+        Returns:
+            Dict[str, Tuple[int, ...]]: For each document ID, the changed
+            paragraph indices within that document's sections. These are
+            not ingestion chunk IDs; re-ingesting the documents is enough,
+            since chunks whose content_hash is unchanged are skipped.
+        """
+        previous = self.generate_all_documents()
+        display_date = display_date or _current_display_date()
+        if display_date == self.display_date:
+            return {doc.document_id: () for doc in previous}
+
+        self.display_date = display_date
+        dirty = {}
+        for doc in previous:
+            templates = _document_templates(doc.document_id)
+            dated = _dated_paragraphs(doc.document_id)
+            sections = list(doc.sections)
+            for index in dated:
+                sections[index] = next(_render(
+                    (templates[index],),
+                    bank_name=self.bank_name,
+                    display_date=display_date,
+                )).encode("utf-8")
+            self._sections[self._cache_key(doc.document_id)] = tuple(sections)
+            dirty[doc.document_id] = dated
+        return dirty
 
     def save_all_policies(self, output_dir: Path):
         """
@@ -2826,6 +2168,13 @@ END OF DOCUMENT PRS-001
             └── faqs/
                 └── FAQ-001.txt       (Customer FAQ)
 
+        Each .txt file is written from the packet's section fragments and
+        accompanied by a <doc_id>.chunks.jsonl file with the document
+        pre-split at its section headers, one
+        {"id", "section_header", "text"} object per line, so retrieval can
+        warm its cache without re-chunking the raw text. Documents with a
+        structured payload (FRM-002, PRS-001) also get <doc_id>.json.
+
         Args:
             output_dir (Path): Base directory for saved files.
         """
@@ -2836,33 +2185,56 @@ END OF DOCUMENT PRS-001
         policies_dir.mkdir(parents=True, exist_ok=True)
         faqs_dir.mkdir(parents=True, exist_ok=True)
 
-        documents = self.generate_all_documents()
-
-        print(f"\nGenerating {len(documents)} policy documents...")
+        print(f"\nGenerating {len(self._GENERATORS)} policy documents...")
         print("=" * 60)
 
-        for doc in documents:
-            if doc['category'] == 'knowledge_base':
+        # Documents are built one at a time and tallied as they are saved.
+        policy_count = faq_count = total_bytes = 0
+        for doc in self.iter_documents():
+            if doc.category == 'knowledge_base':
                 target_folder = faqs_dir
+                faq_count += 1
             else:
                 target_folder = policies_dir
+                policy_count += 1
 
-            filename = f"{doc['document_id']}.txt"
+            filename = f"{doc.document_id}.txt"
             filepath = target_folder / filename
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(doc['content'])
-
-            size_kb = len(doc['content'].encode('utf-8')) / 1024
-            print(f"  ✓ {doc['document_id']}.txt  "
-                  f"({doc['title'][:40]})  [{size_kb:.1f} KB]")
+            # The fragments are already UTF-8, so the byte size written is
+            # known without encoding the document again.
+            with open(filepath, 'wb') as f:
+                f.writelines(doc.sections)
+            size_bytes = sum(map(len, doc.sections))
+            total_bytes += size_bytes
+
+            # Fragments start on header blocks, so each one is split on its
+            # own rather than rescanning the joined document.
+            chunks_path = target_folder / f"{doc.document_id}.chunks.jsonl"
+            with open(chunks_path, 'w', encoding='utf-8') as f:
+                sections = (chunk for fragment in doc.sections
+                            for chunk in _split_sections(fragment.decode("utf-8")))
+                for idx, section in enumerate(sections):
+                    f.write(json.dumps({
+                        "id": f"{doc.document_id}_sec{idx}",
+                        "section_header": section["section_header"],
+                        "text": section["text"],
+                    }, ensure_ascii=False) + "\n")
+
+            if doc.structured is not None:
+                json_path = target_folder / f"{doc.document_id}.json"
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(doc.structured, f, ensure_ascii=False, indent=2)
+
+            size_kb = size_bytes / 1024
+            print(f"  ✓ {doc.document_id}.txt  "
+                  f"({doc.title[:40]})  [{size_kb:.1f} KB]")
 
         print("=" * 60)
-        policy_count = len([d for d in documents if d['category'] != 'knowledge_base'])
-        faq_count = len([d for d in documents if d['category'] == 'knowledge_base'])
         print(f"\n  Policies saved : {policy_count} files → {policies_dir}")
         print(f"  FAQs saved     : {faq_count} file  → {faqs_dir}")
-        print(f"\n✅ All {len(documents)} documents ready for RAG ingestion.")
+        print(f"  Total size     : {total_bytes / 1024:.1f} KB")
+        print(f"\n✅ All {policy_count + faq_count} documents ready for RAG ingestion.")
         print("\nNext step:")
         print("  cd ../rag_system && python ingest_documents.py\n")
 
@@ -2894,9 +2266,15 @@ if __name__ == "__main__":
 
     # Verify dataset files exist before proceeding
     print("\nVerifying dataset paths...")
+    # One read of DATASET_DIR answers all four checks (no stat per file).
+    try:
+        with os.scandir(DATASET_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
     all_found = True
     for csv_path in [CUSTOMERS_CSV, ACCOUNTS_CSV, TRANSACTIONS_CSV, COMPLAINTS_CSV]:
-        exists = csv_path.exists()
+        exists = csv_path.name in present
         status = "✓" if exists else "✗ MISSING"
         print(f"  {status}  {csv_path}")
         if not exists:
@@ -22,10 +22,11 @@ Author: AI Engineer 2 (Security & Knowledge Specialist)
 Date: February 2026
 """
 
+import os
 import chromadb
 from chromadb.utils import embedding_functions
 from pathlib import Path
-from typing import Optional, Dict         # ← added Dict
+from typing import Any, Optional, Dict, Tuple    # ← added Dict, Tuple
 import logging
 
 # Configure logging
@@ -128,9 +129,28 @@ class ChromaDBConfig:
     # - "all-mpnet-base-v2" (higher quality, slower)
     # - "paraphrase-multilingual-MiniLM-L12-v2" (multilingual support)
     
+    # Inference backend for the embedding model:
+    # - "torch" (default): FP32 PyTorch weights
+    # - "onnx": the model's INT8-quantised ONNX export below, roughly 2-4x
+    #   faster on CPU for a small drop in retrieval quality. Needs
+    #   sentence-transformers >= 3.2 with the onnx extra. Vectors differ
+    #   slightly between backends, so re-ingest after switching.
+    EMBEDDING_BACKEND = os.environ.get("SENTINEL_EMBEDDING_BACKEND", "torch")
+    ONNX_MODEL_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+    
+    # Hub cache the embedding model is downloaded to and loaded from.
+    # None means the standard Hugging Face cache (honours HF_HOME and
+    # HF_HUB_CACHE), so an existing download is reused.
+    MODEL_CACHE_DIR: Optional[Path] = None
+    
     # Distance metrics for similarity search
     DISTANCE_METRIC = "cosine"  # Options: cosine, l2, ip (inner product)
     
+    # Embedding functions already loaded in this process, keyed by model
+    # name and backend. Loading a sentence-transformers model costs seconds and ~100 MB,
+    # so every config instance and collection shares one per model.
+    _embedding_functions: Dict[Tuple[str, str], Any] = {}
+    
     def __init__(self, persist_directory: Optional[Path] = None):
         """
         Initialize ChromaDB configuration.
@@ -146,21 +166,71 @@ class ChromaDBConfig:
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"ChromaDB persistence directory: {self.persist_directory}")
+        logger.info("ChromaDB persistence directory: %s", self.persist_directory)
+    
+    def _model_cache_dir(self) -> Optional[Path]:
+        """Hub cache directory the embedding model is stored in, if known."""
+        if self.MODEL_CACHE_DIR is not None:
+            return Path(self.MODEL_CACHE_DIR)
+        try:
+            from huggingface_hub.constants import HF_HUB_CACHE
+        except ImportError:
+            return None
+        return Path(HF_HUB_CACHE)
+    
+    def _model_is_cached(self, cache_dir: Optional[Path]) -> bool:
+        """
+        True when cache_dir holds a complete snapshot of the embedding
+        model: its config.json plus the weights for the selected backend.
+        The hub only links a file into snapshots/ once it is fully
+        downloaded, so an interrupted download does not count.
+        """
+        if cache_dir is None:
+            return False
+        repo = cache_dir / f"models--sentence-transformers--{self.EMBEDDING_MODEL}"
+        if self.EMBEDDING_BACKEND == "onnx":
+            weights = (self.ONNX_MODEL_FILE,)
+        else:
+            weights = ("model.safetensors", "pytorch_model.bin")
+        return any(
+            (snapshot / "config.json").is_file()
+            and any((snapshot / name).is_file() for name in weights)
+            for snapshot in repo.glob("snapshots/*")
+        )
     
     def get_embedding_function(self):
         """
         Get configured embedding function for text-to-vector conversion.
         
+        The model is loaded on the first call only; later calls (from any
+        ChromaDBConfig) return the same cached instance. Once a complete
+        copy is in the model cache it is loaded with local_files_only, so
+        warm starts make no hub requests.
+        
         Returns:
             Embedding function compatible with ChromaDB
         """
-        # Using sentence-transformers for high-quality embeddings
-        embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=self.EMBEDDING_MODEL
-        )
-        
-        logger.info(f"Loaded embedding model: {self.EMBEDDING_MODEL}")
+        key = (self.EMBEDDING_MODEL, self.EMBEDDING_BACKEND)
+        embedding_function = self._embedding_functions.get(key)
+        if embedding_function is None:
+            # Extra keyword arguments are passed through to SentenceTransformer
+            model_kwargs = {}
+            cache_dir = self._model_cache_dir()
+            if cache_dir is not None:
+                model_kwargs["cache_folder"] = str(cache_dir)
+            if self._model_is_cached(cache_dir):
+                model_kwargs["local_files_only"] = True
+            if self.EMBEDDING_BACKEND == "onnx":
+                model_kwargs["backend"] = "onnx"
+                model_kwargs["model_kwargs"] = {"file_name": self.ONNX_MODEL_FILE}
+            # Using sentence-transformers for high-quality embeddings
+            embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+                model_name=self.EMBEDDING_MODEL,
+                **model_kwargs,
+            )
+            self._embedding_functions[key] = embedding_function
+            logger.info("Loaded embedding model: %s (%s backend)",
+                        self.EMBEDDING_MODEL, self.EMBEDDING_BACKEND)
         return embedding_function
     
     def create_client(self) -> chromadb.Client:
@@ -178,7 +248,7 @@ class ChromaDBConfig:
             path=str(self.persist_directory)
         )
 
-        logger.info(f"ChromaDB persistent client created at: {self.persist_directory}")
+        logger.info("ChromaDB persistent client created at: %s", self.persist_directory)
 
         return client
 
@@ -209,22 +279,14 @@ class ChromaDBConfig:
                 "document_count":  str(len(DOCUMENT_REGISTRY)),  # ← NEW
             }
         
-        try:
-            # Try to get existing collection
-            collection = client.get_collection(
-                name=collection_name,
-                embedding_function=embedding_function
-            )
-            logger.info(f"Retrieved existing collection: {collection_name}")
-            
-        except Exception:
-            # Collection doesn't exist, create it
-            collection = client.create_collection(
-                name=collection_name,
-                embedding_function=embedding_function,
-                metadata=metadata
-            )
-            logger.info(f"Created new collection: {collection_name}")
+        # One call either opens the existing collection or creates it with
+        # the metadata above; no failed get_collection round-trip first.
+        collection = client.get_or_create_collection(
+            name=collection_name,
+            embedding_function=embedding_function,
+            metadata=metadata
+        )
+        logger.info("Collection ready: %s", collection_name)
         
         return collection
     
@@ -238,13 +300,13 @@ class ChromaDBConfig:
         """
         try:
             client.delete_collection(name=collection_name)
-            logger.info(f"Deleted collection: {collection_name}")
+            logger.info("Deleted collection: %s", collection_name)
         except Exception as e:
-            logger.warning(f"Collection {collection_name} didn't exist: {e}")
+            logger.warning("Collection %s didn't exist: %s", collection_name, e)
         
         # Recreate the collection
         self.get_or_create_collection(client, collection_name)
-        logger.info(f"Reset collection: {collection_name}")
+        logger.info("Reset collection: %s", collection_name)
 
     def reset_all_collections(self, client: chromadb.Client):  # ← NEW
         """
@@ -253,13 +315,25 @@ class ChromaDBConfig:
         Call this before a full re-ingestion run to prevent duplicate chunks
         accumulating across multiple ingest_documents.py executions.
 
+        Lists the client's collections once and deletes only those of the
+        three that exist, instead of probing each name with a delete that
+        may fail.
+
         Args:
             client: ChromaDB client instance
         """
-        for name in [self.COLLECTION_POLICIES,
-                     self.COLLECTION_FAQS,
-                     self.COLLECTION_ALL]:
-            self.reset_collection(client, name)
+        targets = (self.COLLECTION_POLICIES,
+                   self.COLLECTION_FAQS,
+                   self.COLLECTION_ALL)
+        # list_collections() yields Collection objects or, on some chromadb
+        # releases, bare names.
+        existing = {getattr(c, "name", c) for c in client.list_collections()}
+        for name in targets:
+            if name in existing:
+                client.delete_collection(name=name)
+                logger.info("Deleted collection: %s", name)
+        for name in targets:
+            self.get_or_create_collection(client, name)
         logger.info("All collections reset and ready for fresh ingestion")
 
 
@@ -296,9 +370,10 @@ def get_collection_stats(collection) -> dict:
     try:
         count = collection.count()
         
-        # Get sample metadata if collection not empty
+        # Get sample metadata if collection not empty. Only the metadata is
+        # requested: peek() would also decode the stored embedding and text.
         if count > 0:
-            sample = collection.peek(limit=1)
+            sample = collection.get(limit=1, include=["metadatas"])
             sample_metadata = sample['metadatas'][0] if sample['metadatas'] else {}
         else:
             sample_metadata = {}
@@ -313,7 +388,7 @@ def get_collection_stats(collection) -> dict:
         return stats
         
     except Exception as e:
-        logger.error(f"Error getting collection stats: {e}")
+        logger.error("Error getting collection stats: %s", e)
         return {"error": str(e)}
 
 
@@ -40,6 +40,8 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
 import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 
@@ -65,6 +67,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Section separators in policy documents: a line of 50+ '=' or '-'.
+_SECTION_SPLIT_RE = re.compile(r'\n={50,}\n|\n-{50,}\n')
+# Sentence boundaries used when a section is too large for one chunk.
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+# Candidate key terms: alphabetic words of four or more letters.
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+# Common words never reported as key terms (simple stopwords).
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'this', 'that', 'these', 'those', 'will', 'shall', 'should', 'must',
+})
+# Whitespace normalisation in preprocess_document.
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
 
 class DocumentChunker:
     """
@@ -99,7 +117,7 @@ class DocumentChunker:
         chunks = []
         
         # Split on section separators (====== or ------)
-        sections = re.split(r'\n={50,}\n|\n-{50,}\n', text)
+        sections = _SECTION_SPLIT_RE.split(text)
         
         for idx, section in enumerate(sections):
             section = section.strip()
@@ -132,7 +150,7 @@ class DocumentChunker:
                     'chunk_index': len(chunks)
                 })
         
-        logger.info(f"Created {len(chunks)} section-based chunks from {document_id}")
+        logger.info("Created %d section-based chunks from %s", len(chunks), document_id)
         return chunks
     
     @staticmethod
@@ -148,7 +166,7 @@ class DocumentChunker:
             List of chunk strings
         """
         chunks = []
-        sentences = re.split(r'(?<=[.!?])\s+', section)
+        sentences = _SENTENCE_SPLIT_RE.split(section)
         
         current_chunk = []
         current_size = 0
@@ -188,23 +206,12 @@ class DocumentChunker:
         Returns:
             List of key terms
         """
-        # Remove common words (simple stopwords)
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-                    'this', 'that', 'these', 'those', 'will', 'shall', 'should', 'must'}
-        
-        # Extract words
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-        
-        # Filter stopwords and count frequency
-        word_freq = {}
-        for word in words:
-            if word not in stopwords:
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Get top N most frequent
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        key_terms = [word for word, _ in sorted_words[:top_n]]
+        # Count non-stopword terms; most_common keeps first-seen order on ties
+        word_freq = Counter(
+            word for word in _WORD_RE.findall(text.lower())
+            if word not in _STOPWORDS
+        )
+        key_terms = [word for word, _ in word_freq.most_common(top_n)]
         
         return key_terms
 
@@ -236,6 +243,27 @@ class DocumentIngester:
         self.client = client
         self.config = config
         self.chunker = DocumentChunker()
+        self._embedding_function = None
+        # content_hash → vector for chunks embedded in the current ingest
+        # run; cleared once the run has written all three collections.
+        self._embeddings_by_hash: Dict[str, List] = {}
+
+    def _embed(self, texts: List[str]) -> List:
+        """Embed texts in one batched call to the configured model."""
+        if self._embedding_function is None:
+            self._embedding_function = self.config.get_embedding_function()
+        return self._embedding_function(texts)
+
+    def _embed_chunks(self, chunks: List[Dict]) -> None:
+        """Embed, in one call, every chunk whose content_hash has no vector yet."""
+        known   = self._embeddings_by_hash
+        missing = {}
+        for chunk in chunks:
+            content_hash = chunk['metadata']['content_hash']
+            if content_hash not in known:
+                missing.setdefault(content_hash, chunk['document'])
+        if missing:
+            known.update(zip(missing, self._embed(list(missing.values()))))
 
     # =========================================================================
     # NEW: IN-MEMORY INGESTION (preferred — no disk roundtrip)
@@ -284,23 +312,23 @@ class DocumentIngester:
         faq_chunks    = []
 
         for doc in documents:
-            doc_id   = doc['document_id']
+            doc_id   = doc.document_id
             registry = DOCUMENT_REGISTRY.get(doc_id, {})
 
             # doc_type_flag: prefer registry, fall back to category field
             doc_type_flag = registry.get('doc_type_flag', 'policy')
-            if doc.get('category') == 'knowledge_base':
+            if doc.category == 'knowledge_base':
                 doc_type_flag = 'knowledge_base'
 
             chunks = self._make_enriched_chunks(
-                content       = doc['content'],
+                content       = doc.content,
                 document_id   = doc_id,
-                title         = doc.get('title',    registry.get('title',    doc_id)),
-                category      = doc.get('category', registry.get('category', 'policy')),
-                version       = doc.get('version',  registry.get('version',  '1.0')),
+                title         = doc.title,
+                category      = doc.category,
+                version       = doc.version,
                 agent_target  = registry.get('agent_target', 'All'),
                 doc_type_flag = doc_type_flag,
-                source_meta   = doc.get('metadata', {}),
+                source_meta   = doc.metadata._asdict(),
             )
 
             all_chunks.extend(chunks)
@@ -311,11 +339,16 @@ class DocumentIngester:
 
             print(f"  ✓ {doc_id:<14} → {len(chunks):>3} chunks  "
                   f"agent={registry.get('agent_target','All'):<12}  "
-                  f"category={doc.get('category','policy')}")
+                  f"category={doc.category}")
 
         print(f"\n  Total: {len(all_chunks)} chunks  "
               f"({len(policy_chunks)} policy + {len(faq_chunks)} FAQ)\n")
 
+        # Freshly reset collections need every vector, so embed them all in
+        # one model call instead of one per ingest batch.
+        if reset_first:
+            self._embed_chunks(all_chunks)
+
         # Ingest
         print("Step 3: Ingesting into ChromaDB...")
 
@@ -329,6 +362,8 @@ class DocumentIngester:
 
         print(f"\n  → {self.config.COLLECTION_ALL}  ({len(all_chunks)} chunks, combined)")
         self.ingest_to_collection(all_chunks, self.config.COLLECTION_ALL)
+        # All three collections are written; drop this run's vectors.
+        self._embeddings_by_hash.clear()
 
         self._print_completion_block()
 
@@ -337,7 +372,7 @@ class DocumentIngester:
             'total_chunks':       len(all_chunks),
             'policy_chunks':      len(policy_chunks),
             'faq_chunks':         len(faq_chunks),
-            'documents_ingested': [d['document_id'] for d in documents],
+            'documents_ingested': [d.document_id for d in documents],
             'timestamp':          datetime.now().isoformat(),
         }
 
@@ -367,7 +402,7 @@ class DocumentIngester:
           section_title      : section header this chunk belongs to
           chunk_index        : ordinal position within document
           char_count         : character length of chunk content
-          content_hash       : MD5 for deduplication detection
+          content_hash       : BLAKE2b-128 for deduplication detection
           key_terms          : comma-separated top-5 terms
           ingestion_timestamp: ISO datetime of ingest run
           dataset_dir        : DATASET_DIR from policy_generator (audit trail)
@@ -380,7 +415,11 @@ class DocumentIngester:
         ingest_ts  = datetime.now().isoformat()
 
         for chunk in raw_chunks:
-            content_hash = hashlib.md5(chunk['content'].encode()).hexdigest()
+            # Same 128-bit BLAKE2b digest the generator stamps on whole
+            # documents; faster than MD5 for the same digest length.
+            content_hash = hashlib.blake2b(
+                chunk['content'].encode('utf-8'), digest_size=16,
+            ).hexdigest()
             key_terms    = self.chunker.extract_key_terms(chunk['content'])
 
             enriched.append({
@@ -428,14 +467,23 @@ class DocumentIngester:
         directory = Path(directory)
         
         if not directory.exists():
-            logger.error(f"Directory not found: {directory}")
+            logger.error("Directory not found: %s", directory)
             return documents
         
-        # Load all .txt files
-        for txt_file in sorted(directory.glob("**/*.txt")):
+        # Load all .txt files. Reads are I/O-bound and release the GIL, so
+        # they run on a small thread pool; results are consumed in sorted
+        # order and a failed read surfaces from .result() below. Each file
+        # is read whole and decoded in one call rather than through a text
+        # wrapper.
+        txt_files = sorted(directory.rglob("*.txt"))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            reads = [pool.submit(txt_file.read_bytes) for txt_file in txt_files]
+
+        for txt_file, read in zip(txt_files, reads):
             try:
-                with open(txt_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                # Same universal-newline result text mode would give
+                content = read.result().decode('utf-8') \
+                    .replace('\r\n', '\n').replace('\r', '\n')
                 
                 # Extract document ID from filename
                 doc_id   = txt_file.stem  # Filename without extension
@@ -462,13 +510,13 @@ class DocumentIngester:
                     'filename':      txt_file.name,
                 })
                 
-                logger.info(f"Loaded: {txt_file.name}  "
-                            f"category={category}  agent={agent_target}")
+                logger.info("Loaded: %s  category=%s  agent=%s",
+                            txt_file.name, category, agent_target)
                 
             except Exception as e:
-                logger.error(f"Error loading {txt_file}: {e}")
+                logger.error("Error loading %s: %s", txt_file, e)
         
-        logger.info(f"Loaded {len(documents)} documents from {directory}")
+        logger.info("Loaded %d documents from %s", len(documents), directory)
         return documents
     
     def preprocess_document(self, document: Dict) -> Dict:
@@ -484,8 +532,8 @@ class DocumentIngester:
         content = document['content']
         
         # Remove excessive whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        content = re.sub(r' {2,}', ' ', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
+        content = _MULTI_SPACE_RE.sub(' ', content)
         
         # Standardize line endings
         content = content.replace('\r\n', '\n')
@@ -528,6 +576,16 @@ class DocumentIngester:
                             batch_size: int = 100):
         """
         Insert chunks into ChromaDB collection in batches.
+
+        Chunks whose id is already stored with the same content_hash are
+        skipped, so unchanged text is never re-embedded when collections
+        are kept between runs (reset_first=False). New or changed chunks
+        are upserted, replacing any stale copy.
+
+        Each pending batch is embedded with one model call and the vectors
+        are remembered by content_hash, so a chunk ingested into several
+        collections (every chunk also goes into the combined one), or text
+        repeated across chunks, is embedded only once.
         
         Args:
             chunks: List of enriched chunks
@@ -540,27 +598,48 @@ class DocumentIngester:
             collection_name
         )
         
-        logger.info(f"Ingesting {len(chunks)} chunks into {collection_name}...")
+        logger.info("Ingesting %d chunks into %s...", len(chunks), collection_name)
         
         # Process in batches
         for i in range(0, len(chunks), batch_size):
             batch = chunks[i:i + batch_size]
             
+            # The persistent store already holds embeddings for unchanged
+            # chunks; only send the ones whose content hash differs.
+            stored = collection.get(ids=[chunk['id'] for chunk in batch],
+                                    include=['metadatas'])
+            stored_hash = {
+                sid: (meta or {}).get('content_hash')
+                for sid, meta in zip(stored['ids'], stored['metadatas'])
+            }
+            pending = [chunk for chunk in batch
+                       if stored_hash.get(chunk['id']) != chunk['metadata']['content_hash']]
+            if not pending:
+                logger.info("  Batch %d: %d chunks unchanged, skipped",
+                            i // batch_size + 1, len(batch))
+                continue
+
+            self._embed_chunks(pending)
+            known = self._embeddings_by_hash
+
             # Prepare batch data
-            ids       = [chunk['id']       for chunk in batch]
-            documents = [chunk['document'] for chunk in batch]
-            metadatas = [chunk['metadata'] for chunk in batch]
+            ids        = [chunk['id']        for chunk in pending]
+            documents  = [chunk['document']  for chunk in pending]
+            metadatas  = [chunk['metadata']  for chunk in pending]
+            embeddings = [known[chunk['metadata']['content_hash']]
+                          for chunk in pending]
             
-            # Add to collection (embeddings generated automatically)
-            collection.add(
+            collection.upsert(
                 ids=ids,
                 documents=documents,
-                metadatas=metadatas
+                metadatas=metadatas,
+                embeddings=embeddings
             )
             
-            logger.info(f"  Batch {i//batch_size + 1}: Ingested {len(batch)} chunks")
+            logger.info("  Batch %d: Ingested %d chunks (%d unchanged)",
+                        i // batch_size + 1, len(pending), len(batch) - len(pending))
         
-        logger.info(f" Successfully ingested all chunks to {collection_name}")
+        logger.info(" Successfully ingested all chunks to %s", collection_name)
     
     def ingest_knowledge_base(self,
                                knowledge_base_dir: Path,
@@ -613,6 +692,11 @@ class DocumentIngester:
             print(f"  ✓ {doc['document_id']:<14} → {len(chunks):>3} chunks  "
                   f"agent={doc.get('agent_target','All'):<12}")
         print(f"\n✓ Created {len(all_chunks)} chunks total\n")
+
+        # Freshly reset collections need every vector, so embed them all in
+        # one model call instead of one per ingest batch.
+        if reset_first:
+            self._embed_chunks(all_chunks)
         
         # ← CHANGED: route by doc_type_flag (was hardcoded 'policy'/'faq' string)
         policy_chunks = [c for c in all_chunks
@@ -634,6 +718,8 @@ class DocumentIngester:
         # Also ingest everything into combined collection
         print(f"\n  Ingesting all {len(all_chunks)} chunks into combined collection...")
         self.ingest_to_collection(all_chunks, self.config.COLLECTION_ALL)
+        # All three collections are written; drop this run's vectors.
+        self._embeddings_by_hash.clear()
 
         self._print_completion_block()
 
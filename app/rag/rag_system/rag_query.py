@@ -88,6 +88,19 @@ import re
 # ChromaDB configuration
 from .chromadb_config import initialize_chromadb, ChromaDBConfig
 
+# =============================================================================
+# IMPORT FALLBACKS
+# =============================================================================
+# Used in place of the generator's helpers when its import below fails
+
+def _classify_risk_by_thresholds(score) -> str:
+    """Fallback classify_risk: walk RISK_THRESHOLDS, 'LOW' when no band matches."""
+    for level, (low, high) in RISK_THRESHOLDS.items():
+        if low <= score <= high:
+            return level
+    return 'LOW'
+
+
 # =============================================================================
 # IMPORT SHARED CONSTANTS FROM POLICY GENERATOR
 # =============================================================================
@@ -99,6 +112,7 @@ try:
         EXPECTED_SLA,            # POL-CCH-001: SLA hours per department
         DEPT_NAMES,              # POL-CCH-001: Full department names
         RISK_THRESHOLDS,         # FRM-001: Risk score thresholds
+        classify_risk,           # FRM-001: Vectorized score → risk level
         PRODUCT_THRESHOLDS,      # PRS-001: Product eligibility thresholds
         CAR_LOAN_SIGNAL_WEIGHTS, # PRS-001: Car loan signal components
         COMPLAINTS_CSV,          # Dataset path for validation
@@ -111,6 +125,7 @@ except ImportError:
     EXPECTED_SLA = {"TSU": 48, "COC": 48, "FRM": 24, "DCS": 72, "AOD": 72, "CLS": 96}
     DEPT_NAMES = {}
     RISK_THRESHOLDS = {}
+    classify_risk = _classify_risk_by_thresholds
     PRODUCT_THRESHOLDS = {}
     CAR_LOAN_SIGNAL_WEIGHTS = {}
     COMPLAINTS_CSV = Path("complaints.csv")
@@ -125,6 +140,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fraud / security trigger words that force Critical priority
+# (POL-CCH-001 §3). A single compiled alternation scans the complaint once,
+# so the common non-fraud case costs one failed search.
+_CRITICAL_KEYWORDS_RE = re.compile(r"fraud|unauthorized|hacked|stolen|scam")
+# High / Low tiers get the same treatment: one fused alternation per tier
+# instead of a separate substring scan for every keyword.
+_HIGH_KEYWORDS_RE = re.compile(
+    r"declined|swallowed|retention|blocked|not received|failed transfer"
+)
+_LOW_KEYWORDS_RE = re.compile(r"statement|balance|inquiry")
+
 
 # =============================================================================
 # MAIN RAG QUERY ENGINE CLASS
@@ -762,21 +788,15 @@ class RAGQueryEngine:
             return 'Critical'
         
         # Critical keywords
-        if any(w in complaint_lower for w in
-               ['fraud', 'unauthorized', 'hacked', 'stolen', 'scam']):
+        if _CRITICAL_KEYWORDS_RE.search(complaint_lower):
             return 'Critical'
         
-        # High priority keywords
-        if any(w in complaint_lower for w in
-               ['declined', 'swallowed', 'retention', 'blocked']):
-            return 'High'
-        if any(p in complaint_lower for p in
-               ['not received', 'failed transfer']):
+        # High priority keywords and phrases
+        if _HIGH_KEYWORDS_RE.search(complaint_lower):
             return 'High'
         
         # Low priority keywords
-        if any(w in complaint_lower for w in
-               ['statement', 'balance', 'inquiry']):
+        if _LOW_KEYWORDS_RE.search(complaint_lower):
             return 'Low'
         
         return 'Medium'
@@ -961,11 +981,7 @@ class RAGQueryEngine:
         # ------------------------------------------------------------------
         # LOW: 0-30, MEDIUM: 31-60, HIGH: 61-85, CRITICAL: 86-100
         
-        risk_level = 'LOW'
-        for level, (low, high) in RISK_THRESHOLDS.items():
-            if low <= total_risk <= high:
-                risk_level = level
-                break
+        risk_level = str(classify_risk(total_risk))
         
         # ------------------------------------------------------------------
         # STEP 6: Map to action and flags (FRM-001 §2.2)
@@ -1127,11 +1143,11 @@ class RAGQueryEngine:
         age = int(customer_data.get('age', 0))
         
         # Read thresholds from shared constants
-        inv_min = PRODUCT_THRESHOLDS['Investment Plan']['monthly_inflow_min']
-        cl_score = PRODUCT_THRESHOLDS['Car Loan']['car_loan_signal_score_min']
-        pl_min = PRODUCT_THRESHOLDS['Personal Loan']['monthly_inflow_min']
-        uber_min = CAR_LOAN_SIGNAL_WEIGHTS['uber_tracker_min']
-        inflow_min = CAR_LOAN_SIGNAL_WEIGHTS['monthly_inflow_min']
+        inv_min = PRODUCT_THRESHOLDS['Investment Plan'].monthly_inflow_min
+        cl_score = PRODUCT_THRESHOLDS['Car Loan'].car_loan_signal_score_min
+        pl_min = PRODUCT_THRESHOLDS['Personal Loan'].monthly_inflow_min
+        uber_min = CAR_LOAN_SIGNAL_WEIGHTS.uber_tracker_min
+        inflow_min = CAR_LOAN_SIGNAL_WEIGHTS.monthly_inflow_min
         
         met = []
         unmet = []